@@ -1,20 +1,22 @@
 """
 DSD 소스 데이터 자동 조회 및 생성 API 라우터
 """
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from typing import Annotated, List, Optional
 import logging
 from app.domain.controller.dsd_auto_fetch_controller import DsdAutoFetchController
 from app.domain.model.dsdgen_schema import DsdSourceListResponse
+from app.domain.model.common_schema import CorpCode
 
 # 라우터 설정
 router = APIRouter(prefix="/dsdgen", tags=["DSD Auto Generator"])
 
 @router.get("/dsd-auto-fetch", response_model=DsdSourceListResponse)
 async def get_or_create_dsd_source(
-    corp_code: str = Query(..., description="기업 코드(필수)"),
+    corp_code: Annotated[CorpCode, Query(description="기업 코드(필수)")],
+    force_refresh: bool = Query(False, description="조회 캐시를 건너뛰고 DB에서 다시 조회할지 여부"),
     controller: DsdAutoFetchController = Depends()
-) -> DsdSourceListResponse:
+) -> Response:
     """
     특정 기업 코드에 해당하는 DSD 소스 데이터를 조회하거나, 없으면 생성합니다.
     
@@ -27,8 +29,12 @@ async def get_or_create_dsd_source(
     
     Args:
         corp_code: 기업 코드(필수)
+        force_refresh: 조회 캐시를 건너뛰고 DB에서 다시 조회할지 여부
     
     Returns:
-        DsdSourceListResponse: 해당 기업의 DSD 소스 데이터 응답
+        Response: 해당 기업의 DSD 소스 데이터 응답
     """
-    return await controller.get_or_create_dsd_source(corp_code) 
\ No newline at end of file
+    result = await controller.get_or_create_dsd_source(corp_code, force_refresh=force_refresh)
+    # FastAPI의 검증 및 jsonable_encoder 왕복 없이 pydantic-core에서 바로 JSON 바이트로 직렬화
+    # (캐시에서 꺼낸 응답은 이전에 직렬화한 바이트를 그대로 사용)
+    return Response(content=result.to_json_bytes(), media_type="application/json") 
\ No newline at end of file
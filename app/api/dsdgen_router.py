@@ -1,20 +1,21 @@
 """
 XBRL 재무제표 데이터 처리 API 라우터
 """
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from typing import Annotated, List, Optional
 import logging
 from app.domain.controller.dsdgen_controller import DsdgenController
 from app.domain.model.dsdgen_schema import DsdSourceListResponse
+from app.domain.model.common_schema import CorpCode
 
 # 라우터 설정
 router = APIRouter(prefix="/dsdgen", tags=["DSD Generator"])
 
 @router.get("/dsd-source", response_model=DsdSourceListResponse, response_model_exclude_none=True)
 async def get_dsd_sources(
-    corp_code: str = Query(..., description="기업 코드(필수)"),
+    corp_code: Annotated[CorpCode, Query(description="기업 코드(필수)")],
     controller: DsdgenController = Depends()
-) -> DsdSourceListResponse:
+) -> Response:
     """
     특정 기업 코드에 해당하는 DSD 소스 데이터를 조회합니다.
     
@@ -22,6 +23,9 @@ async def get_dsd_sources(
         corp_code: 기업 코드(필수)
     
     Returns:
-        DsdSourceListResponse: 해당 기업의 DSD 소스 데이터 응답
+        Response: 해당 기업의 DSD 소스 데이터 응답
     """
-    return await controller.get_dsd_sources(corp_code)
+    result = await controller.get_dsd_sources(corp_code)
+    # FastAPI의 검증 및 jsonable_encoder 왕복 없이 pydantic-core에서 바로 JSON 바이트로 직렬화
+    # (캐시에서 꺼낸 응답은 이전에 직렬화한 바이트를 그대로 사용)
+    return Response(content=result.to_json_bytes(), media_type="application/json")
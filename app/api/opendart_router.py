@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Query
 from app.domain.controller.opendart_controller import DocumentFetchController
-from typing import Dict, Any, Optional
+from typing import Annotated, Dict, Any, Optional, List
+from app.domain.model.common_schema import CorpCode
 
 router = APIRouter(prefix="/opendart", tags=["OPEN DART"])
 controller = DocumentFetchController()
 
 @router.get("/fetch-by-corp")
 async def fetch_by_corp_code(
-    corp_code: str = Query(..., description="기업 고유번호 (8자리)"),
+    corp_code: Annotated[CorpCode, Query(description="기업 고유번호 (8자리)")],
     auto_extract: bool = Query(True, description="다운로드 후 자동으로 압축 해제할지 여부"),
     delete_zip: bool = Query(True, description="압축 해제 후 원본 ZIP 파일을 삭제할지 여부"),
     bgn_de: str = Query("20250301", description="검색 시작일(YYYYMMDD) (기본값: 20250301)"),
@@ -35,10 +36,37 @@ async def fetch_by_corp_code(
         pblntf_ty=pblntf_ty
     )
 
+@router.get("/fetch-many")
+async def fetch_many(
+    corp_codes: Annotated[List[CorpCode], Query(description="기업 고유번호 목록 (8자리, 여러 개 지정 가능)", alias="corp_code")],
+    auto_extract: bool = Query(True, description="다운로드 후 자동으로 압축 해제할지 여부"),
+    delete_zip: bool = Query(True, description="압축 해제 후 원본 ZIP 파일을 삭제할지 여부"),
+    bgn_de: str = Query("20250301", description="검색 시작일(YYYYMMDD) (기본값: 20250301)"),
+    end_de: str = Query("20250415", description="검색 종료일(YYYYMMDD) (기본값: 20250415)"),
+    pblntf_ty: str = Query("A", description="공시유형 (기본값: 'A', 전체)")
+) -> List[Dict[str, Any]]:
+    """
+    여러 기업 고유번호에 대해 OpenDART XBRL 파일을 동시에 다운로드하고 처리합니다.
+    
+    각 기업의 처리 과정은 /fetch-by-corp와 같으며, 결과는 요청한 순서대로 반환됩니다.
+    
+    사용 예시:
+        - /opendart/fetch-many?corp_code=00126380&corp_code=00164779
+    """
+    return await controller.fetch_many(
+        corp_codes=corp_codes,
+        auto_extract=auto_extract,
+        delete_zip=delete_zip,
+        bgn_de=bgn_de,
+        end_de=end_de,
+        pblntf_ty=pblntf_ty
+    )
+
 @router.get("/corp-code")
 async def download_corp_code(
     auto_extract: bool = Query(True, description="다운로드 후 자동으로 압축 해제할지 여부"),
-    delete_zip: bool = Query(True, description="압축 해제 후 원본 ZIP 파일을 삭제할지 여부")
+    delete_zip: bool = Query(True, description="압축 해제 후 원본 ZIP 파일을 삭제할지 여부"),
+    force_refresh: bool = Query(False, description="캐시 유효기간과 관계없이 서버에 변경 여부를 확인할지 여부")
 ) -> Dict[str, Any]:
     """
     OpenDART API를 통해 전체 기업 코드 목록을 다운로드합니다.
@@ -51,8 +79,10 @@ async def download_corp_code(
     
     - auto_extract=True: 압축 해제하여 디렉토리로 저장
     - delete_zip=True: 압축 해제 후 원본 ZIP 삭제
+    - force_refresh=True: 24시간(OPENDART_CORP_CODE_TTL) 캐시를 건너뛰고 서버에 변경 여부 확인
     """
     return await controller.download_corp_code_list(
         auto_extract=auto_extract,
-        delete_zip=delete_zip
+        delete_zip=delete_zip,
+        force_refresh=force_refresh
     )
\ No newline at end of file
@@ -1,14 +1,35 @@
-from fastapi import APIRouter, Query
+from typing import Annotated, List
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import ORJSONResponse
 from app.domain.controller.xbrl_parser_controller import XBRLParserController
-from typing import Dict, Any
+from app.domain.model.common_schema import CorpCode
 
 router = APIRouter(prefix="/xbrl-parser", tags=["XBRL Parser"])
 controller = XBRLParserController()
 
-@router.get("/xbrl-to-dataframe")
+# 일괄 파싱 요청 한 번에 받을 수 있는 최대 기업 수
+BULK_MAX_CORP_CODES = 100
+
+# /xbrl-to-dataframe 응답 본문 형식 (성공 시 스트리밍, 데이터가 없으면 일반 JSON 응답)
+XBRL_TO_DATAFRAME_RESPONSES = {
+    200: {
+        "description": "XBRL 레코드 JSON (성공 시 행 묶음 단위로 스트리밍)",
+        "content": {
+            "application/json": {
+                "example": {
+                    "success": True,
+                    "message": "XBRL 데이터 1개 항목이 추출되었습니다.",
+                    "data": [{"기업코드": "00000000", "항목명": "자산총계", "값": "1,000", "연도": "2024", "단위": "백만원 KRW"}],
+                }
+            }
+        },
+    }
+}
+
+@router.get("/xbrl-to-dataframe", responses=XBRL_TO_DATAFRAME_RESPONSES)
 async def get_xbrl_to_dataframe(
-    corp_code: str = Query(..., description="기업 고유번호 (예: 00000000)")
-) -> Dict[str, Any]:
+    corp_code: Annotated[CorpCode, Query(description="기업 고유번호 (예: 00000000)")]
+) -> Response:
     """
     기업 고유번호를 기반으로 XBRL 데이터를 파싱하여 데이터프레임 형태로 변환한 결과를 JSON 형식으로 반환합니다.
     데이터는 자동으로 데이터베이스에도 저장됩니다.
@@ -17,11 +38,32 @@ async def get_xbrl_to_dataframe(
         corp_code: 기업 고유번호
         
     Returns:
-        Dict[str, Any]: XBRL 데이터가 포함된 응답
+        Response: XBRL 데이터가 포함된 JSON 스트리밍 응답
         
     Raises:
         HTTPException: 데이터 처리 중 오류 발생 시
     """
     # 비동기로 컨트롤러 메서드 호출
     result = await controller.get_xbrl_to_dataframe(corp_code)
-    return result
\ No newline at end of file
+    return result
+
+
+@router.get("/xbrl-records-bulk", response_class=ORJSONResponse)
+async def get_xbrl_records_bulk(
+    corp_codes: Annotated[
+        List[CorpCode],
+        Query(alias="corp_code", min_length=1, max_length=BULK_MAX_CORP_CODES,
+              description="기업 고유번호 목록 (예: ?corp_code=00000000&corp_code=11111111)")
+    ]
+) -> Response:
+    """
+    여러 기업의 XBRL 데이터를 프로세스 풀에서 병렬로 파싱하여 기업별 레코드를 JSON 형식으로 반환합니다.
+    데이터는 자동으로 데이터베이스에도 저장됩니다.
+    
+    Args:
+        corp_codes: 기업 고유번호 목록
+        
+    Returns:
+        Response: 기업 고유번호별 XBRL 레코드가 포함된 JSON 응답
+    """
+    return await controller.get_xbrl_records_bulk(corp_codes)
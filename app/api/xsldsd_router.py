@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Query
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Response
 from typing import Dict, List, Any, Optional
 from app.domain.controller.xsldsd_controller import xsldsd_controller
 
@@ -27,12 +27,13 @@ async def upload_excel(
         - 특정 시트만 변환: /xsldsd/upload?sheet_name=D210000&sheet_name=D310000
         
     Returns:
-        Dict[str, Any]: 파일 정보와 변환된 JSON 데이터
+        Response: 파일 정보와 변환된 데이터를 담은 JSON 응답
     """
     try:
         print(f"Processing upload request for file: {file.filename}, sheet_names: {sheet_names}")
         result = await xsldsd_controller.upload_excel_file(file, sheet_names)
-        return result
+        # 이미 직렬화된 JSON 바이트를 그대로 응답 (response_model 검증/재직렬화 생략)
+        return Response(content=result, media_type="application/json")
     except Exception as e:
         print(f"Error in upload_excel: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to upload Excel file: {str(e)}")
@@ -15,6 +15,24 @@ from app.foundation.db.asyncpg_pool import get_pool
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 서비스 인스턴스 (요청마다 재생성하지 않음)
+_service: Optional[DsdAutoFetchService] = None
+
+async def get_dsd_auto_fetch_service(pool: asyncpg.Pool = Depends(get_pool)) -> DsdAutoFetchService:
+    """
+    커넥션 풀에 묶인 DsdAutoFetchService 싱글턴 인스턴스를 반환합니다.
+    
+    Args:
+        pool: asyncpg 커넥션 풀
+        
+    Returns:
+        DsdAutoFetchService: 재사용되는 서비스 인스턴스
+    """
+    global _service
+    if _service is None or _service.pool is not pool:
+        _service = DsdAutoFetchService(pool=pool)
+    return _service
+
 class DsdAutoFetchController:
     """
     DSD 소스 데이터 자동 조회 및 생성 컨트롤러
@@ -22,21 +40,22 @@ class DsdAutoFetchController:
     이 클래스는 HTTP 요청을 처리하고 서비스 레이어와 통신합니다.
     """
     
-    def __init__(self, pool: asyncpg.Pool = Depends(get_pool)):
+    def __init__(self, service: DsdAutoFetchService = Depends(get_dsd_auto_fetch_service)):
         """
         컨트롤러 초기화
         
         Args:
-            pool: asyncpg 커넥션 풀
+            service: 재사용되는 DSD 소스 자동 조회/생성 서비스
         """
-        self.service = DsdAutoFetchService(pool=pool)
+        self.service = service
     
-    async def get_or_create_dsd_source(self, corp_code: str) -> DsdSourceListResponse:
+    async def get_or_create_dsd_source(self, corp_code: str, force_refresh: bool = False) -> DsdSourceListResponse:
         """
         특정 기업 코드에 해당하는 DSD 소스 데이터를 조회하거나, 없으면 생성합니다.
         
         Args:
             corp_code: 기업 코드
+            force_refresh: True이면 조회 캐시를 건너뜀
             
         Returns:
             DsdSourceListResponse: DSD 소스 데이터 응답
@@ -45,7 +64,7 @@ class DsdAutoFetchController:
             HTTPException: 데이터 조회 또는 생성 중 오류가 발생한 경우
         """
         try:
-            return await self.service.get_or_create_dsd_source(corp_code)
+            return await self.service.get_or_create_dsd_source(corp_code, force_refresh=force_refresh)
         except Exception as e:
             logger.error("DSD 소스 데이터 처리 오류: %s", e)
             raise HTTPException(
@@ -11,6 +11,24 @@ from app.domain.service.dsdgen_service import DsdgenService
 from app.domain.model.dsdgen_schema import DsdSourceListResponse
 from app.foundation.db.asyncpg_pool import get_pool
 
+# 프로세스 전역 서비스 인스턴스 (요청마다 재생성하지 않음)
+_service: Optional[DsdgenService] = None
+
+async def get_dsdgen_service(pool: asyncpg.Pool = Depends(get_pool)) -> DsdgenService:
+    """
+    커넥션 풀에 묶인 DsdgenService 싱글턴 인스턴스를 반환합니다.
+    
+    Args:
+        pool: asyncpg 커넥션 풀
+        
+    Returns:
+        DsdgenService: 재사용되는 서비스 인스턴스
+    """
+    global _service
+    if _service is None or _service.pool is not pool:
+        _service = DsdgenService(pool=pool)
+    return _service
+
 class DsdgenController:
     """
     XBRL 재무제표 데이터 처리 컨트롤러
@@ -18,14 +36,14 @@ class DsdgenController:
     이 클래스는 HTTP 요청을 처리하고 서비스 레이어와 통신합니다.
     """
     
-    def __init__(self, pool: asyncpg.Pool = Depends(get_pool)):
+    def __init__(self, service: DsdgenService = Depends(get_dsdgen_service)):
         """
         컨트롤러 초기화
         
         Args:
-            pool: asyncpg 커넥션 풀
+            service: 재사용되는 DSD 소스 조회 서비스
         """
-        self.service = DsdgenService(pool=pool)
+        self.service = service
     
     async def get_dsd_sources(self, corp_code: str) -> DsdSourceListResponse:
         """
@@ -1,6 +1,18 @@
 from app.domain.service.opendart_service import OpenDartService
 import asyncio
-from typing import Optional, Dict, Any
+import logging
+import os
+from typing import Optional, Dict, Any, List
+
+# OpenDART 동시 요청 수 제한 (HTTP 429 방지, 환경 변수로 조정 가능)
+MAX_CONCURRENT_FETCHES = int(os.getenv("OPENDART_MAX_CONCURRENCY", "5"))
+# 접수번호를 공시 목록 일괄 검색으로 먼저 조회할 최소 기업 수
+# (일괄 검색은 최악의 경우 첫 페이지 + 나머지 29페이지를 5개씩 = 7회 왕복,
+#  기업별 조회는 동시 5개씩 ceil(N/5)회 왕복이므로 N=35부터 일괄 검색이 느려지지 않음)
+BATCH_LOOKUP_MIN_CORPS = 35
+
+# 로거 설정
+logger = logging.getLogger(__name__)
 
 class DocumentFetchController:
     def __init__(self):
@@ -9,7 +21,7 @@ class DocumentFetchController:
     async def fetch_by_corp_code(self, corp_code: str, 
                                       auto_extract: bool = True, delete_zip: bool = True,
                                       bgn_de: str = "20250301", end_de: str = "20250415",
-                                      pblntf_ty: str = "A") -> Dict[str, Any]:
+                                      pblntf_ty: str = "A", rcept_no: Optional[str] = None) -> Dict[str, Any]:
         """
         기업 코드를 기반으로 XBRL 파일을 다운로드하고 처리합니다.
         
@@ -20,23 +32,20 @@ class DocumentFetchController:
             bgn_de: 검색 시작일(YYYYMMDD) (기본값: 20250301)
             end_de: 검색 종료일(YYYYMMDD) (기본값: 20250415)
             pblntf_ty: 공시유형 (기본값: "A", 전체)
+            rcept_no: 이미 알고 있는 접수번호 (지정하면 접수번호 조회를 생략)
             
         Returns:
             Dict[str, Any]: 처리 결과 정보를 포함하는 사전
         """
-        loop = asyncio.get_event_loop()
-        
         try:
-            result = await loop.run_in_executor(
-                None, 
-                lambda: self.service.fetch_by_corp_code(
-                    corp_code=corp_code, 
-                    auto_extract=auto_extract, 
-                    delete_zip=delete_zip,
-                    bgn_de=bgn_de,
-                    end_de=end_de,
-                    pblntf_ty=pblntf_ty
-                )
+            result = await self.service.fetch_by_corp_code(
+                corp_code=corp_code, 
+                auto_extract=auto_extract, 
+                delete_zip=delete_zip,
+                bgn_de=bgn_de,
+                end_de=end_de,
+                pblntf_ty=pblntf_ty,
+                rcept_no=rcept_no
             )
             
             if result is None:
@@ -58,26 +67,82 @@ class DocumentFetchController:
                 "path": None
             }
 
-    async def download_corp_code_list(self, auto_extract: bool = True, delete_zip: bool = True) -> Dict[str, Any]:
+    async def fetch_many(self, corp_codes: List[str],
+                         auto_extract: bool = True, delete_zip: bool = True,
+                         bgn_de: str = "20250301", end_de: str = "20250415",
+                         pblntf_ty: str = "A") -> List[Dict[str, Any]]:
+        """
+        여러 기업 코드의 XBRL 파일을 동시에 다운로드하고 처리합니다.
+        
+        각 기업의 처리 결과는 fetch_by_corp_code와 같은 형식이며, 입력 순서대로 반환됩니다.
+        OpenDART 요청 제한을 고려하여 동시에 MAX_CONCURRENT_FETCHES개까지만 요청하며,
+        중복된 기업 코드는 한 번만 다운로드합니다 (같은 파일 경로에 동시에 쓰지 않도록).
+        기업이 BATCH_LOOKUP_MIN_CORPS개 이상이면 접수번호를 공시 목록 일괄 검색으로 먼저 찾고,
+        일괄 검색에서 찾지 못한 기업만 기업별로 조회합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
+            auto_extract: 다운로드 후 자동으로 압축 해제할지 여부 (기본값: True)
+            delete_zip: 압축 해제 후 원본 ZIP 파일을 삭제할지 여부 (기본값: True)
+            bgn_de: 검색 시작일(YYYYMMDD) (기본값: 20250301)
+            end_de: 검색 종료일(YYYYMMDD) (기본값: 20250415)
+            pblntf_ty: 공시유형 (기본값: "A", 전체)
+            
+        Returns:
+            List[Dict[str, Any]]: 기업별 처리 결과 목록 (corp_code 포함)
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        unique_codes = list(dict.fromkeys(corp_codes))
+        
+        rcept_nos: Dict[str, str] = {}
+        if len(unique_codes) >= BATCH_LOOKUP_MIN_CORPS:
+            try:
+                rcept_nos = await self.service.get_document_infos(
+                    corp_codes=unique_codes,
+                    bgn_de=bgn_de,
+                    end_de=end_de,
+                    pblntf_ty=pblntf_ty
+                )
+            except Exception as e:
+                # 일괄 검색 실패 시 기업별 조회로 진행
+                logger.warning("공시 목록 일괄 검색 실패, 기업별로 조회합니다: %s", e)
+        
+        async def _fetch_one(corp_code: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.fetch_by_corp_code(
+                    corp_code=corp_code,
+                    auto_extract=auto_extract,
+                    delete_zip=delete_zip,
+                    bgn_de=bgn_de,
+                    end_de=end_de,
+                    pblntf_ty=pblntf_ty,
+                    rcept_no=rcept_nos.get(corp_code)
+                )
+            return {"corp_code": corp_code, **result}
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = {corp_code: tg.create_task(_fetch_one(corp_code)) for corp_code in unique_codes}
+        
+        return [tasks[corp_code].result() for corp_code in corp_codes]
+
+    async def download_corp_code_list(self, auto_extract: bool = True, delete_zip: bool = True,
+                                      force_refresh: bool = False) -> Dict[str, Any]:
         """
         OpenDART API를 통해 기업 코드 목록을 다운로드합니다.
         
         Args:
             auto_extract: 다운로드 후 자동으로 압축 해제할지 여부 (기본값: True)
             delete_zip: 압축 해제 후 원본 ZIP 파일을 삭제할지 여부 (기본값: True)
+            force_refresh: True이면 TTL 캐시를 건너뛰고 서버에 변경 여부를 확인 (기본값: False)
             
         Returns:
             Dict[str, Any]: 처리 결과 정보를 포함하는 사전
         """
-        loop = asyncio.get_event_loop()
-        
         try:
-            result = await loop.run_in_executor(
-                None, 
-                lambda: self.service.download_corp_code_list(
-                    auto_extract=auto_extract, 
-                    delete_zip=delete_zip
-                )
+            result = await self.service.download_corp_code_list(
+                auto_extract=auto_extract, 
+                delete_zip=delete_zip,
+                force_refresh=force_refresh
             )
             
             return {
@@ -1,34 +1,80 @@
 from app.domain.service.xbrl_parser_service import XBRLParserService
-from typing import Dict, Any
+from fastapi import Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Iterator, List, Dict, Any
+import orjson
+
+# 스트리밍 응답 시 한 번에 직렬화할 행 수
+STREAM_BATCH_SIZE = 500
+
+def _iter_xbrl_json(records: List[Dict[str, Any]], message: str) -> Iterator[bytes]:
+    """
+    XBRL 레코드 리스트를 JSON 응답 본문으로 나누어 직렬화합니다.
+
+    {"success": true, "message": ..., "data": [...]} 형식을 유지하면서
+    STREAM_BATCH_SIZE 행 단위로 바이트를 생성하여 전체 응답을 메모리에 만들지 않습니다.
+
+    Args:
+        records: XBRL 레코드 리스트
+        message: 응답 메시지
+
+    Yields:
+        bytes: JSON 응답 본문 조각
+    """
+    yield b'{"success":true,"message":' + orjson.dumps(message) + b',"data":['
+
+    for start in range(0, len(records), STREAM_BATCH_SIZE):
+        rows = records[start:start + STREAM_BATCH_SIZE]
+        # 리스트를 직렬화한 뒤 바깥 대괄호를 제거하여 배열 요소만 이어 붙임
+        prefix = b',' if start else b''
+        yield prefix + orjson.dumps(rows)[1:-1]
+
+    yield b']}'
 
 class XBRLParserController:
     def __init__(self):
         self.service = XBRLParserService()
 
-    async def get_xbrl_to_dataframe(self, corp_code: str) -> Dict[str, Any]:
+    async def get_xbrl_to_dataframe(self, corp_code: str) -> Response:
         """
         XBRL 데이터를 파싱하여 데이터프레임 결과를 JSON 형식으로 변환하여 반환합니다.
-        
+
+        파싱과 DB 저장이 모두 끝나 레코드가 메모리에 준비된 뒤에 응답을 시작하며,
+        응답 본문만 행 묶음 단위로 orjson 직렬화되어 스트리밍됩니다
+        (전체 본문을 한 번에 직렬화하지 않으므로 직렬화 시간과 메모리만 줄어듦).
+
         Args:
             corp_code: 기업 고유번호
-            
+
         Returns:
-            Dict[str, Any]: XBRL 데이터
-            
+            Response: XBRL 데이터 (JSON 스트리밍 응답)
+
         Raises:
             Exception: 데이터 파싱 또는, DB 처리 중 오류 발생 시
         """
         # 비동기로 서비스 메서드 호출
-        df = await self.service.get_xbrl_to_dataframe(corp_code)
+        records = await self.service.get_xbrl_records(corp_code)
+
+        if not records:
+            return ORJSONResponse({"success": False, "message": "데이터를 찾을 수 없습니다.", "data": []})
+
+        message = f"XBRL 데이터 {len(records)}개 항목이 추출되었습니다."
+
+        return StreamingResponse(_iter_xbrl_json(records, message), media_type="application/json")
+
+    async def get_xbrl_records_bulk(self, corp_codes: List[str]) -> Response:
+        """
+        여러 기업의 XBRL 데이터를 일괄 파싱하여 기업별 레코드를 JSON 형식으로 반환합니다.
         
-        if df.empty:
-            return {"success": False, "message": "데이터를 찾을 수 없습니다.", "data": []}
+        Args:
+            corp_codes: 기업 고유번호 목록
+            
+        Returns:
+            Response: 기업 고유번호별 XBRL 레코드 (JSON 응답)
+        """
+        records_by_corp = await self.service.get_xbrl_records_bulk(corp_codes)
         
-        # DataFrame을 JSON 형식으로 변환
-        xbrl_data = df.to_dict(orient='records')
+        succeeded = sum(1 for records in records_by_corp.values() if records)
+        message = f"{len(records_by_corp)}개 기업 중 {succeeded}개 기업의 XBRL 데이터가 추출되었습니다."
         
-        return {
-            "success": True,
-            "message": f"XBRL 데이터 {len(xbrl_data)}개 항목이 추출되었습니다.",
-            "data": xbrl_data
-        }
+        return ORJSONResponse({"success": succeeded > 0, "message": message, "data": records_by_corp})
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Optional
+from typing import List, Optional
 from fastapi import UploadFile, HTTPException
 from app.domain.service.xsldsd_service import xsldsd_service
 
@@ -7,7 +7,7 @@ class XslDsdController:
     def __init__(self):
         self.service = xsldsd_service
     
-    async def upload_excel_file(self, file: UploadFile, sheet_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def upload_excel_file(self, file: UploadFile, sheet_names: Optional[List[str]] = None) -> bytes:
         """
         엑셀 파일 업로드 및 JSON 변환 처리
         
@@ -16,7 +16,7 @@ class XslDsdController:
             sheet_names: 변환할 특정 시트 이름 목록
             
         Returns:
-            Dict[str, Any]: 파일 정보와 변환된 JSON 데이터
+            bytes: 파일 정보와 변환된 데이터를 담은 JSON 바이트
         """
         if not file.filename.endswith(('.xlsx', '.xls')):
             raise HTTPException(status_code=400, detail="Excel 파일만 업로드 가능합니다.")
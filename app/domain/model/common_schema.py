@@ -0,0 +1,8 @@
+"""
+여러 라우터에서 공통으로 사용하는 요청 파라미터 타입
+"""
+from typing import Annotated
+from pydantic import StringConstraints
+
+# OpenDART 기업 고유번호 (숫자 8자리)
+CorpCode = Annotated[str, StringConstraints(pattern=r"^\d{8}$", min_length=8, max_length=8)]
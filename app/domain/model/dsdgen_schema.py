@@ -1,23 +1,21 @@
 """
 XBRL 재무제표 데이터를 위한 Pydantic 스키마 모델
 """
-from typing import List
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 class DsdSourceSchema(BaseModel):
     """
     DSD 소스 데이터를 위한 스키마
     """
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+    
     id: int = Field(..., description="고유 아이디")
     corp_code: str = Field(..., description="기업코드")
     source_name: str = Field(..., description="소스명")
     value: int = Field(..., description="값")
     year: int = Field(..., description="연도")
     unit: str = Field(..., description="단위")
-    
-    class Config:
-        """Pydantic 모델 설정"""
-        from_attributes = True
 
 class DsdSourceListResponse(BaseModel):
     """
@@ -25,3 +23,19 @@ class DsdSourceListResponse(BaseModel):
     """
     success: bool = Field(..., description="성공 여부")
     data: List[DsdSourceSchema] = Field(default_factory=list, description="DSD 소스 데이터 목록")
+    
+    # 직렬화한 JSON 바이트 (조회 캐시에 보관된 응답은 재사용될 때마다 다시 직렬화하지 않음)
+    _json: Optional[bytes] = PrivateAttr(default=None)
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        응답을 pydantic-core로 JSON 바이트로 직렬화하고 결과를 인스턴스에 보관합니다.
+        
+        인스턴스를 만든 뒤 필드를 변경하지 않는다는 전제로 동작합니다 (캐시된 응답은 읽기 전용).
+        
+        Returns:
+            bytes: JSON 응답 본문
+        """
+        if self._json is None:
+            self._json = self.__pydantic_serializer__.to_json(self, exclude_none=True)
+        return self._json
@@ -1,7 +1,7 @@
 """
 XBRL 재무제표 데이터 조회를 위한 asyncpg 기반 읽기 레포지토리
 """
-from typing import List, Dict, Any
+from typing import List, Optional
 import asyncpg
 
 class DsdgenReadRepository:
@@ -19,15 +19,20 @@ class DsdgenReadRepository:
         """
         self.pool = pool
     
-    async def get_dsd_sources(self, corp_code: str) -> List[Dict[str, Any]]:
+    async def get_dsd_sources(self, corp_code: str,
+                              conn: Optional[asyncpg.Connection] = None) -> List[asyncpg.Record]:
         """
         특정 기업 코드에 해당하는 DSD 소스 데이터를 조회합니다.
         
+        Record는 컬럼명 기반 매핑 접근을 지원하므로 dict로 복사하지 않고 그대로 반환합니다.
+        
         Args:
             corp_code: 기업 코드
+            conn: 사용할 asyncpg 커넥션 (None이면 커넥션 풀에서 새로 가져옴).
+                  호출자의 트랜잭션 안에서 방금 저장한 데이터를 재조회할 때 사용합니다.
             
         Returns:
-            List[Dict[str, Any]]: DSD 소스 데이터 목록
+            List[asyncpg.Record]: DSD 소스 데이터 목록
         """
         query = """
         SELECT id, corp_code, source_name, value, year, unit
@@ -36,6 +41,8 @@ class DsdgenReadRepository:
         ORDER BY id
         """
         
+        if conn is not None:
+            return await conn.fetch(query, corp_code)
+        
         async with self.pool.acquire() as conn:
-            results = await conn.fetch(query, corp_code)
-            return [dict(row) for row in results]
+            return await conn.fetch(query, corp_code)
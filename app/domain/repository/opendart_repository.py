@@ -1,17 +1,421 @@
 import os
-import requests
+import asyncio
+import httpx
+import aiofiles
+import shutil
 import zipfile
+import struct
 import json
+import orjson
+import logging
+import time
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
+
+from app.foundation.cache import TTLCache
+from app.foundation.executor import get_io_executor, get_process_pool
+
+try:
+    from isal import isal_zlib
+except ImportError:  # python-isal이 없으면 표준 zlib으로 압축 해제
+    isal_zlib = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 API_KEY = os.getenv("DART_API_KEY")
 SAVE_DIR = Path("/app/app/dart_documents")
 EXTRACT_DIR = SAVE_DIR / "extracted"
 
+# ZIP 다운로드 시 스트리밍 청크 크기
+CHUNK_SIZE = 64 * 1024
+# ZIP 멤버 압축 해제 시 읽기/쓰기 버퍼 크기
+EXTRACT_BUFFER_SIZE = 1 << 20
+# ZIP 로컬 파일 헤더의 고정 길이 부분 크기
+ZIP_LOCAL_HEADER_SIZE = 30
+# 멤버별 병렬 압축 해제를 시작할 최소 압축 해제 크기 (작은 ZIP은 프로세스 간 통신 비용이 더 큼)
+PARALLEL_EXTRACT_MIN_SIZE = 8 << 20
+
+# 오류 XML로 간주하고 파싱할 최대 응답 크기 (이보다 크면 잘못 표기된 바이너리로 간주)
+MAX_ERROR_XML_SIZE = 64 * 1024
+
+# 기업코드 파일의 ETag/Last-Modified와 저장 경로를 기록하는 사이드카 파일명
+CORP_CODE_META_FILE = ".corpcode.meta.json"
+
+# 기업코드 파일을 서버 확인 없이 재사용할 기간 (초, 기본 24시간)
+CORP_CODE_TTL = int(os.getenv("OPENDART_CORP_CODE_TTL", "86400"))
+
+# list.json 검색 결과에서 우선 선택할 보고서명 키워드
+BUSINESS_REPORT_MARK = "사업보고서"
+
+# 정기공시(A) 중 사업보고서의 공시상세유형 (일괄 검색 시 목록을 사업보고서로 좁힘)
+BUSINESS_REPORT_DETAIL_TY = "A001"
+
+# list.json 페이지당 항목 수 (OpenDART 최대값)
+LIST_PAGE_COUNT = 100
+
+# 공시 목록 일괄 검색에서 읽을 최대 페이지 수 (남은 기업은 기업별 조회로 넘김)
+MAX_LIST_PAGES = 30
+
+# 공시 목록 일괄 검색에서 동시에 요청할 페이지 수
+LIST_PAGE_CONCURRENCY = 5
+
+# 접수번호 조회 결과를 재사용할 기간 (초, 기본 1시간)
+RCEPT_NO_TTL = float(os.getenv("OPENDART_RCEPT_NO_TTL", "3600"))
+
+# (corp_code, bgn_de, end_de, pblntf_ty) → 접수번호 캐시 (찾은 결과만 보관하며 리포지토리 인스턴스 간 공유)
+rcept_no_cache: TTLCache[Tuple[str, str, str, str], str] = TTLCache(maxsize=4096, ttl=RCEPT_NO_TTL)
+
+# 연결 실패(ConnectError/ConnectTimeout) 시 재시도 횟수
+HTTP_CONNECT_RETRIES = 3
+
+# 글로벌 HTTP 클라이언트 (OpenDART 호출 간 커넥션 재사용)
+_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    OpenDART 호출에 사용할 httpx 비동기 클라이언트의 싱글턴 인스턴스를 반환합니다.
+    
+    keep-alive 커넥션을 재사용하므로 첫 호출 이후에는 TCP/TLS 핸드셰이크를 생략하며,
+    일시적인 연결 실패는 전송 계층에서 재시도합니다. 서버가 ALPN으로 HTTP/2를 지원하면
+    fetch-many의 동시 다운로드가 하나의 커넥션 위에서 다중화됩니다 (미지원 시 HTTP/1.1 사용).
+    
+    Returns:
+        httpx.AsyncClient: 커넥션 풀이 설정된 비동기 HTTP 클라이언트
+    """
+    global _client
+    if _client is None:
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=5)
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, http2=True, retries=HTTP_CONNECT_RETRIES),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+        logger.info("httpx 비동기 클라이언트가 초기화되었습니다.")
+    return _client
+
+async def close_http_client() -> None:
+    """
+    글로벌 HTTP 클라이언트를 닫고 keep-alive 커넥션을 정리합니다.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("httpx 비동기 클라이언트가 종료되었습니다.")
+
+def _parse_api_error(content: bytes) -> Optional[str]:
+    """
+    OpenDART 오류 XML 응답에서 오류 메시지를 추출합니다.
+    
+    오류 응답은 <status>/<message> 두 요소만 담은 작은 문서이므로 표준 라이브러리
+    ElementTree로 파싱하며, MAX_ERROR_XML_SIZE보다 큰 본문은 파싱하지 않습니다.
+    
+    Args:
+        content: 응답 본문
+        
+    Returns:
+        Optional[str]: 오류 메시지 (오류 응답이 아니면 None)
+    """
+    if len(content) > MAX_ERROR_XML_SIZE:
+        return None
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        return None
+    
+    status = root if root.tag == "status" else root.find(".//status")
+    if status is None:
+        return None
+    message = root.find(".//message")
+    return message.text if message is not None and message.text else "Unknown error"
+
+async def _prepend_chunk(head: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    미리 읽어 둔 본문 앞부분을 나머지 청크 앞에 이어 붙입니다.
+    
+    Args:
+        head: 미리 읽은 본문 앞부분
+        chunks: 나머지 본문 청크 이터레이터
+        
+    Yields:
+        bytes: 본문 청크
+    """
+    if head:
+        yield head
+    async for chunk in chunks:
+        yield chunk
+
+async def _check_api_error(response: httpx.Response, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    XML로 표기된 스트리밍 응답이 OpenDART 오류 응답인지 확인합니다.
+    
+    Content-Length가 MAX_ERROR_XML_SIZE보다 크면 본문을 읽지 않고, 헤더가 없거나(chunked) 작으면
+    본문을 최대 MAX_ERROR_XML_SIZE까지만 읽어 판단하므로 잘못 표기된 대용량 응답을 메모리에 올리지 않습니다.
+    
+    Args:
+        response: 스트리밍 중인 httpx 응답 객체
+        chunks: 응답 본문 청크 이터레이터
+        
+    Returns:
+        AsyncIterator[bytes]: 미리 읽은 부분을 포함한 본문 청크 이터레이터
+        
+    Raises:
+        Exception: 오류 응답인 경우
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_ERROR_XML_SIZE:
+        return chunks
+    
+    head = bytearray()
+    async for chunk in chunks:
+        head += chunk
+        if len(head) > MAX_ERROR_XML_SIZE:
+            break
+    
+    # 본문 전체가 한도 안에 들어온 경우에만 오류 XML로 파싱
+    if len(head) <= MAX_ERROR_XML_SIZE:
+        error_msg = _parse_api_error(bytes(head))
+        if error_msg:
+            logger.error("API 응답 오류: %s", error_msg)
+            raise Exception(f"OpenDART API 오류: {error_msg}")
+    logger.warning("XML 응답을 받았으나 오류가 아닙니다. 콘텐츠 확인 필요")
+    return _prepend_chunk(bytes(head), chunks)
+
+def _masked_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    로그 출력용으로 요청 파라미터에서 API 키를 가립니다.
+    
+    Args:
+        params: OpenDART 요청 파라미터
+        
+    Returns:
+        Dict[str, Any]: crtfc_key가 가려진 파라미터 사본
+    """
+    return {**params, "crtfc_key": "*****"} if "crtfc_key" in params else params
+
+def _expected_body_size(response: httpx.Response) -> int:
+    """
+    스트리밍 응답의 디코딩 후 본문 크기를 Content-Length 헤더로 추정합니다.
+    
+    Content-Encoding이 적용된 응답은 헤더 크기와 실제 기록 크기가 다르므로 0을 반환합니다.
+    
+    Args:
+        response: 스트리밍 중인 httpx 응답 객체
+        
+    Returns:
+        int: 예상 본문 크기 (알 수 없거나 사전 할당을 지원하지 않으면 0)
+    """
+    if not hasattr(os, "posix_fallocate") or response.headers.get("Content-Encoding"):
+        return 0
+    try:
+        return max(int(response.headers.get("Content-Length", 0)), 0)
+    except ValueError:
+        return 0
+
+def _inflate_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target_path: Path) -> None:
+    """
+    deflate로 압축된 ZIP 멤버를 ISA-L(python-isal)로 직접 inflate하여 파일로 씁니다.
+    
+    zipfile 내부 함수를 교체하지 않도록 로컬 파일 헤더 뒤의 원시 deflate 스트림을 읽어
+    isal_zlib.decompressobj(-15)에 넣으며, 압축 해제 후 CRC-32를 확인합니다.
+    
+    Args:
+        zip_ref: 열려 있는 ZipFile 객체 (파일 경로로 연 객체)
+        info: 압축 해제할 멤버 정보 (ZIP_DEFLATED)
+        target_path: 저장할 파일 경로
+        
+    Raises:
+        zipfile.BadZipFile: 로컬 파일 헤더가 잘못되었거나 CRC가 일치하지 않는 경우
+    """
+    with open(zip_ref.filename, "rb") as source, open(target_path, "wb") as target:
+        source.seek(info.header_offset)
+        header = source.read(ZIP_LOCAL_HEADER_SIZE)
+        if len(header) != ZIP_LOCAL_HEADER_SIZE or header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"잘못된 로컬 파일 헤더입니다: {info.filename}")
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        source.seek(name_length + extra_length, os.SEEK_CUR)
+        
+        decompressor = isal_zlib.decompressobj(-15)
+        crc = 0
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = source.read(min(EXTRACT_BUFFER_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            data = decompressor.decompress(chunk)
+            crc = isal_zlib.crc32(data, crc)
+            target.write(data)
+        data = decompressor.flush()
+        crc = isal_zlib.crc32(data, crc)
+        target.write(data)
+    
+    if crc != info.CRC:
+        raise zipfile.BadZipFile(f"CRC가 일치하지 않습니다: {info.filename}")
+
+def _copy_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target_path: Path) -> None:
+    """
+    ZIP 멤버 하나를 1MB 버퍼 단위로 스트리밍하여 파일로 씁니다.
+    
+    python-isal이 설치되어 있으면 deflate 멤버는 _inflate_member로 압축 해제합니다.
+    
+    Args:
+        zip_ref: 열려 있는 ZipFile 객체
+        info: 압축 해제할 멤버 정보
+        target_path: 저장할 파일 경로
+    """
+    # python-isal이 있으면 암호화되지 않은 deflate 멤버는 ISA-L로 직접 inflate
+    if (isal_zlib is not None and zip_ref.filename and info.compress_type == zipfile.ZIP_DEFLATED
+            and not info.flag_bits & 0x1):
+        _inflate_member(zip_ref, info, target_path)
+        return
+    
+    with zip_ref.open(info) as source, open(target_path, "wb") as target:
+        shutil.copyfileobj(source, target, EXTRACT_BUFFER_SIZE)
+
+def _extract_member_batch(zip_path: str, members: List[Tuple[str, str]]) -> None:
+    """
+    ZIP 파일을 한 번 열고 주어진 멤버들을 차례로 압축 해제합니다.
+    
+    프로세스 풀에 전달되므로 모듈 최상위 함수로 정의하며, 작업마다 ZIP 중앙 디렉토리를
+    한 번만 읽도록 멤버를 묶음 단위로 받습니다.
+    
+    Args:
+        zip_path: ZIP 파일 경로
+        members: (멤버 이름, 저장할 파일 경로) 목록 (경로 검증이 끝난 상태)
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member_name, target_path in members:
+            _copy_member(zip_ref, zip_ref.getinfo(member_name), Path(target_path))
+
+def _prepare_members(zip_path: Path, extract_dir: Path) -> List[Tuple[str, str, int]]:
+    """
+    ZIP 멤버 경로를 검증하고 압축 해제에 필요한 디렉토리를 미리 만듭니다.
+    
+    Args:
+        zip_path: ZIP 파일 경로
+        extract_dir: 압축 해제할 디렉토리 경로
+        
+    Returns:
+        List[Tuple[str, str, int]]: 파일 멤버별 (멤버 이름, 저장할 파일 경로, 압축 해제 크기)
+        
+    Raises:
+        FileNotFoundError: ZIP 파일이 존재하지 않는 경우
+        ValueError: 멤버 경로가 압축 해제 디렉토리를 벗어나는 경우
+    """
+    if not zip_path.exists():
+        raise FileNotFoundError(f"ZIP 파일이 존재하지 않습니다: {zip_path}")
+    
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    extract_root = extract_dir.resolve()
+    # 같은 디렉토리에 대한 mkdir 시스템 콜을 반복하지 않도록 생성한 경로 기억
+    created_dirs = {extract_root}
+    members = []
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            target_path = (extract_root / info.filename).resolve()
+            if not target_path.is_relative_to(extract_root):
+                raise ValueError(f"잘못된 ZIP 멤버 경로입니다: {info.filename}")
+            
+            target_dir = target_path if info.is_dir() else target_path.parent
+            if target_dir not in created_dirs:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target_dir)
+            
+            if not info.is_dir():
+                members.append((info.filename, str(target_path), info.file_size))
+    return members
+
+def _split_members(members: List[Tuple[str, str, int]], workers: int) -> List[List[Tuple[str, str]]]:
+    """
+    압축 해제 크기가 고르게 나뉘도록 멤버를 워커 수만큼의 묶음으로 나눕니다.
+    
+    큰 멤버부터 현재 가장 가벼운 묶음에 배정합니다.
+    
+    Args:
+        members: (멤버 이름, 저장할 파일 경로, 압축 해제 크기) 목록
+        workers: 나눌 묶음 수
+        
+    Returns:
+        List[List[Tuple[str, str]]]: 비어 있지 않은 (멤버 이름, 저장할 파일 경로) 묶음 목록
+    """
+    batches: List[List[Tuple[str, str]]] = [[] for _ in range(max(min(workers, len(members)), 1))]
+    loads = [0] * len(batches)
+    for member_name, target_path, size in sorted(members, key=lambda m: m[2], reverse=True):
+        index = loads.index(min(loads))
+        batches[index].append((member_name, target_path))
+        loads[index] += size
+    return [batch for batch in batches if batch]
+
+async def _extract_members(zip_path: Path, extract_dir: Path) -> None:
+    """
+    ZIP 파일의 각 멤버를 1MB 버퍼 단위로 스트리밍하여 압축 해제합니다.
+    
+    기본 extractall보다 큰 버퍼를 사용하여 대용량 XBRL 파일의 read/write 호출 수를 줄입니다.
+    압축 해제 크기가 PARALLEL_EXTRACT_MIN_SIZE 이상이고 파일 멤버가 여러 개면
+    멤버를 워커 수만큼 묶어 이벤트 루프에서 프로세스 풀로 직접 분배하므로,
+    I/O 스레드가 다른 실행기의 작업을 기다리며 묶여 있지 않습니다.
+    
+    Args:
+        zip_path: ZIP 파일 경로
+        extract_dir: 압축 해제할 디렉토리 경로
+        
+    Raises:
+        FileNotFoundError: ZIP 파일이 존재하지 않는 경우
+        ValueError: 멤버 경로가 압축 해제 디렉토리를 벗어나는 경우
+    """
+    loop = asyncio.get_running_loop()
+    members = await loop.run_in_executor(get_io_executor(), _prepare_members, zip_path, extract_dir)
+    
+    total_size = sum(size for _, _, size in members)
+    if len(members) > 1 and total_size >= PARALLEL_EXTRACT_MIN_SIZE:
+        process_pool = get_process_pool()
+        await asyncio.gather(*(
+            loop.run_in_executor(process_pool, _extract_member_batch, str(zip_path), batch)
+            for batch in _split_members(members, os.cpu_count() or 1)
+        ))
+        return
+    
+    await loop.run_in_executor(
+        get_io_executor(), _extract_member_batch, str(zip_path),
+        [(member_name, target_path) for member_name, target_path, _ in members]
+    )
+
+def _finish_extract(zip_path: Path, extract_dir: Path, delete_zip: bool) -> None:
+    """
+    압축 해제 후 원본 ZIP 파일을 (옵션에 따라) 삭제하고 추출된 항목 수를 로그로 남깁니다.
+    
+    Args:
+        zip_path: ZIP 파일 경로
+        extract_dir: 압축 해제된 디렉토리 경로
+        delete_zip: 원본 ZIP 파일을 삭제할지 여부
+    """
+    if delete_zip:
+        os.remove(zip_path)
+        logger.info("원본 ZIP 파일 삭제 완료: %s", zip_path)
+    
+    # 추출된 파일 목록 확인
+    logger.info("추출된 파일 수: %d", _count_entries(extract_dir))
+
+def _count_entries(directory: Path) -> int:
+    """
+    디렉토리 바로 아래의 항목 수를 셉니다.
+    
+    os.scandir는 항목별 stat 호출이나 Path 객체 생성 없이 디렉토리를 한 번 순회합니다.
+    
+    Args:
+        directory: 항목 수를 셀 디렉토리 경로
+        
+    Returns:
+        int: 항목 수
+    """
+    with os.scandir(directory) as entries:
+        return sum(1 for _ in entries)
+
 class OpenDartRepository:
     def __init__(self):
         self.api_key = API_KEY
@@ -20,15 +424,18 @@ class OpenDartRepository:
         self.save_dir.mkdir(parents=True, exist_ok=True)
         self.extract_dir.mkdir(parents=True, exist_ok=True)
         # API 키 확인 로깅
-        print(f"[INFO] API Key 설정됨: {'*' * 5}{API_KEY[-5:] if API_KEY else 'NOT SET'}")
-        print(f"[INFO] 저장 경로: {self.save_dir}")
-        print(f"[INFO] 압축 해제 경로: {self.extract_dir}")
+        logger.info("API Key 설정됨: *****%s", API_KEY[-5:] if API_KEY else 'NOT SET')
+        logger.info("저장 경로: %s", self.save_dir)
+        logger.info("압축 해제 경로: %s", self.extract_dir)
 
-    def get_document_info(self, corp_code: str, bsns_year: int = None, reprt_code: str = None, 
+    async def get_document_info(self, corp_code: str, bsns_year: int = None, reprt_code: str = None, 
                         bgn_de: str = None, end_de: str = None, pblntf_ty: str = "A") -> Optional[str]:
         """
         OpenDART API를 통해 지정된 기업 코드에 해당하는 사업보고서의 접수번호(rcept_no)를 조회합니다.
         
+        같은 검색 조건으로 찾은 접수번호는 RCEPT_NO_TTL초 동안 rcept_no_cache에서 바로 반환합니다
+        (찾지 못한 결과는 새 공시가 올라올 수 있으므로 캐시하지 않음).
+        
         Args:
             corp_code: 기업 고유번호
             bsns_year: (더 이상 사용되지 않음) 사업연도  
@@ -43,14 +450,17 @@ class OpenDartRepository:
         Raises:
             Exception: API 호출 실패 시 예외 발생
         """
-        # 검색 시작일과 종료일 기본값 설정
-        if not bgn_de:
+        # 검색 시작일과 종료일 기본값 설정 (현재 연도는 한 번만 조회)
+        if not bgn_de or not end_de:
             current_year = datetime.now().year
-            bgn_de = f"{current_year}0301"  # 당해년도 3월 1일
+            bgn_de = bgn_de or f"{current_year}0301"  # 당해년도 3월 1일
+            end_de = end_de or f"{current_year}0415"  # 당해년도 4월 15일
         
-        if not end_de:
-            current_year = datetime.now().year
-            end_de = f"{current_year}0415"  # 당해년도 4월 15일
+        cache_key = (corp_code, bgn_de, end_de, pblntf_ty)
+        cached = rcept_no_cache.get(cache_key)
+        if cached is not None:
+            logger.info("캐시된 접수번호 사용: %s (corp_code: %s)", cached, corp_code)
+            return cached
             
         # list.json API 호출로 변경
         url = "https://opendart.fss.or.kr/api/list.json"
@@ -62,67 +472,196 @@ class OpenDartRepository:
             "pblntf_ty": pblntf_ty
         }
         
-        print(f"[INFO] 문서 검색 API 요청: {url}, 파라미터: {params}")
+        logger.info("문서 검색 API 요청: %s, 파라미터: %s", url, _masked_params(params))
         
         try:
-            response = requests.get(url, params=params)
+            response = await get_http_client().get(url, params=params)
             response.raise_for_status()  # HTTP 오류 검사
             
             # 응답 로깅
-            print(f"[INFO] 응답 상태 코드: {response.status_code}")
-            print(f"[INFO] 응답 콘텐츠 타입: {response.headers.get('Content-Type', '')}")
+            logger.info("응답 상태 코드: %s", response.status_code)
+            logger.info("응답 콘텐츠 타입: %s", response.headers.get('Content-Type', ''))
             
-            # JSON 응답 파싱
-            response_data = response.json()
+            # JSON 응답 파싱 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+            response_data = orjson.loads(response.content)
             
             # 응답 상태 확인
             status = response_data.get('status')
             if status != '000':
                 message = response_data.get('message', 'Unknown error')
-                print(f"[ERROR] API 응답 오류: {message}")
+                logger.error("API 응답 오류: %s", message)
                 return None
                 
             # 목록 데이터 확인
             list_data = response_data.get('list', [])
             if not list_data:
-                print(f"[WARN] 검색 결과가 없습니다. corp_code: {corp_code}")
+                logger.warning("검색 결과가 없습니다. corp_code: %s", corp_code)
                 return None
                 
-            # "사업보고서"가 포함된 항목 찾기
-            for item in list_data:
-                report_nm = item.get('report_nm', '')
-                rcept_no = item.get('rcept_no')
-                
-                # 디버그 정보 출력
-                print(f"[DEBUG] 검색된 보고서: {report_nm}, 접수번호: {rcept_no}")
-                
-                if '사업보고서' in report_nm and rcept_no:
-                    print(f"[INFO] 사업보고서 접수번호 검색 성공: {rcept_no}, 보고서명: {report_nm}")
-                    return rcept_no
+            # "사업보고서"가 포함된 첫 항목 찾기 (찾는 즉시 순회 중단)
+            hit = next(
+                (item for item in list_data
+                 if BUSINESS_REPORT_MARK in item.get('report_nm', '') and item.get('rcept_no')),
+                None
+            )
+            if hit is not None:
+                rcept_no = hit['rcept_no']
+                logger.info("사업보고서 접수번호 검색 성공: %s, 보고서명: %s", rcept_no, hit['report_nm'])
+                rcept_no_cache.set(cache_key, rcept_no)
+                return rcept_no
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                for item in list_data:
+                    logger.debug("검색된 보고서: %s, 접수번호: %s", item.get('report_nm', ''), item.get('rcept_no'))
             
             # 사업보고서가 없는 경우
-            print(f"[WARN] '사업보고서'가 포함된 항목을 찾을 수 없습니다. corp_code: {corp_code}")
+            logger.warning("'사업보고서'가 포함된 항목을 찾을 수 없습니다. corp_code: %s", corp_code)
             
             # 대체: 목록의 첫 번째 항목 반환
             if list_data and 'rcept_no' in list_data[0]:
                 rcept_no = list_data[0]['rcept_no']
-                print(f"[INFO] 대체 접수번호 사용: {rcept_no}, 보고서명: {list_data[0].get('report_nm', '알 수 없음')}")
+                logger.info("대체 접수번호 사용: %s, 보고서명: %s", rcept_no, list_data[0].get('report_nm', '알 수 없음'))
+                rcept_no_cache.set(cache_key, rcept_no)
                 return rcept_no
                 
             return None
                 
-        except requests.RequestException as e:
-            print(f"[ERROR] 문서 검색 API 요청 오류: {e}")
+        except httpx.HTTPError as e:
+            logger.error("문서 검색 API 요청 오류: %s", e)
             raise Exception(f"OpenDART API 요청 오류: {e}")
         except json.JSONDecodeError as e:
-            print(f"[ERROR] JSON 응답 파싱 오류: {e}")
-            print(f"[DEBUG] 응답 내용: {response.text[:500]}...")
+            logger.error("JSON 응답 파싱 오류: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("응답 내용: %s...", response.text[:500])
             raise Exception(f"OpenDART API 응답 파싱 오류: {e}")
         except Exception as e:
-            print(f"[ERROR] 문서 정보 조회 중 예상치 못한 오류: {e}")
+            logger.error("문서 정보 조회 중 예상치 못한 오류: %s", e)
             raise
 
-    def download_xbrl_zip(self, rcept_no: str, reprt_code: str = "11011", filename: str = None, auto_extract: bool = True, delete_zip: bool = False, 
+    async def get_document_infos(self, corp_codes: List[str], bgn_de: str, end_de: str,
+                                 pblntf_ty: str = "A") -> Dict[str, str]:
+        """
+        여러 기업의 사업보고서 접수번호(rcept_no)를 기업 코드 없이 조회한 공시 목록에서 한 번에 찾습니다.
+        
+        list.json을 page_count=LIST_PAGE_COUNT 단위로 조회하며 각 기업의 첫 사업보고서를 색인하므로,
+        기업 수만큼 API를 호출하지 않아도 됩니다. 첫 페이지로 total_page를 확인한 뒤 나머지 페이지는
+        LIST_PAGE_CONCURRENCY개씩 동시에 요청하고, 모든 기업을 찾으면 다음 묶음을 요청하지 않습니다.
+        MAX_LIST_PAGES를 넘는 페이지는 읽지 않으므로, 찾지 못한 기업은 호출자가 기업별로 조회해야 합니다.
+        정기공시(A)는 사업보고서(A001)만 조회하여 페이지 수를 줄입니다.
+        OpenDART는 기업 코드 없는 검색 기간을 3개월로 제한하므로 그보다 긴 기간에는 사용할 수 없습니다.
+        rcept_no_cache에 있는 기업은 검색에서 제외하고, 새로 찾은 접수번호는 캐시에 저장합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
+            bgn_de: 검색 시작일(YYYYMMDD)
+            end_de: 검색 종료일(YYYYMMDD)
+            pblntf_ty: 공시유형 (기본값: "A", 전체)
+            
+        Returns:
+            Dict[str, str]: 기업 고유번호 → 사업보고서 접수번호 (찾지 못한 기업은 포함되지 않음)
+            
+        Raises:
+            Exception: API 호출 실패 또는 오류 응답 시 예외 발생
+        """
+        pending = set(corp_codes)
+        rcept_nos: Dict[str, str] = {}
+        
+        # 캐시에 있는 기업은 검색 대상에서 제외
+        for corp_code in corp_codes:
+            cached = rcept_no_cache.get((corp_code, bgn_de, end_de, pblntf_ty))
+            if cached is not None:
+                rcept_nos[corp_code] = cached
+                pending.discard(corp_code)
+        
+        if not pending:
+            return rcept_nos
+        
+        logger.info("공시 목록 일괄 검색 시작: 기업 %d개, 기간 %s~%s", len(pending), bgn_de, end_de)
+        
+        def _index_page(items: List[Dict[str, Any]]) -> None:
+            for item in items:
+                corp_code = item.get('corp_code')
+                if (corp_code in pending and item.get('rcept_no')
+                        and BUSINESS_REPORT_MARK in item.get('report_nm', '')):
+                    rcept_nos[corp_code] = item['rcept_no']
+                    rcept_no_cache.set((corp_code, bgn_de, end_de, pblntf_ty), item['rcept_no'])
+                    pending.discard(corp_code)
+        
+        # 첫 페이지로 전체 페이지 수 확인
+        response_data = await self._get_list_page(bgn_de, end_de, pblntf_ty, 1)
+        if response_data is None:
+            return rcept_nos
+        _index_page(response_data.get('list', []))
+        total_page = int(response_data.get('total_page') or 1)
+        last_page = min(total_page, MAX_LIST_PAGES)
+        pages_read = 1
+        
+        # 나머지 페이지는 묶음 단위로 동시에 요청하고, 공시 목록 순서대로 색인
+        page_no = 2
+        while pending and page_no <= last_page:
+            batch = range(page_no, min(page_no + LIST_PAGE_CONCURRENCY, last_page + 1))
+            pages = await asyncio.gather(*(
+                self._get_list_page(bgn_de, end_de, pblntf_ty, n) for n in batch
+            ))
+            for page in pages:
+                if page is not None:
+                    _index_page(page.get('list', []))
+            pages_read += len(batch)
+            page_no = batch.stop
+        
+        if pending and total_page > MAX_LIST_PAGES:
+            logger.info("공시 목록이 %d 페이지를 넘어 %d개 기업은 기업별 조회가 필요합니다 (전체 %d 페이지)",
+                        MAX_LIST_PAGES, len(pending), total_page)
+        logger.info("공시 목록 일괄 검색 완료: %d개 기업 접수번호 확인 (%d 페이지)", len(rcept_nos), pages_read)
+        return rcept_nos
+
+    async def _get_list_page(self, bgn_de: str, end_de: str, pblntf_ty: str,
+                             page_no: int) -> Optional[Dict[str, Any]]:
+        """
+        기업 코드 없이 list.json 공시 목록의 한 페이지를 조회합니다.
+        
+        Args:
+            bgn_de: 검색 시작일(YYYYMMDD)
+            end_de: 검색 종료일(YYYYMMDD)
+            pblntf_ty: 공시유형
+            page_no: 페이지 번호 (1부터 시작)
+            
+        Returns:
+            Optional[Dict[str, Any]]: 응답 JSON (조회된 데이터가 없으면 None)
+            
+        Raises:
+            Exception: API 호출 실패 또는 오류 응답 시 예외 발생
+        """
+        url = "https://opendart.fss.or.kr/api/list.json"
+        params = {
+            "crtfc_key": self.api_key,
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "pblntf_ty": pblntf_ty,
+            "page_no": page_no,
+            "page_count": LIST_PAGE_COUNT,
+        }
+        if pblntf_ty == "A":
+            params["pblntf_detail_ty"] = BUSINESS_REPORT_DETAIL_TY
+        
+        try:
+            response = await get_http_client().get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("공시 목록 일괄 검색 API 요청 오류: %s", e)
+            raise Exception(f"OpenDART API 요청 오류: {e}")
+        
+        response_data = orjson.loads(response.content)
+        status = response_data.get('status')
+        if status == '013':  # 조회된 데이터 없음
+            return None
+        if status != '000':
+            message = response_data.get('message', 'Unknown error')
+            logger.error("API 응답 오류: %s", message)
+            raise Exception(f"OpenDART API 오류: {message}")
+        return response_data
+
+    async def download_xbrl_zip(self, rcept_no: str, reprt_code: str = "11011", filename: str = None, auto_extract: bool = True, delete_zip: bool = False, 
                          corp_code: str = None, bsns_year: int = None) -> str:
         """
         OpenDART에서 지정된 접수번호(rcept_no)의 XBRL zip 파일을 다운로드하고 저장함
@@ -149,67 +688,105 @@ class OpenDartRepository:
             "reprt_code": reprt_code
         }
 
-        print(f"[INFO] XBRL 다운로드 API 요청: {url}, 파라미터: {params}")
+        logger.info("XBRL 다운로드 API 요청: %s, 파라미터: %s", url, _masked_params(params))
 
         try:
-            response = requests.get(url, params=params, stream=True)
-            response.raise_for_status()  # HTTP 오류 검사
-            
-            content_type = response.headers.get("Content-Type", "")
+            async with get_http_client().stream("GET", url, params=params) as response:
+                response.raise_for_status()  # HTTP 오류 검사
+                
+                content_type = response.headers.get("Content-Type", "")
+                
+                # 모든 응답 정보 로깅 (DEBUG 레벨에서만 헤더 전체를 포맷)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "응답 정보\n- 상태 코드: %s\n- 응답 타입: %s\n- 헤더: %s",
+                        response.status_code, content_type, dict(response.headers)
+                    )
+                
+                # XML 응답이면 오류 메시지 확인 (본문은 최대 MAX_ERROR_XML_SIZE까지만 미리 읽음)
+                chunks = response.aiter_bytes(CHUNK_SIZE)
+                if 'xml' in content_type.lower():
+                    chunks = await _check_api_error(response, chunks)
+
+                if filename is None:
+                    filename = f"{rcept_no}_{reprt_code}.zip"
+
+                save_path = self.save_dir / filename
+                size = await self._stream_zip_to_file(response, save_path, chunks)
+
+            logger.info("파일 저장 완료: %s (%d bytes)", save_path, size)
             
-            # 모든 응답 정보 로깅
-            debug_msg = (
-                f"[DEBUG] 응답 정보\n"
-                f"- 상태 코드: {response.status_code}\n"
-                f"- 응답 타입: {content_type}\n"
-                f"- 헤더: {response.headers}\n"
-                f"- 데이터 크기: {len(response.content)} bytes\n"
-                f"- 응답 시작 부분: {response.content[:100]}"
-            )
-            print(debug_msg)
-            
-            # XML 응답이면 오류 메시지 확인
-            if 'xml' in content_type.lower():
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'xml')
-                error = soup.find('status')
-                if error:
-                    message = soup.find('message')
-                    error_msg = message.text if message else "Unknown error"
-                    print(f"[ERROR] API 응답 오류: {error_msg}")
-                    raise Exception(f"OpenDART API 오류: {error_msg}")
-                print(f"[WARN] XML 응답을 받았으나 오류가 아닙니다. 콘텐츠 확인 필요")
-            
-            # ZIP 파일인지 확인 (content-type이 application/zip이 아니더라도 ZIP 파일일 수 있음)
-            if response.content[:4] != b'PK\x03\x04':
-                print(f"[ERROR] 응답이 ZIP 파일 형식이 아닙니다.")
-                raise Exception("다운로드한 파일이 ZIP 형식이 아닙니다.")
-
-            if filename is None:
-                filename = f"{rcept_no}_{reprt_code}.zip"
-
-            save_path = self.save_dir / filename
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-
-            print(f"[INFO] 파일 저장 완료: {save_path}")
-            
-            # 압축 해제 진행
+            # 압축 해제 진행 (블로킹 작업은 _extract_zip_file 안에서 실행기로 분배)
             extract_path = None
             if auto_extract:
-                extract_path = self._extract_zip_file(save_path, delete_zip, corp_code, bsns_year, reprt_code)
+                extract_path = await self._extract_zip_file(save_path, delete_zip, corp_code, bsns_year, reprt_code)
                 return extract_path
             
             return str(save_path)
             
-        except requests.RequestException as e:
-            print(f"[ERROR] XBRL 다운로드 API 요청 오류: {e}")
+        except httpx.HTTPError as e:
+            logger.error("XBRL 다운로드 API 요청 오류: %s", e)
             raise Exception(f"OpenDART API 요청 오류: {e}")
         except Exception as e:
-            print(f"[ERROR] XBRL 파일 다운로드 중 오류: {e}")
+            logger.error("XBRL 파일 다운로드 중 오류: %s", e)
             raise
+
+    async def _stream_zip_to_file(self, response: httpx.Response, save_path: Path,
+                                  chunks: Optional[AsyncIterator[bytes]] = None) -> int:
+        """
+        HTTP 응답 본문을 청크 단위로 읽어 ZIP 파일로 저장합니다.
+        
+        첫 청크에서 ZIP 시그니처를 확인하므로 응답 전체를 메모리에 올리지 않습니다.
+        본문은 임시 파일(.part)에 기록한 뒤 완료 시점에 최종 경로로 교체하므로,
+        전송이 중간에 끊겨도 잘린 ZIP 파일이 저장 경로에 남지 않습니다.
+        Content-Length를 알 수 있으면 posix_fallocate로 파일 크기를 미리 할당합니다.
+        
+        Args:
+            response: 스트리밍 중인 httpx 응답 객체
+            save_path: 저장할 파일 경로
+            chunks: 본문 청크 이터레이터 (None이면 response.aiter_bytes 사용)
+            
+        Returns:
+            int: 저장된 바이트 수
+            
+        Raises:
+            Exception: 응답이 ZIP 형식이 아닌 경우
+        """
+        if chunks is None:
+            chunks = response.aiter_bytes(CHUNK_SIZE)
+        first_chunk = await anext(chunks, b"")
+        
+        # ZIP 파일인지 확인 (content-type이 application/zip이 아니더라도 ZIP 파일일 수 있음)
+        if first_chunk[:4] != b'PK\x03\x04':
+            logger.error("응답이 ZIP 파일 형식이 아닙니다.")
+            raise Exception("다운로드한 파일이 ZIP 형식이 아닙니다.")
+        
+        size = len(first_chunk)
+        part_path = save_path.with_name(save_path.name + ".part")
+        expected_size = _expected_body_size(response)
+        try:
+            async with aiofiles.open(part_path, "wb") as f:
+                if expected_size:
+                    # 전체 크기를 미리 할당하여 청크 기록 중 익스텐트가 조각나지 않도록 함
+                    await asyncio.get_running_loop().run_in_executor(
+                        get_io_executor(), os.posix_fallocate, f.fileno(), 0, expected_size
+                    )
+                await f.write(first_chunk)
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+                if expected_size and size != expected_size:
+                    # 실제 본문이 Content-Length와 다르면 미리 할당한 꼬리 영역 제거
+                    await f.truncate(size)
+            os.replace(part_path, save_path)
+        except BaseException:
+            # 다운로드 실패 또는 취소 시 불완전한 임시 파일 정리
+            part_path.unlink(missing_ok=True)
+            raise
+        
+        return size
     
-    def _extract_zip_file(self, zip_path: Path, delete_zip: bool = False, 
+    async def _extract_zip_file(self, zip_path: Path, delete_zip: bool = False, 
                          corp_code: str = None, bsns_year: int = None, reprt_code: str = None) -> str:
         """
         ZIP 파일을 압축 해제하고 추출된 파일 경로를 반환
@@ -228,9 +805,6 @@ class OpenDartRepository:
             FileNotFoundError: ZIP 파일이 존재하지 않는 경우
             Exception: 압축 해제 중 오류 발생 시
         """
-        if not zip_path.exists():
-            raise FileNotFoundError(f"ZIP 파일이 존재하지 않습니다: {zip_path}")
-        
         # 압축 해제할 디렉토리 생성
         if corp_code and reprt_code:
             # 새로운 형식: '기업 고유번호_현재날짜_보고서코드' 또는 '기업 고유번호_사업연도_보고서코드'
@@ -240,44 +814,46 @@ class OpenDartRepository:
                 # 사업연도가 없는 경우 접수번호(ZIP 파일명)를 사용
                 extract_folder = f"{corp_code}_{zip_path.stem}"
                 
-            print(f"[INFO] 새 폴더명 형식으로 저장: {extract_folder}")
+            logger.info("새 폴더명 형식으로 저장: %s", extract_folder)
         else:
             # 기존 형식: '접수번호_보고서코드' (.zip 확장자 제외)
             extract_folder = zip_path.stem
-            print(f"[INFO] 기존 폴더명 형식으로 저장: {extract_folder}")
+            logger.info("기존 폴더명 형식으로 저장: %s", extract_folder)
             
         extract_dir = self.extract_dir / extract_folder
-        extract_dir.mkdir(parents=True, exist_ok=True)
         
         try:
-            # 압축 해제
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+            # 압축 해제 (경로 준비와 작은 ZIP은 I/O 스레드 풀, 큰 ZIP은 프로세스 풀에서 실행)
+            await _extract_members(zip_path, extract_dir)
             
-            print(f"[INFO] 압축 해제 완료: {extract_dir}")
+            logger.info("압축 해제 완료: %s", extract_dir)
             
-            # 압축 해제 후 원본 ZIP 파일 삭제 옵션이 활성화된 경우
-            if delete_zip:
-                os.remove(zip_path)
-                print(f"[INFO] 원본 ZIP 파일 삭제 완료: {zip_path}")
-            
-            # 추출된 파일 목록 확인
-            extracted_files = list(extract_dir.glob("*"))
-            print(f"[INFO] 추출된 파일 수: {len(extracted_files)}")
+            # 압축 해제 후 원본 ZIP 파일 삭제 옵션 처리 및 추출된 파일 목록 확인
+            await asyncio.get_running_loop().run_in_executor(
+                get_io_executor(), _finish_extract, zip_path, extract_dir, delete_zip
+            )
             
             return str(extract_dir)
             
         except Exception as e:
-            print(f"[ERROR] 압축 해제 중 오류 발생: {e}")
+            logger.error("압축 해제 중 오류 발생: %s", e)
             raise
 
-    def download_corp_code(self, auto_extract: bool = True, delete_zip: bool = False) -> str:
+    async def download_corp_code(self, auto_extract: bool = True, delete_zip: bool = False,
+                                 force_refresh: bool = False) -> str:
         """
         OpenDART에서 기업 코드 목록을 다운로드합니다.
         
+        이전 결과를 받은 지 CORP_CODE_TTL초가 지나지 않았으면 HTTP 요청 없이 저장된 경로를 반환합니다.
+        TTL이 지났으면 이전 응답의 ETag/Last-Modified로 조건부 요청을 보내고, 서버가 304를 반환하면
+        본문을 내려받거나 압축을 풀지 않고 이전 결과 경로를 그대로 반환합니다.
+        메타데이터는 auto_extract 모드와 관계없이 하나의 사이드카 파일에 병합하여 저장하며,
+        캐시된 결과를 재사용할 때도 delete_zip 옵션에 따라 남은 ZIP 파일을 삭제합니다.
+        
         Args:
             auto_extract: 다운로드 후 자동으로 압축 해제할지 여부
             delete_zip: 압축 해제 후 원본 ZIP 파일을 삭제할지 여부
+            force_refresh: True이면 TTL과 관계없이 서버에 변경 여부를 확인
             
         Returns:
             str: 저장된 압축 파일 경로 또는 압축 해제된 경우 디렉토리 경로
@@ -290,66 +866,129 @@ class OpenDartRepository:
             "crtfc_key": self.api_key
         }
 
-        print(f"[INFO] 기업코드 다운로드 API 요청: {url}")
+        # 이전 다운로드 결과가 남아 있으면 TTL 이내에는 그대로 사용하고, 이후에는 조건부 요청으로 변경 여부만 확인
+        loop = asyncio.get_running_loop()
+        meta = await loop.run_in_executor(get_io_executor(), self._load_corp_code_meta)
+        cached_path = meta.get("extracted_path" if auto_extract else "zip_path")
+        headers = {}
+        if cached_path and await loop.run_in_executor(get_io_executor(), os.path.exists, cached_path):
+            if not force_refresh and time.time() - meta.get("fetched_at", 0) < CORP_CODE_TTL:
+                logger.info("기업코드 파일 TTL 이내이므로 요청 없이 캐시된 경로를 사용합니다: %s", cached_path)
+                if auto_extract and delete_zip and meta.get("zip_path"):
+                    await loop.run_in_executor(get_io_executor(), self._discard_corp_code_zip, meta)
+                return cached_path
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
 
+        logger.info("기업코드 다운로드 API 요청: %s", url)
+        
         try:
-            response = requests.get(url, params=params, stream=True)
-            response.raise_for_status()  # HTTP 오류 검사
-            
-            content_type = response.headers.get("Content-Type", "")
+            async with get_http_client().stream("GET", url, params=params, headers=headers) as response:
+                if response.status_code == 304:
+                    logger.info("기업코드 파일이 변경되지 않아 캐시된 경로를 사용합니다: %s", cached_path)
+                    # 확인 시각을 갱신하여 다음 TTL 동안은 요청을 생략
+                    meta = {**meta, "fetched_at": time.time()}
+                    if auto_extract and delete_zip and meta.get("zip_path"):
+                        await loop.run_in_executor(get_io_executor(), self._discard_corp_code_zip, meta)
+                    else:
+                        await loop.run_in_executor(get_io_executor(), self._save_corp_code_meta, meta)
+                    return cached_path
+                
+                response.raise_for_status()  # HTTP 오류 검사
+                
+                content_type = response.headers.get("Content-Type", "")
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                
+                # 응답 정보 로깅 (DEBUG 레벨에서만 헤더 전체를 포맷)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "응답 정보\n- 상태 코드: %s\n- 응답 타입: %s\n- 헤더: %s",
+                        response.status_code, content_type, dict(response.headers)
+                    )
+                
+                # XML 응답이면 오류 메시지 확인 (본문은 최대 MAX_ERROR_XML_SIZE까지만 미리 읽음)
+                chunks = response.aiter_bytes(CHUNK_SIZE)
+                if 'xml' in content_type.lower() and not 'zip' in content_type.lower():
+                    chunks = await _check_api_error(response, chunks)
+
+                # 저장할 파일명 생성
+                filename = f"corpcode_{datetime.now().strftime('%Y%m%d')}.zip"
+                save_path = self.save_dir / filename
+                size = await self._stream_zip_to_file(response, save_path, chunks)
+
+            logger.info("기업코드 파일 저장 완료: %s (%d bytes)", save_path, size)
             
-            # 응답 정보 로깅
-            debug_msg = (
-                f"[DEBUG] 응답 정보\n"
-                f"- 상태 코드: {response.status_code}\n"
-                f"- 응답 타입: {content_type}\n"
-                f"- 헤더: {response.headers}\n"
-                f"- 데이터 크기: {len(response.content)} bytes"
-            )
-            print(debug_msg)
-            
-            # XML 응답이면 오류 메시지 확인
-            if 'xml' in content_type.lower() and not 'zip' in content_type.lower():
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.content, 'xml')
-                error = soup.find('status')
-                if error:
-                    message = soup.find('message')
-                    error_msg = message.text if message else "Unknown error"
-                    print(f"[ERROR] API 응답 오류: {error_msg}")
-                    raise Exception(f"OpenDART API 오류: {error_msg}")
-                print(f"[WARN] XML 응답을 받았으나 오류가 아닙니다. 콘텐츠 확인 필요")
-            
-            # ZIP 파일인지 확인
-            if response.content[:4] != b'PK\x03\x04':
-                print(f"[ERROR] 응답이 ZIP 파일 형식이 아닙니다.")
-                raise Exception("다운로드한 파일이 ZIP 형식이 아닙니다.")
-
-            # 저장할 파일명 생성
-            filename = f"corpcode_{datetime.now().strftime('%Y%m%d')}.zip"
-            save_path = self.save_dir / filename
-            
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-
-            print(f"[INFO] 기업코드 파일 저장 완료: {save_path}")
-            
-            # 압축 해제 진행
+            # 압축 해제 진행 (블로킹 작업은 _extract_corp_code_zip 안에서 실행기로 분배)
             extract_path = None
             if auto_extract:
-                extract_path = self._extract_corp_code_zip(save_path, delete_zip)
-                return extract_path
+                extract_path = await self._extract_corp_code_zip(save_path, delete_zip)
             
-            return str(save_path)
+            # 기존 메타데이터에 병합하여 다른 모드(auto_extract/delete_zip)로 저장한 경로를 잃지 않도록 함
+            zip_exists = await loop.run_in_executor(get_io_executor(), save_path.exists)
+            await loop.run_in_executor(get_io_executor(), self._save_corp_code_meta, {
+                **meta,
+                **validators,
+                "fetched_at": time.time(),
+                "zip_path": str(save_path) if zip_exists else None,
+                "extracted_path": extract_path if extract_path is not None else meta.get("extracted_path"),
+            })
+            
+            return extract_path if auto_extract else str(save_path)
             
-        except requests.RequestException as e:
-            print(f"[ERROR] 기업코드 다운로드 API 요청 오류: {e}")
+        except httpx.HTTPError as e:
+            logger.error("기업코드 다운로드 API 요청 오류: %s", e)
             raise Exception(f"OpenDART API 요청 오류: {e}")
         except Exception as e:
-            print(f"[ERROR] 기업코드 파일 다운로드 중 오류: {e}")
+            logger.error("기업코드 파일 다운로드 중 오류: %s", e)
             raise
             
-    def _extract_corp_code_zip(self, zip_path: Path, delete_zip: bool = False) -> str:
+    def _load_corp_code_meta(self) -> Dict[str, Any]:
+        """
+        기업코드 파일의 캐시 검증 정보(ETag, Last-Modified, 받은 시각, 저장 경로)를 읽습니다.
+        
+        Returns:
+            Dict[str, Any]: 저장된 메타데이터 (없거나 읽을 수 없으면 빈 딕셔너리)
+        """
+        try:
+            with open(self.save_dir / CORP_CODE_META_FILE, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_corp_code_meta(self, meta: Dict[str, Any]) -> None:
+        """
+        기업코드 파일의 캐시 검증 정보를 사이드카 파일에 저장합니다.
+        
+        응답에 ETag나 Last-Modified가 없어도 TTL 판단을 위해 받은 시각과 경로는 저장합니다.
+        
+        Args:
+            meta: etag, last_modified, fetched_at, zip_path, extracted_path를 담은 딕셔너리
+        """
+        meta_path = self.save_dir / CORP_CODE_META_FILE
+        with open(meta_path, "wb") as f:
+            f.write(orjson.dumps(meta))
+
+    def _discard_corp_code_zip(self, meta: Dict[str, Any]) -> None:
+        """
+        캐시된 결과를 재사용할 때 delete_zip 옵션에 따라 남아 있는 기업코드 ZIP 파일을 삭제합니다.
+        
+        삭제 후 메타데이터의 zip_path를 비워 사이드카 파일에 저장합니다.
+        
+        Args:
+            meta: 현재 기업코드 메타데이터 (zip_path 포함)
+        """
+        zip_path = Path(meta["zip_path"])
+        if zip_path.exists():
+            os.remove(zip_path)
+            logger.info("원본 ZIP 파일 삭제 완료: %s", zip_path)
+        self._save_corp_code_meta({**meta, "zip_path": None})
+
+    async def _extract_corp_code_zip(self, zip_path: Path, delete_zip: bool = False) -> str:
         """
         기업코드 ZIP 파일을 압축 해제하고 추출된 파일 경로를 반환
         
@@ -364,32 +1003,23 @@ class OpenDartRepository:
             FileNotFoundError: ZIP 파일이 존재하지 않는 경우
             Exception: 압축 해제 중 오류 발생 시
         """
-        if not zip_path.exists():
-            raise FileNotFoundError(f"ZIP 파일이 존재하지 않습니다: {zip_path}")
-        
         # 압축 해제할 디렉토리 생성
         extract_folder = f"corpcode_{datetime.now().strftime('%Y%m%d')}"
         extract_dir = self.extract_dir / extract_folder
-        extract_dir.mkdir(parents=True, exist_ok=True)
         
         try:
-            # 압축 해제
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+            # 압축 해제 (경로 준비와 작은 ZIP은 I/O 스레드 풀, 큰 ZIP은 프로세스 풀에서 실행)
+            await _extract_members(zip_path, extract_dir)
             
-            print(f"[INFO] 기업코드 압축 해제 완료: {extract_dir}")
+            logger.info("기업코드 압축 해제 완료: %s", extract_dir)
             
-            # 압축 해제 후 원본 ZIP 파일 삭제 옵션이 활성화된 경우
-            if delete_zip:
-                os.remove(zip_path)
-                print(f"[INFO] 원본 ZIP 파일 삭제 완료: {zip_path}")
-            
-            # 추출된 파일 목록 확인
-            extracted_files = list(extract_dir.glob("*"))
-            print(f"[INFO] 추출된 파일 수: {len(extracted_files)}")
+            # 압축 해제 후 원본 ZIP 파일 삭제 옵션 처리 및 추출된 파일 목록 확인
+            await asyncio.get_running_loop().run_in_executor(
+                get_io_executor(), _finish_extract, zip_path, extract_dir, delete_zip
+            )
             
             return str(extract_dir)
             
         except Exception as e:
-            print(f"[ERROR] 압축 해제 중 오류 발생: {e}")
+            logger.error("압축 해제 중 오류 발생: %s", e)
             raise
\ No newline at end of file
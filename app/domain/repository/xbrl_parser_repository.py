@@ -7,7 +7,7 @@ XBRL 파싱 결과를 데이터베이스에 저장하는 리포지토리 모듈
 
 import asyncio
 import asyncpg
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 import logging
 from datetime import datetime
 import json
@@ -28,16 +28,27 @@ from app.foundation.db.asyncpg_pool import get_pool
 logger = logging.getLogger(__name__)
 
 
+# 유니크 제약 조건 확인 완료 여부 (한 번 확인되면 프로세스 수명 동안 카탈로그 조회 생략)
+_unique_constraint_ready: bool = False
+
+
 async def _ensure_unique_constraint(conn) -> bool:
     """
     dsd_source 테이블에 필요한 유니크 제약 조건이 존재하는지 확인하고, 없다면 추가합니다.
     
+    제약 조건은 한 번 생기면 사라지지 않으므로, 존재가 확인된 이후의 호출은
+    카탈로그를 조회하지 않고 바로 True를 반환합니다.
+    
     Args:
         conn: asyncpg 커넥션 객체
         
     Returns:
         bool: 제약 조건 생성 성공 여부
     """
+    global _unique_constraint_ready
+    if _unique_constraint_ready:
+        return True
+    
     try:
         # 테이블과 제약 조건의 존재 여부 확인
         exists_query = """
@@ -77,14 +88,200 @@ async def _ensure_unique_constraint(conn) -> bool:
             return True
         else:
             logger.info("유니크 제약 조건 'unique_dsd_source_entry'가 이미 존재합니다.")
+            _unique_constraint_ready = True
             return True
             
     except Exception as e:
-        logger.error(f"유니크 제약 조건 확인/생성 중 오류 발생: {e}")
+        logger.error("유니크 제약 조건 확인/생성 중 오류 발생: %s", e)
         return False
 
 
-async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+# COPY로 적재할 dsd_source 컬럼 순서
+DSD_SOURCE_COLUMNS = ("corp_code", "source_name", "value", "year", "unit")
+
+# UPSERT 후 돌려받을 dsd_source 컬럼 (조회 API 응답 스키마와 동일)
+DSD_SOURCE_RETURNING = "id, corp_code, source_name, value, year, unit"
+
+# DSD_SOURCE_COLUMNS 순서의 레코드 튜플 (corp_code, source_name, value, year, unit)
+DsdSourceRow = Tuple[str, str, int, int, str]
+
+
+def _iter_rows(records: List[Dict[str, Any]]) -> Iterator[DsdSourceRow]:
+    """
+    XBRL 파서 출력 레코드를 검증하면서 dsd_source 레코드 튜플로 변환합니다.
+    
+    변환과 필수 필드 검증을 한 번의 순회로 처리하며, 유효하지 않은 레코드는 건너뜁니다.
+    
+    Args:
+        records: XBRL 파싱 결과 레코드 리스트 (기업코드, 항목명, 값, 연도, 단위)
+        
+    Yields:
+        DsdSourceRow: COPY에 바로 사용할 수 있는 레코드 튜플
+    """
+    for record in records:
+        try:
+            # 쉼표 제거 후 정수나 실수로 변환
+            value_str = record.get('값', '0')
+            value = int(float(value_str.replace(',', ''))) if value_str else 0
+            
+            # 연도가 문자열인 경우 정수로 변환
+            year_str = record.get('연도', '0')
+            year = int(year_str) if year_str.isdigit() else 0
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning("레코드 처리 중 오류 발생: %s, record=%s", e, record)
+            continue
+        
+        corp_code = record.get('기업코드', '')
+        source_name = record.get('항목명', '')
+        
+        # 필수 필드 검증
+        if not corp_code or not source_name or not year:
+            logger.warning("필수 필드 누락: record=%s", record)
+            continue
+        
+        yield (corp_code, source_name, value, year, record.get('단위', ''))
+
+
+async def _stage_records(conn: asyncpg.Connection, rows: List[DsdSourceRow]) -> int:
+    """
+    레코드를 임시 스테이징 테이블(dsd_source_staging)에 COPY로 적재합니다.
+    
+    스테이징 테이블은 커넥션(세션)마다 한 번 생성되어 재사용되므로,
+    스테이징 테이블을 읽는 문장의 준비된 구문 캐시가 무효화되지 않습니다.
+    
+    Args:
+        conn: 트랜잭션이 열려 있는 asyncpg 커넥션 객체
+        rows: DSD_SOURCE_COLUMNS 순서의 레코드 튜플 리스트
+        
+    Returns:
+        int: 중복 제거 후 적재된 레코드 수
+    """
+    # 한 문장 안에서 같은 행을 두 번 갱신할 수 없으므로 키 기준으로 중복 제거 (마지막 값 우선)
+    rows = list({(row[0], row[1], row[3]): row for row in rows}.values())
+    
+    # 인자 없는 execute는 단순 질의 프로토콜을 사용하므로 두 문장을 한 번의 왕복으로 보냄
+    # (같은 트랜잭션에서 이전에 적재된 행이 남아 있을 수 있으므로 TRUNCATE로 비움)
+    await conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS dsd_source_staging
+        ON COMMIT DELETE ROWS
+        AS SELECT corp_code, source_name, value, year, unit FROM dsd_source
+        WITH NO DATA;
+        TRUNCATE dsd_source_staging;
+    """)
+    await conn.copy_records_to_table("dsd_source_staging", records=rows, columns=DSD_SOURCE_COLUMNS)
+    return len(rows)
+
+
+async def _copy_upsert(conn: asyncpg.Connection) -> List[asyncpg.Record]:
+    """
+    스테이징 테이블의 레코드를 한 번의 INSERT ... SELECT ... ON CONFLICT로 UPSERT합니다.
+    
+    값과 단위가 기존 행과 같으면 UPDATE를 건너뛰므로, 재수집 시 불필요한 dead tuple과
+    WAL 기록이 생기지 않으며 해당 행은 RETURNING 결과에도 포함되지 않습니다.
+    
+    Args:
+        conn: 스테이징이 끝난 asyncpg 커넥션 객체
+        
+    Returns:
+        List[asyncpg.Record]: 삽입/업데이트된 행 (DSD_SOURCE_RETURNING 컬럼과 inserted 여부, id 순)
+    """
+    return await conn.fetch(f"""
+        WITH upserted AS (
+            INSERT INTO dsd_source (corp_code, source_name, value, year, unit)
+            SELECT corp_code, source_name, value, year, unit FROM dsd_source_staging
+            ON CONFLICT (corp_code, source_name, year)
+            DO UPDATE SET
+                value = EXCLUDED.value,
+                unit = EXCLUDED.unit
+            WHERE dsd_source.value IS DISTINCT FROM EXCLUDED.value
+               OR dsd_source.unit IS DISTINCT FROM EXCLUDED.unit
+            RETURNING {DSD_SOURCE_RETURNING}, (xmax = 0) AS inserted
+        )
+        SELECT * FROM upserted ORDER BY id
+    """)
+
+
+async def _copy_merge(conn: asyncpg.Connection) -> List[asyncpg.Record]:
+    """
+    유니크 제약 조건 없이 스테이징 테이블의 레코드를 병합합니다.
+    
+    ON CONFLICT를 쓸 수 없으므로 값이 달라진 기존 행만 UPDATE ... FROM으로 갱신하고,
+    남은 행은 INSERT ... SELECT ... WHERE NOT EXISTS로 삽입합니다 (레코드 수와 무관하게 2회 왕복).
+    
+    Args:
+        conn: 스테이징이 끝난 asyncpg 커넥션 객체
+        
+    Returns:
+        List[asyncpg.Record]: 삽입/업데이트된 행 (DSD_SOURCE_RETURNING 컬럼과 inserted 여부)
+    """
+    updated = await conn.fetch("""
+        UPDATE dsd_source AS d
+        SET value = s.value, unit = s.unit
+        FROM dsd_source_staging AS s
+        WHERE d.corp_code = s.corp_code AND d.source_name = s.source_name AND d.year = s.year
+          AND (d.value IS DISTINCT FROM s.value OR d.unit IS DISTINCT FROM s.unit)
+        RETURNING d.id, d.corp_code, d.source_name, d.value, d.year, d.unit, FALSE AS inserted
+    """)
+    inserted = await conn.fetch(f"""
+        INSERT INTO dsd_source (corp_code, source_name, value, year, unit)
+        SELECT s.corp_code, s.source_name, s.value, s.year, s.unit
+        FROM dsd_source_staging AS s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM dsd_source AS d
+            WHERE d.corp_code = s.corp_code AND d.source_name = s.source_name AND d.year = s.year
+        )
+        RETURNING {DSD_SOURCE_RETURNING}, TRUE AS inserted
+    """)
+    return sorted(updated + inserted, key=lambda row: row['id'])
+
+
+async def _upsert_records(conn: asyncpg.Connection, rows: List[DsdSourceRow]) -> Dict[str, Any]:
+    """
+    전처리된 레코드를 하나의 트랜잭션 안에서 dsd_source 테이블에 UPSERT합니다.
+    
+    호출자가 이미 트랜잭션을 열어둔 커넥션을 전달하면 savepoint로 중첩됩니다.
+    
+    Args:
+        conn: asyncpg 커넥션 객체
+        rows: 전처리된 레코드 튜플 리스트 (corp_code, source_name, value, year, unit)
+        
+    Returns:
+        Dict[str, Any]: inserted, updated, unchanged 수와 삽입/업데이트된 행(rows)
+    """
+    # 트랜잭션 시작
+    async with conn.transaction():
+        # 유니크 제약 조건 확인 및 생성
+        constraint_exists = await _ensure_unique_constraint(conn)
+        
+        # 레코드를 스테이징 테이블에 COPY로 적재
+        staged_count = await _stage_records(conn, rows)
+        
+        # 유니크 제약 조건이 존재하는 경우 ON CONFLICT 사용
+        if constraint_exists:
+            written = await _copy_upsert(conn)
+        else:
+            # 제약 조건이 없는 경우 UPDATE/INSERT 두 문장으로 병합
+            written = await _copy_merge(conn)
+        
+        inserted_count = sum(1 for row in written if row['inserted'])
+        updated_count = len(written) - inserted_count
+        
+        # 값이 같아 갱신을 건너뛴 레코드 수
+        unchanged_count = max(staged_count - inserted_count - updated_count, 0)
+        
+        # 확인용 로그
+        logger.info("Bulk insert 완료: %d개 삽입, %d개 업데이트, %d개 변경 없음", inserted_count, updated_count, unchanged_count)
+        
+        return {
+            "inserted": inserted_count,
+            "updated": updated_count,
+            "unchanged": unchanged_count,
+            "rows": written
+        }
+
+
+async def insert_dsd_source_bulk(records: List[Dict[str, Any]],
+                                 conn: Optional[asyncpg.Connection] = None) -> Dict[str, Any]:
     """
     XBRL 파싱 결과 레코드를 dsd_source 테이블에 대량으로 삽입합니다.
     
@@ -99,12 +296,16 @@ async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any
                 - 값: XBRL 항목 값 (문자열, 쉼표 등 포함 가능)
                 - 연도: 연도 값
                 - 단위: 단위 정보
+        conn: 사용할 asyncpg 커넥션 (None이면 커넥션 풀에서 새로 가져옴).
+              호출자의 트랜잭션 안에서 저장하고 같은 커넥션으로 재조회할 때 사용합니다.
     
     Returns:
         Dict[str, Any]: 처리 결과를 담은 딕셔너리
                 - success: 성공 여부
                 - inserted: 삽입된 레코드 수
                 - updated: 업데이트된 레코드 수
+                - unchanged: 값이 같아 갱신을 건너뛴 레코드 수
+                - rows: 삽입/업데이트된 행 목록 (id, corp_code, source_name, value, year, unit, id 순)
                 - error: 오류 메시지 (오류 발생 시)
     
     Raises:
@@ -118,39 +319,10 @@ async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any
             "message": "삽입할 레코드가 없습니다."
         }
     
-    # 데이터 전처리
-    processed_records = []
-    for record in records:
-        # XBRL 파서의 출력 형식에 맞춰 필드 이름 변환
-        # '항목명'은 'source_name'으로, '값'은 숫자로, '연도'는 정수로 변환
-        try:
-            # 쉼표 제거 후 정수나 실수로 변환
-            value_str = record.get('값', '0').replace(',', '')
-            value = int(float(value_str)) if value_str else 0
-            
-            # 연도가 문자열인 경우 정수로 변환
-            year_str = record.get('연도', '0')
-            year = int(year_str) if year_str.isdigit() else 0
-            
-            processed_record = {
-                'corp_code': record.get('기업코드', ''),
-                'source_name': record.get('항목명', ''),
-                'value': value,
-                'year': year,
-                'unit': record.get('단위', '')
-            }
-            processed_records.append(processed_record)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"레코드 처리 중 오류 발생: {e}, record={record}")
-            continue
-    
-    # 필수 필드 검증
-    for idx, record in enumerate(processed_records):
-        if not record['corp_code'] or not record['source_name'] or not record['year']:
-            logger.warning(f"필수 필드 누락: record={record}")
-            processed_records.pop(idx)
+    # 데이터 전처리 (변환과 필수 필드 검증을 한 번에 수행)
+    rows = list(_iter_rows(records))
     
-    if not processed_records:
+    if not rows:
         return {
             "success": False,
             "error": "유효한 레코드가 없습니다.",
@@ -159,122 +331,34 @@ async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any
         }
     
     # 데이터베이스 연결 및 쿼리 실행
-    pool: Optional[Pool] = None
     inserted_count = 0
     updated_count = 0
     
     try:
-        # 커넥션 풀 가져오기
-        pool = await get_pool()
+        if conn is None:
+            # 커넥션 풀에서 커넥션을 가져와 실행
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                counts = await _upsert_records(conn, rows)
+        else:
+            # 호출자가 전달한 커넥션(및 트랜잭션)에서 실행
+            counts = await _upsert_records(conn, rows)
         
-        # 비동기로 executemany 실행
-        async with pool.acquire() as conn:
-            # 트랜잭션 시작
-            async with conn.transaction():
-                # 유니크 제약 조건 확인 및 생성
-                constraint_exists = await _ensure_unique_constraint(conn)
-                
-                # 레코드 수 카운트
-                results = await conn.fetch(
-                    "SELECT COUNT(*) FROM dsd_source"
-                )
-                before_count = results[0]['count']
-                
-                # 유니크 제약 조건이 존재하는 경우 ON CONFLICT 사용
-                if constraint_exists:
-                    # ON CONFLICT 구문을 사용한 UPSERT 쿼리
-                    query = """
-                        INSERT INTO dsd_source (corp_code, source_name, value, year, unit)
-                        VALUES ($1, $2, $3, $4, $5)
-                        ON CONFLICT (corp_code, source_name, year) 
-                        DO UPDATE SET 
-                            value = EXCLUDED.value,
-                            unit = EXCLUDED.unit
-                        RETURNING (xmax = 0) AS inserted
-                    """
-                    
-                    # executemany 대신 복수의 VALUES를 생성하는 방식으로 구현 (asyncpg 특성)
-                    stmt = await conn.prepare(query)
-                    
-                    # 각 레코드에 대해 쿼리 실행하고 삽입/업데이트 여부 추적
-                    for record in processed_records:
-                        result = await stmt.fetch(
-                            record['corp_code'],
-                            record['source_name'],
-                            record['value'],
-                            record['year'],
-                            record['unit']
-                        )
-                        if result and result[0]['inserted']:
-                            inserted_count += 1
-                        else:
-                            updated_count += 1
-                else:
-                    # 제약 조건이 없는 경우 더 느리지만 안전한 방식 사용
-                    for record in processed_records:
-                        # 먼저 레코드가 존재하는지 확인
-                        check_query = """
-                            SELECT id FROM dsd_source 
-                            WHERE corp_code = $1 AND source_name = $2 AND year = $3
-                        """
-                        existing = await conn.fetchrow(
-                            check_query,
-                            record['corp_code'],
-                            record['source_name'],
-                            record['year']
-                        )
-                        
-                        if existing:
-                            # 기존 레코드 업데이트
-                            update_query = """
-                                UPDATE dsd_source
-                                SET value = $1, unit = $2
-                                WHERE id = $3
-                            """
-                            await conn.execute(
-                                update_query,
-                                record['value'],
-                                record['unit'],
-                                existing['id']
-                            )
-                            updated_count += 1
-                        else:
-                            # 새 레코드 삽입
-                            insert_query = """
-                                INSERT INTO dsd_source (corp_code, source_name, value, year, unit)
-                                VALUES ($1, $2, $3, $4, $5)
-                            """
-                            await conn.execute(
-                                insert_query,
-                                record['corp_code'],
-                                record['source_name'],
-                                record['value'],
-                                record['year'],
-                                record['unit']
-                            )
-                            inserted_count += 1
-                
-                # 최종 레코드 수 확인
-                results = await conn.fetch(
-                    "SELECT COUNT(*) FROM dsd_source"
-                )
-                after_count = results[0]['count']
-                
-                # 확인용 로그
-                logger.info(f"Bulk insert 완료: {inserted_count}개 삽입, {updated_count}개 업데이트")
+        inserted_count = counts["inserted"]
+        updated_count = counts["updated"]
         
         return {
             "success": True,
             "inserted": inserted_count,
             "updated": updated_count,
-            "total_records": len(processed_records),
-            "before_count": before_count,
-            "after_count": after_count,
+            "unchanged": counts["unchanged"],
+            "rows": counts["rows"],
+            "total_records": len(rows),
             "message": f"{inserted_count}개 레코드 삽입, {updated_count}개 레코드 업데이트 완료"
         }
         
     except UniqueViolationError as e:
-        logger.error(f"중복 키 위반 오류: {e}")
+        logger.error("중복 키 위반 오류: %s", e)
         return {
             "success": False,
             "error": f"중복 키 위반 오류: {str(e)}",
@@ -282,7 +366,7 @@ async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any
             "updated": updated_count
         }
     except PostgresError as e:
-        logger.error(f"데이터베이스 오류: {e}")
+        logger.error("데이터베이스 오류: %s", e)
         return {
             "success": False,
             "error": f"데이터베이스 오류: {str(e)}",
@@ -290,7 +374,7 @@ async def insert_dsd_source_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any
             "updated": updated_count
         }
     except Exception as e:
-        logger.error(f"예상치 못한 오류: {e}")
+        logger.error("예상치 못한 오류: %s", e)
         return {
             "success": False,
             "error": f"예상치 못한 오류: {str(e)}",
@@ -333,5 +417,5 @@ async def get_dsd_source_by_corp_code(corp_code: str, year: Optional[int] = None
             return [dict(row) for row in rows]
             
     except Exception as e:
-        logger.error(f"데이터 조회 중 오류 발생: {e}")
+        logger.error("데이터 조회 중 오류 발생: %s", e)
         return []
@@ -1,7 +1,7 @@
 """
 DSD 소스 데이터 자동 조회 및 생성 서비스
 """
-from typing import Optional
+from typing import Dict, Optional
 import asyncpg
 import logging
 import asyncio
@@ -9,7 +9,8 @@ from datetime import datetime
 import json
 
 from app.domain.repository.dsdgen_r_repository import DsdgenReadRepository
-from app.domain.model.dsdgen_schema import DsdSourceSchema, DsdSourceListResponse
+from app.domain.model.dsdgen_schema import DsdSourceListResponse
+from .dsdgen_service import dsd_source_cache, to_dsd_source_response
 from .opendart_service import OpenDartService
 from .xbrl_parser_service import XBRLParserService
 
@@ -34,20 +35,25 @@ class DsdAutoFetchService:
         self.dsdgen_repo = DsdgenReadRepository(pool) if pool else None
         self.opendart_service = OpenDartService()
         self.xbrl_parser_service = XBRLParserService()
+        # 기업코드 → 진행 중인 생성 태스크 (동시 요청 합치기)
+        self._inflight: Dict[str, asyncio.Task] = {}
     
-    async def get_or_create_dsd_source(self, corp_code: str) -> DsdSourceListResponse:
+    async def get_or_create_dsd_source(self, corp_code: str, force_refresh: bool = False) -> DsdSourceListResponse:
         """
         특정 기업 코드에 해당하는 DSD 소스 데이터를 조회하거나, 없으면 생성합니다.
         
+        0. 조회 캐시(dsd_source_cache)에 결과가 있으면 DB 조회 없이 반환 (force_refresh이면 생략)
         1. dsd_source 테이블에서 해당 기업코드의 데이터가 이미 존재하는지 확인
         2. 데이터가 있으면 → 그대로 반환
-        3. 데이터가 없으면 →
+        3. 데이터가 없으면 → (같은 기업코드의 동시 요청은 하나의 생성 작업 결과를 공유)
            a. OpenDART에서 기업 XBRL zip 파일 다운로드
-           b. zip 파일을 파싱하여 데이터프레임으로 변환하고 DB에 저장
-           c. DB에 저장이 끝나면 → 다시 dsd_source 테이블에서 해당 기업 데이터를 조회하고 반환
+           b. zip 파일을 파싱하여 레코드 리스트로 변환 (커넥션을 잡기 전에 수행)
+           c. 하나의 트랜잭션에서 DB에 저장하고, 저장이 끝나면 → UPSERT가 돌려준 행을 그대로 반환
+              (변경 없이 건너뛴 행이 있으면 dsd_source 테이블을 다시 조회)
         
         Args:
             corp_code: 기업 코드
+            force_refresh: True이면 캐시를 건너뛰고 DB에서 다시 조회
             
         Returns:
             DsdSourceListResponse: DSD 소스 데이터 목록
@@ -59,57 +65,122 @@ class DsdAutoFetchService:
             logger.error("읽기 작업을 위한 커넥션 풀이 초기화되지 않았습니다.")
             raise RuntimeError("읽기 작업을 위한 커넥션 풀이 초기화되지 않았습니다.")
             
+        # 0. 캐시 조회 (/dsd-source와 같은 캐시를 공유)
+        if not force_refresh:
+            cached = dsd_source_cache.get(corp_code)
+            if cached is not None and cached.data:
+                return cached
+            
         try:
             # 1. dsd_source 테이블에서 해당 기업코드 데이터 조회
             logger.info("기업코드 %s에 대한 DSD 소스 데이터 조회 시도", corp_code)
             sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
             
             # 2. 데이터가 있으면 그대로 반환
-            if sources and len(sources) > 0:
+            if sources:
                 logger.info("기업코드 %s의 DSD 소스 데이터 조회 성공: %d 건", corp_code, len(sources))
-                source_models = [DsdSourceSchema(**source) for source in sources]
-                return DsdSourceListResponse(success=True, data=source_models)
-            
-            # 3. 데이터가 없으면 생성 프로세스 시작
-            logger.info("기업코드 %s의 DSD 소스 데이터가 없어 생성 프로세스 시작", corp_code)
-            
-            # a. OpenDART에서 기업 XBRL zip 파일 다운로드 (동기 함수이므로 await 사용 안 함)
-            logger.info("OpenDART에서 기업코드 %s의 XBRL 파일 다운로드 시도", corp_code)
-            zip_path = self.opendart_service.fetch_by_corp_code(corp_code)
-            
-            if not zip_path:
-                error_msg = f"OpenDART에서 기업코드 {corp_code}의 XBRL 파일 다운로드 실패"
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
+                response = to_dsd_source_response(sources)
+                dsd_source_cache.set(corp_code, response)
+                return response
             
-            logger.info("OpenDART에서 기업코드 %s의 XBRL 파일 다운로드 성공: %s", corp_code, zip_path)
+            # 3. 데이터가 없으면 생성 프로세스 시작 (같은 기업코드의 동시 요청은 하나의 생성 작업을 공유)
+            return await self._create_coalesced(corp_code)
             
-            # b. XBRL 파일을 파싱하여 데이터프레임으로 변환하고 DB에 저장
-            logger.info("기업코드 %s의 XBRL 파일 파싱 및 DB 저장 시도", corp_code)
-            df = await self.xbrl_parser_service.get_xbrl_to_dataframe(corp_code)
-            
-            if df.empty:
-                error_msg = f"기업코드 {corp_code}의 XBRL 파일 파싱 결과가 비어있습니다."
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
-            
-            logger.info("기업코드 %s의 XBRL 파일 파싱 및 DB 저장 성공: %d 건", corp_code, len(df))
-            
-            # c. DB에 저장이 끝났으므로 다시 dsd_source 테이블에서 해당 기업 데이터를 조회하고 반환
-            logger.info("기업코드 %s의 DSD 소스 데이터 재조회 시도", corp_code)
-            updated_sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
+        except Exception as e:
+            # 생성 단계의 오류는 여기에서 한 번만 로그로 남김
+            logger.error("기업코드 %s의 DSD 소스 데이터 조회 또는 생성 중 오류 발생: %s", corp_code, e)
+            raise RuntimeError(f"DSD 소스 데이터 조회 또는 생성 중 오류 발생: {e}") from e
+
+    async def _create_coalesced(self, corp_code: str) -> DsdSourceListResponse:
+        """
+        같은 기업코드에 대한 생성 작업을 하나만 실행하고, 동시에 들어온 요청은 그 결과를 함께 기다립니다.
+        
+        생성 작업은 별도 태스크로 실행되므로 먼저 요청한 클라이언트가 연결을 끊어도 중단되지 않으며,
+        기다리던 다른 요청은 같은 결과(또는 같은 예외)를 받습니다. 이벤트 루프 안에서 조회와 등록 사이에
+        await가 없으므로 별도의 Lock 없이도 한 기업코드에 태스크가 하나만 생깁니다.
+        
+        Args:
+            corp_code: 기업 코드
             
-            if not updated_sources or len(updated_sources) == 0:
-                error_msg = f"기업코드 {corp_code}의 DSD 소스 데이터가 DB에 저장되지 않았습니다."
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
+        Returns:
+            DsdSourceListResponse: 생성된 DSD 소스 데이터 목록
             
-            logger.info("기업코드 %s의 DSD 소스 데이터 재조회 성공: %d 건", corp_code, len(updated_sources))
-            source_models = [DsdSourceSchema(**source) for source in updated_sources]
+        Raises:
+            RuntimeError: 다운로드, 파싱 또는 저장 중 오류가 발생한 경우
+        """
+        task = self._inflight.get(corp_code)
+        if task is None:
+            logger.info("기업코드 %s의 DSD 소스 데이터가 없어 생성 프로세스 시작", corp_code)
+            task = asyncio.ensure_future(self._create_dsd_source(corp_code))
+            self._inflight[corp_code] = task
+            
+            def _on_done(done: asyncio.Task) -> None:
+                self._inflight.pop(corp_code, None)
+                # 기다리던 요청이 모두 취소된 경우에도 예외를 회수하여 경고 로그가 남지 않도록 함
+                if not done.cancelled():
+                    done.exception()
+            
+            task.add_done_callback(_on_done)
+        else:
+            logger.info("기업코드 %s의 DSD 소스 데이터 생성이 진행 중이어서 결과를 기다립니다", corp_code)
+        
+        # 기다리는 요청이 취소되어도 공유 중인 생성 태스크는 취소되지 않도록 shield로 감쌈
+        return await asyncio.shield(task)
+    
+    async def _create_dsd_source(self, corp_code: str) -> DsdSourceListResponse:
+        """
+        OpenDART에서 XBRL 파일을 내려받아 파싱하고 dsd_source 테이블에 저장한 뒤 결과를 반환합니다.
+        
+        Args:
+            corp_code: 기업 코드
             
-            return DsdSourceListResponse(success=True, data=source_models)
+        Returns:
+            DsdSourceListResponse: 생성된 DSD 소스 데이터 목록
             
-        except Exception as e:
-            error_msg = f"DSD 소스 데이터 조회 또는 생성 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e 
\ No newline at end of file
+        Raises:
+            RuntimeError: 다운로드, 파싱 또는 저장 중 오류가 발생한 경우
+        """
+        # a. OpenDART에서 기업 XBRL zip 파일 다운로드
+        logger.info("OpenDART에서 기업코드 %s의 XBRL 파일 다운로드 시도", corp_code)
+        zip_path = await self.opendart_service.fetch_by_corp_code(corp_code)
+        
+        if not zip_path:
+            raise RuntimeError(f"OpenDART에서 기업코드 {corp_code}의 XBRL 파일 다운로드 실패")
+        
+        logger.info("OpenDART에서 기업코드 %s의 XBRL 파일 다운로드 성공: %s", corp_code, zip_path)
+        
+        # b. XBRL 파일 파싱 (프로세스 풀의 CPU 작업이므로 커넥션을 잡기 전에 끝냄)
+        logger.info("기업코드 %s의 XBRL 파일 파싱 시도", corp_code)
+        records = await self.xbrl_parser_service.parse_records(corp_code)
+        
+        if not records:
+            raise RuntimeError(f"기업코드 {corp_code}의 XBRL 파일 파싱 결과가 비어있습니다.")
+        
+        logger.info("기업코드 %s의 XBRL 파일 파싱 성공: %d 건", corp_code, len(records))
+        
+        # c~d. 저장과 재조회만 하나의 커넥션/트랜잭션에서 수행
+        #      (다운로드와 파싱은 트랜잭션 밖에서 끝났으므로 트랜잭션이 네트워크/CPU 대기로 길어지지 않음)
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                # c. 파싱된 레코드를 DB에 저장
+                logger.info("기업코드 %s의 XBRL 레코드 DB 저장 시도", corp_code)
+                db_result = await self.xbrl_parser_service.store_records(corp_code, records, conn=conn)
+                
+                # d. 모든 행이 방금 삽입/업데이트되었다면 RETURNING 결과를 그대로 사용하고,
+                #    변경 없이 건너뛴 행이 있거나 저장에 실패했을 때만 같은 트랜잭션에서 재조회
+                if db_result.get("success") and not db_result.get("unchanged"):
+                    updated_sources = db_result["rows"]
+                else:
+                    logger.info("기업코드 %s의 DSD 소스 데이터 재조회 시도", corp_code)
+                    updated_sources = await self.dsdgen_repo.get_dsd_sources(corp_code, conn=conn)
+        
+        if not updated_sources:
+            raise RuntimeError(f"기업코드 {corp_code}의 DSD 소스 데이터가 DB에 저장되지 않았습니다.")
+        
+        logger.info("기업코드 %s의 DSD 소스 데이터 확보: %d 건", corp_code, len(updated_sources))
+        response = to_dsd_source_response(updated_sources)
+        
+        # 커밋 이후 캐시 갱신 (커밋 전 조회로 캐시된 빈 결과를 덮어씀)
+        dsd_source_cache.set(corp_code, response)
+        
+        return response
@@ -1,19 +1,45 @@
 """
 XBRL 재무제표 데이터 처리 서비스
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Mapping, Optional
 import asyncio
 import asyncpg
 import logging
 from datetime import datetime
 import json
+from pydantic import TypeAdapter
 
 from app.domain.repository.dsdgen_r_repository import DsdgenReadRepository
 from app.domain.model.dsdgen_schema import DsdSourceSchema, DsdSourceListResponse
+from app.foundation.cache import TTLCache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 기업코드별 DSD 소스 조회 응답 캐시 (/dsd-source와 /dsd-auto-fetch가 공유하며 데이터 저장 시 갱신/무효화)
+# 응답 객체를 그대로 보관하므로 캐시 적중 시 직렬화된 JSON 바이트(to_json_bytes)까지 재사용됨
+dsd_source_cache: TTLCache[str, DsdSourceListResponse] = TTLCache(maxsize=1024, ttl=60.0)
+
+# 조회 결과 목록을 한 번에 검증하는 어댑터 (행 단위 생성 대신 pydantic-core가 리스트 전체를 처리)
+_dsd_source_list_adapter = TypeAdapter(List[DsdSourceSchema])
+
+
+def to_dsd_source_response(sources: Iterable[Mapping[str, Any]]) -> DsdSourceListResponse:
+    """
+    dsd_source 조회 행을 DsdSourceListResponse로 변환합니다.
+    
+    asyncpg.Record는 pydantic이 직접 검증할 수 없는 매핑이므로 dict로 복사한 뒤
+    TypeAdapter로 목록 전체를 한 번에 검증합니다.
+    
+    Args:
+        sources: dsd_source 행 목록 (asyncpg.Record 또는 dict)
+        
+    Returns:
+        DsdSourceListResponse: 조회 캐시에 그대로 보관할 수 있는 성공 응답
+    """
+    data = _dsd_source_list_adapter.validate_python([dict(source) for source in sources])
+    return DsdSourceListResponse.model_construct(success=True, data=data)
+
 class DsdgenService:
     """
     XBRL 재무제표 데이터 처리 서비스
@@ -29,11 +55,14 @@ class DsdgenService:
             pool: asyncpg 커넥션 풀 (읽기 작업용)
         """
         self.pool = pool
+        self.dsdgen_repo = DsdgenReadRepository(pool) if pool else None
     
     async def get_dsd_sources(self, corp_code: str) -> DsdSourceListResponse:
         """
         특정 기업 코드에 해당하는 DSD 소스 데이터를 조회합니다.
         
+        최근 60초 이내에 조회한 기업코드는 DB를 거치지 않고 캐시된 결과를 반환합니다.
+        
         Args:
             corp_code: 기업 코드
             
@@ -47,17 +76,19 @@ class DsdgenService:
             logger.error("읽기 작업을 위한 커넥션 풀이 초기화되지 않았습니다.")
             raise RuntimeError("읽기 작업을 위한 커넥션 풀이 초기화되지 않았습니다.")
             
-        try:
-            # 레포지토리 인스턴스 생성
-            repo = DsdgenReadRepository(self.pool)
+        cached = dsd_source_cache.get(corp_code)
+        if cached is not None:
+            return cached
             
+        try:
             # DSD 소스 데이터 조회
-            sources = await repo.get_dsd_sources(corp_code)
+            sources = await self.dsdgen_repo.get_dsd_sources(corp_code)
             
-            # 결과를 Pydantic 모델로 변환
-            source_models = [DsdSourceSchema(**source) for source in sources]
+            # 결과를 응답 모델로 변환하여 캐시에 보관 (캐시된 응답은 변경하지 않음)
+            response = to_dsd_source_response(sources)
+            dsd_source_cache.set(corp_code, response)
             
-            return DsdSourceListResponse(success=True, data=source_models)
+            return response
         except Exception as e:
             logger.error("DSD 소스 조회 실패: %s", e)
             raise RuntimeError(f"DSD 소스 데이터 조회 중 오류가 발생했습니다: {str(e)}") from e
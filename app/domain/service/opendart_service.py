@@ -1,14 +1,25 @@
 from app.domain.repository.opendart_repository import OpenDartRepository
-from typing import Optional
+from typing import Optional, Dict, List
+import asyncio
+import logging
+import os
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 프로세스 전체에서 동시에 진행할 XBRL ZIP 다운로드 수 (환경 변수로 조정 가능)
+# /fetch, /fetch-many, /dsd-auto-fetch가 함께 공유하므로 요청이 몰려도 다운로드/압축 해제가 무제한으로 늘지 않음
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv("OPENDART_MAX_DOWNLOADS", "4"))
+_download_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_DOWNLOADS)
 
 class OpenDartService:
     def __init__(self):
         self.repository = OpenDartRepository()
 
-    def fetch_by_corp_code(self, corp_code: str, 
-                          auto_extract: bool = True, delete_zip: bool = True,
-                          bgn_de: str = "20250301", end_de: str = "20250415",
-                          pblntf_ty: str = "A") -> Optional[str]:
+    async def fetch_by_corp_code(self, corp_code: str, 
+                                auto_extract: bool = True, delete_zip: bool = True,
+                                bgn_de: str = "20250301", end_de: str = "20250415",
+                                pblntf_ty: str = "A", rcept_no: Optional[str] = None) -> Optional[str]:
         """
         기업 코드를 기반으로 XBRL 파일을 다운로드하고 처리합니다.
         
@@ -19,6 +30,7 @@ class OpenDartService:
             bgn_de: 검색 시작일(YYYYMMDD) (기본값: 20250301)
             end_de: 검색 종료일(YYYYMMDD) (기본값: 20250415)
             pblntf_ty: 공시유형 (기본값: "A", 전체)
+            rcept_no: 이미 알고 있는 접수번호 (지정하면 접수번호 조회를 생략)
             
         Returns:
             Optional[str]: 처리된 파일 경로 또는 접수번호를 찾지 못한 경우 None
@@ -26,42 +38,70 @@ class OpenDartService:
         Raises:
             Exception: API 호출 오류 또는 처리 중 예외 발생 시
         """
-        print(f"[INFO] 기업코드 '{corp_code}'로 접수번호 조회 시작")
-        print(f"[INFO] 검색 기간: {bgn_de} ~ {end_de}")
-        print(f"[INFO] 공시유형: {pblntf_ty}")
+        logger.info("기업코드 '%s'로 접수번호 조회 시작", corp_code)
+        logger.info("검색 기간: %s ~ %s", bgn_de, end_de)
+        logger.info("공시유형: %s", pblntf_ty)
         
-        # 1. 접수번호 조회 (업데이트된 메서드 호출)
-        rcept_no = self.repository.get_document_info(
-            corp_code=corp_code,
-            bgn_de=bgn_de,
-            end_de=end_de,
-            pblntf_ty=pblntf_ty
-        )
+        # 1. 접수번호 조회 (일괄 조회로 이미 찾은 경우 생략)
+        if not rcept_no:
+            rcept_no = await self.repository.get_document_info(
+                corp_code=corp_code,
+                bgn_de=bgn_de,
+                end_de=end_de,
+                pblntf_ty=pblntf_ty
+            )
         
         if not rcept_no:
-            print(f"[WARN] 접수번호를 찾을 수 없습니다. 기업코드: {corp_code}, 검색기간: {bgn_de}~{end_de}")
+            logger.warning("접수번호를 찾을 수 없습니다. 기업코드: %s, 검색기간: %s~%s", corp_code, bgn_de, end_de)
             return None
         
-        print(f"[INFO] 접수번호 '{rcept_no}'로 XBRL 파일 다운로드 시작")
+        logger.info("접수번호 '%s'로 XBRL 파일 다운로드 시작", rcept_no)
         
-        # 2. 접수번호로 XBRL 파일 다운로드 (repository 직접 호출)
+        # 2. 접수번호로 XBRL 파일 다운로드 (repository 직접 호출, 동시 다운로드 수 제한)
         # 보고서 코드는 파일명 형식을 위해 고정 값 "11011" 사용
-        return self.repository.download_xbrl_zip(
-            rcept_no=rcept_no,
-            reprt_code="11011",  # 사업보고서 코드 고정
-            auto_extract=auto_extract,
-            delete_zip=delete_zip,
-            corp_code=corp_code,
-            bsns_year=None  # 폴더명 형식에 필요할 수 있으므로 None으로 전달
+        async with _download_semaphore:
+            return await self.repository.download_xbrl_zip(
+                rcept_no=rcept_no,
+                reprt_code="11011",  # 사업보고서 코드 고정
+                auto_extract=auto_extract,
+                delete_zip=delete_zip,
+                corp_code=corp_code,
+                bsns_year=None  # 폴더명 형식에 필요할 수 있으므로 None으로 전달
+            )
+
+    async def get_document_infos(self, corp_codes: List[str], bgn_de: str = "20250301",
+                                 end_de: str = "20250415", pblntf_ty: str = "A") -> Dict[str, str]:
+        """
+        여러 기업의 사업보고서 접수번호를 공시 목록 일괄 검색으로 조회합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
+            bgn_de: 검색 시작일(YYYYMMDD) (기본값: 20250301)
+            end_de: 검색 종료일(YYYYMMDD) (기본값: 20250415)
+            pblntf_ty: 공시유형 (기본값: "A", 전체)
+            
+        Returns:
+            Dict[str, str]: 기업 고유번호 → 사업보고서 접수번호
+            
+        Raises:
+            Exception: API 호출 오류 또는 처리 중 예외 발생 시
+        """
+        return await self.repository.get_document_infos(
+            corp_codes=corp_codes,
+            bgn_de=bgn_de,
+            end_de=end_de,
+            pblntf_ty=pblntf_ty
         )
 
-    def download_corp_code_list(self, auto_extract: bool = True, delete_zip: bool = True) -> str:
+    async def download_corp_code_list(self, auto_extract: bool = True, delete_zip: bool = True,
+                                      force_refresh: bool = False) -> str:
         """
         OpenDART API를 통해 기업 코드 목록을 다운로드합니다.
         
         Args:
             auto_extract: 다운로드 후 자동으로 압축 해제할지 여부 (기본값: True)
             delete_zip: 압축 해제 후 원본 ZIP 파일을 삭제할지 여부 (기본값: True)
+            force_refresh: True이면 TTL 캐시를 건너뛰고 서버에 변경 여부를 확인 (기본값: False)
             
         Returns:
             str: 처리된 파일 경로 (압축 파일 또는 압축 해제된 디렉토리)
@@ -69,9 +109,10 @@ class OpenDartService:
         Raises:
             Exception: API 호출 오류 또는 처리 중 예외 발생 시
         """
-        print(f"[INFO] 기업 코드 목록 다운로드 시작")
+        logger.info("기업 코드 목록 다운로드 시작")
         
-        return self.repository.download_corp_code(
+        return await self.repository.download_corp_code(
             auto_extract=auto_extract,
-            delete_zip=delete_zip
+            delete_zip=delete_zip,
+            force_refresh=force_refresh
         )
@@ -1,6 +1,8 @@
 from app.foundation.xbrl_parser.xbrl_parser import XBRLParser
-import pandas as pd
+from typing import Optional, List, Dict, Any, Tuple
+import asyncpg
 from app.domain.repository.xbrl_parser_repository import insert_dsd_source_bulk
+from app.domain.service.dsdgen_service import dsd_source_cache
 
 class XBRLParserService:
     def __init__(self):
@@ -9,47 +11,122 @@ class XBRLParserService:
         """
         self.parser = XBRLParser()
 
-    async def get_xbrl_to_dataframe(self, corp_code: str) -> pd.DataFrame:
+    async def get_xbrl_records(self, corp_code: str,
+                               conn: Optional[asyncpg.Connection] = None) -> List[Dict[str, Any]]:
         """
-        기업 고유번호를 기반으로 XBRL 데이터를 파싱하여 DataFrame으로 변환합니다.
+        기업 고유번호를 기반으로 XBRL 데이터를 파싱하여 레코드 리스트로 변환합니다.
         파싱된 데이터는 데이터베이스에도 저장됩니다.
         
+        파서가 만든 레코드 리스트를 DataFrame 없이 그대로 DB에 저장하고 반환합니다.
+        
         Args:
             corp_code: 기업 고유번호 (예: 00000000)
+            conn: DB 저장에 사용할 asyncpg 커넥션 (None이면 커넥션 풀에서 새로 가져옴)
             
         Returns:
-            pandas.DataFrame: XBRL 데이터프레임 (기업코드, 항목명, 값, 연도, 단위 포함)
+            List[Dict[str, Any]]: XBRL 레코드 리스트 (기업코드, 항목명, 값, 연도, 단위 포함)
+        """
+        records, _ = await self.parse_and_store(corp_code, conn=conn)
+        return records
+
+    async def parse_and_store(self, corp_code: str,
+                              conn: Optional[asyncpg.Connection] = None
+                              ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        XBRL 데이터를 파싱하여 DB에 저장하고, 파싱 레코드와 DB 저장 결과를 함께 반환합니다.
+        
+        DB 저장 결과의 rows에는 삽입/업데이트된 dsd_source 행이 담겨 있으므로,
+        호출자는 저장 직후 같은 데이터를 다시 SELECT할 필요가 없습니다.
+        
+        Args:
+            corp_code: 기업 고유번호 (예: 00000000)
+            conn: DB 저장에 사용할 asyncpg 커넥션 (None이면 커넥션 풀에서 새로 가져옴)
             
-        Raises:
-            Exception: 데이터프레임 추출 또는 데이터베이스 저장 중 오류 발생 시
+        Returns:
+            Tuple[List[Dict[str, Any]], Dict[str, Any]]: (XBRL 레코드 리스트, insert_dsd_source_bulk 결과).
+            오류가 발생하거나 저장할 레코드가 없으면 DB 저장 결과는 빈 딕셔너리입니다.
         """
-        print(f"[INFO] 기업 고유번호 {corp_code}에 대한 XBRL 데이터프레임 추출 시작...")
+        print(f"[INFO] 기업 고유번호 {corp_code}에 대한 XBRL 레코드 추출 시작...")
         
         try:
-            # XBRLParser를 통해 XBRL 데이터프레임 추출 (비동기 호출)
-            df = await self.parser.extract_xbrl_to_dataframe(corp_code)
-            print(f"[INFO] 데이터프레임 추출 성공! 총 {len(df)}개 항목")
-            
-            # 데이터프레임이 비어있지 않다면 DB에 저장
-            if not df.empty:
-                # DataFrame을 레코드 리스트로 변환
-                records = df.to_dict(orient="records")
-                
-                # 비동기 함수 직접 호출 (await 사용)
-                db_result = await insert_dsd_source_bulk(records)
-                
-                # 저장 결과 로깅
-                if db_result.get("success", False):
-                    print(f"[INFO] 데이터베이스 저장 성공: {db_result.get('inserted', 0)}개 레코드 삽입, "
-                          f"{db_result.get('updated', 0)}개 레코드 업데이트")
-                else:
-                    print(f"[WARN] 데이터베이스 저장 실패: {db_result.get('error', '알 수 없는 오류')}")
+            # XBRLParser를 통해 XBRL 레코드 추출 (DataFrame을 거치지 않음)
+            records = await self.parse_records(corp_code)
+            print(f"[INFO] XBRL 레코드 추출 성공! 총 {len(records)}개 항목")
+            db_result = await self.store_records(corp_code, records, conn=conn)
             
-            # DataFrame 반환 (원래 기능 유지)
-            return df
+            return records, db_result
             
         except Exception as e:
-            print(f"[ERROR] 데이터프레임 추출 중 오류 발생: {e}")
-            # 오류 발생 시 빈 DataFrame 반환
-            return pd.DataFrame()
+            print(f"[ERROR] XBRL 레코드 추출 중 오류 발생: {e}")
+            # 오류 발생 시 빈 결과 반환
+            return [], {}
+
+    async def parse_records(self, corp_code: str) -> List[Dict[str, Any]]:
+        """
+        XBRL 데이터를 파싱하여 레코드 리스트로 변환합니다 (DB에는 저장하지 않음).
+        
+        파싱은 프로세스 풀에서 수행되므로, DB 저장을 같은 트랜잭션으로 묶으려는 호출자는
+        이 메서드로 먼저 파싱한 뒤 커넥션을 잡고 store_records를 호출합니다.
+        
+        Args:
+            corp_code: 기업 고유번호 (예: 00000000)
+            
+        Returns:
+            List[Dict[str, Any]]: XBRL 레코드 리스트 (실패 시 빈 리스트)
+        """
+        return await self.parser.extract_xbrl_records(corp_code)
+
+    async def get_xbrl_records_bulk(self, corp_codes: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 기업의 XBRL 데이터를 병렬로 파싱하여 DB에 저장하고, 기업별 레코드 리스트를 반환합니다.
+        
+        파싱은 공시 단위로 프로세스 풀에서 동시에 수행하고, DB 저장은 커넥션 풀을 독점하지 않도록
+        기업별로 순서대로 수행합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록
             
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 기업 고유번호 → XBRL 레코드 리스트 (실패한 기업은 빈 리스트)
+        """
+        print(f"[INFO] {len(corp_codes)}개 기업에 대한 XBRL 레코드 일괄 추출 시작...")
+        records_by_corp = await self.parser.extract_xbrl_records_bulk(corp_codes)
+        
+        for corp_code, records in records_by_corp.items():
+            try:
+                await self.store_records(corp_code, records)
+            except Exception as e:
+                print(f"[ERROR] {corp_code} XBRL 레코드 저장 중 오류 발생: {e}")
+        
+        return records_by_corp
+
+    async def store_records(self, corp_code: str, records: List[Dict[str, Any]],
+                             conn: Optional[asyncpg.Connection] = None) -> Dict[str, Any]:
+        """
+        파싱된 XBRL 레코드를 DB에 저장하고 해당 기업의 /dsd-source 조회 캐시를 무효화합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            records: 저장할 XBRL 레코드 리스트
+            conn: DB 저장에 사용할 asyncpg 커넥션 (None이면 커넥션 풀에서 새로 가져옴)
+            
+        Returns:
+            Dict[str, Any]: insert_dsd_source_bulk 결과 (저장할 레코드가 없으면 빈 딕셔너리)
+        """
+        # 레코드가 없으면 저장하지 않음
+        if not records:
+            return {}
+        
+        # 비동기 함수 직접 호출 (await 사용)
+        db_result = await insert_dsd_source_bulk(records, conn=conn)
+        
+        # 저장 결과 로깅
+        if db_result.get("success", False):
+            print(f"[INFO] 데이터베이스 저장 성공: {db_result.get('inserted', 0)}개 레코드 삽입, "
+                  f"{db_result.get('updated', 0)}개 레코드 업데이트")
+            # 저장된 기업코드의 /dsd-source 조회 캐시 무효화
+            dsd_source_cache.invalidate(corp_code)
+        else:
+            print(f"[WARN] 데이터베이스 저장 실패: {db_result.get('error', '알 수 없는 오류')}")
+        
+        return db_result
@@ -1,21 +1,69 @@
 import os
-import shutil
 import json
-from datetime import datetime
+import asyncio
+import uuid
+import aiofiles
+import orjson
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from fastapi import UploadFile
 from app.foundation.xslx_json import XlsxJsonConverter
+from app.foundation.executor import get_process_pool
 import pandas as pd
 import logging
 from fastapi import HTTPException
 
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
 UPLOAD_DIR = "uploads"
+# 업로드 파일을 디스크에 기록할 때 사용하는 청크 크기
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# 변환 결과 샘플로 출력할 시트별 최대 레코드 수
+SAMPLE_SIZE = 5
+
+
+def _format_sample(result: Dict[str, Any]) -> str:
+    """
+    변환 결과에서 시트별로 최대 SAMPLE_SIZE개 레코드를 보기 좋게 포맷합니다.
+    
+    Args:
+        result: XlsxJsonConverter.convert_file 변환 결과
+        
+    Returns:
+        str: 들여쓰기된 샘플 문자열 (시트가 없으면 빈 문자열)
+    """
+    if 'sheets' not in result or not result['sheets']:
+        return ""
+    
+    lines = ["", "===== 변환 결과 샘플 ====="]
+    for sheet_name, data in result['sheets'].items():
+        lines.append(f"\n[시트: {sheet_name}]")
+        if isinstance(data, list) and data:
+            sample_size = min(SAMPLE_SIZE, len(data))
+            
+            # 각 레코드를 보기 좋게 출력
+            for i, record in enumerate(data[:sample_size], 1):
+                lines.append(f"  레코드 {i}:")
+                # 줄바꿈마다 들여쓰기 추가
+                record_str = json.dumps(record, ensure_ascii=False, indent=2)
+                lines.append("    " + '\n    '.join(record_str.split('\n')))
+            
+            # 데이터가 더 있는 경우 메시지 출력
+            if len(data) > sample_size:
+                lines.append(f"  ... 외 {len(data) - sample_size}개 레코드")
+        else:
+            lines.append("  데이터가 없거나 유효하지 않음")
+    lines.append("===== 샘플 끝 =====")
+    return '\n'.join(lines)
+
 
 class XslDsdService:
     def __init__(self):
         os.makedirs(UPLOAD_DIR, exist_ok=True)
     
-    async def save_uploaded_excel_file(self, file: UploadFile, sheet_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def save_uploaded_excel_file(self, file: UploadFile, sheet_names: Optional[List[str]] = None) -> bytes:
         """
         업로드된 엑셀 파일을 저장하고 JSON으로 변환하여 반환
         
@@ -24,54 +72,41 @@ class XslDsdService:
             sheet_names: 변환할 특정 시트 이름 목록
         
         Returns:
-            dict: 파일 정보와 변환된 JSON 데이터
+            bytes: 파일 정보와 변환된 데이터를 담은 JSON 바이트
         """
-        os.makedirs(UPLOAD_DIR, exist_ok=True)
-        filename = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{file.filename}"
+        # 업로드 디렉토리는 서비스 생성 시 한 번 만들어 둠
+        # 같은 초에 같은 이름의 파일이 올라와도 덮어쓰지 않도록 임의 접미사를 붙임
+        timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        filename = f"{timestamp}_{uuid.uuid4().hex[:8]}_{file.filename}"
         filepath = os.path.join(UPLOAD_DIR, filename)
         
-        # 파일 저장
-        with open(filepath, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # 파일 저장 (업로드 전체를 메모리에 올리지 않고 청크 단위로 기록)
+        async with aiofiles.open(filepath, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
+        # 변환이 끝날 때까지 업로드 임시 파일(SpooledTemporaryFile)을 붙잡지 않도록 바로 닫음
+        await file.close()
         
-        # 엑셀 파일을 JSON으로 변환
-        result = XlsxJsonConverter.convert_file(filepath, sheet_names)
+        # 엑셀 파일을 JSON으로 변환 (XML 파싱이 GIL에 묶이므로 별도 프로세스에서 실행)
+        # 직렬화까지 워커에서 마쳐 큰 결과 딕셔너리를 pickle로 주고받지 않음
+        body = await asyncio.get_running_loop().run_in_executor(
+            get_process_pool(), XlsxJsonConverter.convert_file_to_json, filepath, sheet_names
+        )
         
-        # 디버깅 정보 추가
-        print(f"File saved to: {filepath}")
-        print(f"Sheet names: {sheet_names}")
-        print(f"Conversion result keys: {result.keys()}")
+        # 디버깅 정보 추가 (로그 레벨이 꺼져 있으면 포맷하지 않음)
+        logger.info("File saved to: %s", filepath)
+        logger.debug("Sheet names: %s", sheet_names)
         
-        # 변환된 데이터 샘플을 로그에 출력 (최대 50줄)
-        try:
-            if 'sheets' in result and result['sheets']:
-                print(f"\n===== 변환 결과 샘플 =====")
-                for sheet_name, data in result['sheets'].items():
-                    print(f"\n[시트: {sheet_name}]")
-                    if isinstance(data, list) and data:
-                        # 최대 5개 레코드만 출력
-                        sample_size = min(5, len(data))
-                        data_sample = data[:sample_size]
-                        
-                        # 각 레코드를 보기 좋게 출력
-                        for i, record in enumerate(data_sample, 1):
-                            print(f"  레코드 {i}:")
-                            # 각 레코드의 내용을 줄바꿈으로 구분하여 출력
-                            record_str = json.dumps(record, ensure_ascii=False, indent=2)
-                            # 줄바꿈마다 들여쓰기 추가
-                            formatted_record = '\n    '.join(record_str.split('\n'))
-                            print(f"    {formatted_record}")
-                        
-                        # 데이터가 더 있는 경우 메시지 출력
-                        if len(data) > sample_size:
-                            print(f"  ... 외 {len(data) - sample_size}개 레코드")
-                    else:
-                        print("  데이터가 없거나 유효하지 않음")
-                print("===== 샘플 끝 =====\n")
-        except Exception as e:
-            print(f"변환 결과 출력 중 오류 발생: {str(e)}")
+        # 변환된 데이터 샘플은 DEBUG 레벨에서만 역직렬화하여 출력
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                result = orjson.loads(body)
+                logger.debug("Conversion result keys: %s", result.keys())
+                logger.debug("%s", _format_sample(result))
+            except Exception as e:
+                logger.debug("변환 결과 출력 중 오류 발생: %s", e)
         
-        return result
+        return body
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,86 @@
+"""
+프로세스 내 TTL 캐시 모듈
+
+만료 시간(TTL)과 최대 크기를 가진 간단한 인메모리 캐시를 제공합니다.
+모든 연산이 await 없이 동기적으로 끝나므로 단일 이벤트 루프에서 별도 락 없이 사용할 수 있습니다.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    항목별 만료 시간을 갖는 LRU 캐시
+
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """
+        TTLCache 초기화
+
+        Args:
+            maxsize: 저장할 최대 항목 수
+            ttl: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        캐시된 값을 반환합니다. 없거나 만료된 경우 None을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[V]: 캐시된 값 또는 None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """
+        특정 키의 캐시 항목을 제거합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        모든 캐시 항목을 제거합니다.
+        """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
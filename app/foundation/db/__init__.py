@@ -1,18 +1,13 @@
 """
-데이터베이스 연결 및 세션 관리를 위한 패키지
+데이터베이스 연결 관리를 위한 패키지
 
-이 패키지는 두 가지 방식의 PostgreSQL 데이터베이스 연결을 제공합니다:
-1. SQLAlchemy - ORM 기반 데이터베이스 접근을 위한 AsyncSession
-2. asyncpg - 직접 SQL 실행을 위한 고성능 비동기 커넥션
+이 패키지는 asyncpg 기반의 PostgreSQL 비동기 커넥션 풀을 제공합니다.
+직접 SQL을 실행하는 고성능 비동기 커넥션을 사용합니다.
 """
 
-from .session import get_engine, get_session_factory, get_session
 from .asyncpg_pool import get_pool, get_connection
 
 __all__ = [
-    "get_engine", 
-    "get_session_factory", 
-    "get_session",
     "get_pool", 
     "get_connection"
-] 
\ No newline at end of file
+]
@@ -3,9 +3,10 @@ asyncpg 기반 비동기 데이터베이스 커넥션 풀 관리 모듈 (Railway
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Any, AsyncGenerator
 from dotenv import load_dotenv
-from urllib.parse import urlparse
+from urllib.parse import urlparse, unquote
 import asyncpg
 from asyncpg.pool import Pool
 
@@ -16,18 +17,33 @@ if os.getenv("RAILWAY_ENVIRONMENT") is None:
 # 글로벌 커넥션 풀
 _pool: Optional[Pool] = None
 
+# 커넥션 풀 크기 (환경 변수로 조정 가능)
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "10"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "50"))
+
+# 세션 설정: 짧은 OLTP 쿼리에서는 JIT 컴파일 비용이 실행 시간보다 크므로 끔
+SERVER_SETTINGS = {
+    "jit": "off",
+    "application_name": "dsdgen",
+}
+
+@lru_cache(maxsize=1)
 def _get_connection_params() -> Dict[str, Any]:
     """
     Railway 환경에서는 DATABASE_URL 사용,
     로컬 환경에서는 DB_HOST 등 개별 변수 사용.
+
+    환경 변수는 프로세스 수명 동안 바뀌지 않으므로 처음 파싱한 결과를 캐시합니다.
+    풀 생성 시점에 호출되므로 필수 변수가 없어도 모듈 import는 실패하지 않습니다.
     """
     database_url = os.getenv("DATABASE_URL")
 
     if database_url:
         parsed = urlparse(database_url)
         return {
-            "user": parsed.username,
-            "password": parsed.password,
+            # URL에 퍼센트 인코딩된 특수문자(@, : 등)는 원래 문자로 복원
+            "user": unquote(parsed.username) if parsed.username else parsed.username,
+            "password": unquote(parsed.password) if parsed.password else parsed.password,
             "database": parsed.path[1:],  # '/db' → 'db'
             "host": parsed.hostname,
             "port": parsed.port,
@@ -55,19 +71,45 @@ def _get_connection_params() -> Dict[str, Any]:
             "database": db_name,
         }
 
+def _decode_numeric(value: str) -> Any:
+    """
+    numeric 컬럼의 텍스트 표현을 Decimal 대신 int 또는 float로 변환합니다.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    풀에 새 커넥션이 생성될 때마다 호출되어 타입 코덱을 등록합니다.
+    """
+    await conn.set_type_codec(
+        "numeric",
+        encoder=str,
+        decoder=_decode_numeric,
+        schema="pg_catalog",
+        format="text",
+    )
+
 async def get_pool() -> Pool:
     global _pool
     if _pool is None:
         connection_params = _get_connection_params()
         _pool = await asyncpg.create_pool(
             **connection_params,
-            min_size=5,
-            max_size=20,
+            min_size=DB_POOL_MIN,
+            max_size=DB_POOL_MAX,
             timeout=30.0,
             command_timeout=60.0,
-            max_inactive_connection_lifetime=1800.0,
+            max_inactive_connection_lifetime=300.0,
+            max_queries=50_000,
+            # 서비스가 사용하는 SQL 템플릿이 재준비(re-prepare)되지 않도록 넉넉하게 설정
+            statement_cache_size=1024,
+            server_settings=SERVER_SETTINGS,
+            init=_init_connection,
         )
-        print("[INFO] asyncpg 커넥션 풀이 초기화되었습니다.")
+        print(f"[INFO] asyncpg 커넥션 풀이 초기화되었습니다. (min={DB_POOL_MIN}, max={DB_POOL_MAX})")
     return _pool
 
 async def get_connection() -> AsyncGenerator[asyncpg.Connection, None]:
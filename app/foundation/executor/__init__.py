@@ -0,0 +1,3 @@
+from .executors import get_process_pool, get_io_executor, shutdown_executors
+
+__all__ = ["get_process_pool", "get_io_executor", "shutdown_executors"]
@@ -0,0 +1,74 @@
+"""
+CPU/IO 작업 오프로딩을 위한 공용 실행기(Executor) 관리 모듈
+
+이벤트 루프를 막는 작업을 기본 스레드 풀과 분리된 전용 실행기에서 실행하도록 합니다.
+실행기는 처음 사용할 때 생성되며, 애플리케이션 종료 시 shutdown_executors로 정리합니다.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+# 글로벌 프로세스 풀 (GIL에 묶이는 순수 Python CPU 작업용)
+_process_pool: Optional[ProcessPoolExecutor] = None
+# 글로벌 I/O 스레드 풀 (파일 쓰기, 압축 해제 등 블로킹 I/O 작업용)
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+# I/O 스레드 풀 최대 워커 수
+IO_MAX_WORKERS = 32
+
+# 프로세스 풀 워커 시작 방식 (이벤트 루프, 스레드 풀, DB/HTTP 커넥션이 있는 프로세스를 fork하지 않도록 forkserver 사용)
+PROCESS_START_METHOD = "forkserver"
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    CPU 바운드 작업용 프로세스 풀의 싱글턴 인스턴스를 반환합니다.
+
+    워커는 forkserver로 시작하므로 이벤트 루프와 스레드가 실행 중인 현재 프로세스의 잠금 상태를
+    물려받지 않습니다. 제출하는 함수와 인자는 pickle 가능해야 합니다 (모듈 최상위 함수 사용).
+
+    Returns:
+        ProcessPoolExecutor: CPU 코어 수만큼의 워커를 가진 프로세스 풀
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(PROCESS_START_METHOD),
+        )
+        print("[INFO] 프로세스 풀이 초기화되었습니다.")
+    return _process_pool
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    블로킹 I/O 작업용 스레드 풀의 싱글턴 인스턴스를 반환합니다.
+
+    asyncio 기본 실행기(asyncio.to_thread)와 분리되어 있어, 대용량 다운로드 처리가
+    다른 블로킹 호출을 밀어내지 않습니다.
+
+    Returns:
+        ThreadPoolExecutor: I/O 작업용 스레드 풀
+    """
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="io")
+        print("[INFO] I/O 스레드 풀이 초기화되었습니다.")
+    return _io_executor
+
+
+def shutdown_executors() -> None:
+    """
+    생성된 모든 실행기를 종료합니다.
+    """
+    global _process_pool, _io_executor
+    if _io_executor is not None:
+        _io_executor.shutdown(wait=False, cancel_futures=True)
+        _io_executor = None
+        print("[INFO] I/O 스레드 풀이 종료되었습니다.")
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        print("[INFO] 프로세스 풀이 종료되었습니다.")
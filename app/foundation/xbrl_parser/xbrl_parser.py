@@ -1,10 +1,303 @@
+import asyncio
 import re
 import os
+import zlib
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, List, Optional, Any, Union
-from bs4 import BeautifulSoup
+from typing import Tuple, Dict, DefaultDict, List, Optional, Any, Sequence, Union
+from lxml import etree
+import numpy as np
+import orjson
 import pandas as pd
 
+from app.foundation.executor import get_io_executor, get_process_pool
+
+try:
+    from isal import igzip as gzip
+except ImportError:  # python-isal이 없으면 표준 gzip으로 압축/해제
+    import gzip
+
+# XBRL 링크베이스/XLink 네임스페이스와 라벨 파일에서 사용하는 속성의 Clark 표기
+LINKBASE_NS = "http://www.xbrl.org/2003/linkbase"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XLINK_HREF = f"{{{XLINK_NS}}}href"
+XLINK_LABEL = f"{{{XLINK_NS}}}label"
+XLINK_ROLE = f"{{{XLINK_NS}}}role"
+XLINK_FROM = f"{{{XLINK_NS}}}from"
+XLINK_TO = f"{{{XLINK_NS}}}to"
+LINK_LOC = f"{{{LINKBASE_NS}}}loc"
+LINK_LABEL = f"{{{LINKBASE_NS}}}label"
+LINK_LABEL_ARC = f"{{{LINKBASE_NS}}}labelArc"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# 추출하려는 특정 태그 이름 목록 (네임스페이스 접두사:로컬명, 출력 순서 기준)
+ALLOWED_TAGS: Tuple[str, ...] = (
+    "ifrs-full:CurrentAssets",
+    "ifrs-full:CashAndCashEquivalents",
+    "ifrs-full:ShorttermDepositsNotClassifiedAsCashEquivalents",
+    "ifrs-full:CurrentTradeReceivables",
+    "dart:ShortTermOtherReceivablesNet",
+    "ifrs-full:CurrentPrepaidExpenses",
+    "ifrs-full:Inventories",
+    "ifrs-full:OtherCurrentAssets",
+    "ifrs-full:NoncurrentAssets",
+    "ifrs-full:NoncurrentFinancialAssetsMeasuredAtFairValueThroughOtherComprehensiveIncome",
+    "ifrs-full:NoncurrentFinancialAssetsAtFairValueThroughProfitOrLoss",
+    "ifrs-full:InvestmentsInSubsidiariesJointVenturesAndAssociates",
+    "ifrs-full:NoncurrentRecognisedAssetsDefinedBenefitPlan",
+    "ifrs-full:DeferredTaxAssets",
+    "ifrs-full:OtherNoncurrentAssets",
+    "ifrs-full:Assets",
+    "ifrs-full:CurrentLiabilities",
+    "ifrs-full:TradeAndOtherCurrentPayablesToTradeSuppliers",
+    "ifrs-full:OtherCurrentPayables",
+    "ifrs-full:CurrentAdvances",
+    "dart:ShortTermWithholdings",
+    "ifrs-full:AccrualsClassifiedAsCurrent",
+    "ifrs-full:CurrentTaxLiabilities",
+    "ifrs-full:CurrentPortionOfLongtermBorrowings",
+    "ifrs-full:CurrentProvisions",
+    "ifrs-full:OtherCurrentLiabilities",
+    "ifrs-full:NoncurrentLiabilities",
+    "ifrs-full:NoncurrentPortionOfNoncurrentBondsIssued",
+    "ifrs-full:NoncurrentPortionOfNoncurrentLoansReceived",
+    "ifrs-full:OtherNoncurrentPayables",
+    "ifrs-full:NoncurrentProvisions",
+    "ifrs-full:OtherNoncurrentLiabilities",
+    "ifrs-full:Liabilities",
+    "ifrs-full:IssuedCapital",
+    "dart:IssuedCapitalOfPreferredStock",
+    "dart:IssuedCapitalOfCommonStock",
+    "ifrs-full:SharePremium",
+    "ifrs-full:RetainedEarnings",
+    "dart:ElementsOfOtherStockholdersEquity",
+    "ifrs-full:EquityAndLiabilities",
+)
+# 태그 이름(접두사:로컬명) → ALLOWED_TAGS 내 순서 (허용 태그 여부를 O(1)로 확인하는 집합 역할도 겸함)
+ALLOWED_TAG_ORDER: Dict[str, int] = {name: idx for idx, name in enumerate(ALLOWED_TAGS)}
+# iterparse tag 필터: 추출 대상 로컬명만 libxml2 단계에서 골라내어 나머지 요소는 파이썬으로 넘기지 않음
+# (접두사는 문서마다 선언된 URI가 달라 와일드카드로 두고, 아래에서 접두사를 다시 확인)
+XBRL_TAG_FILTER: Tuple[str, ...] = tuple(sorted({f"{{*}}{name.split(':', 1)[1]}" for name in ALLOWED_TAGS}))
+
+# contextRef 회계연도 패턴: FY2023/PFY2023/BPFY2023/CFY2023을 우선하고, 없으면 첫 4자리 숫자(2023, 2023Q1 등)
+# 문자열 시작에 고정한 교대(alternation)라 첫 번째 분기가 전체 문자열에서 실패해야 두 번째 분기를 시도함
+YEAR_PATTERN = re.compile(r'^(?:.*?FY(\d{4})|.*?(\d{4}))', re.DOTALL)
+# float → int64 변환이 정확한 값의 상한 (절댓값 기준)
+INT64_LIMIT = float(2 ** 63)
+# decimals 정수 값 → 단위 라벨 접두사 (그 외 값은 "원")
+UNIT_PREFIXES: Dict[int, str] = {-3: "천원", -4: "만원", -6: "백만원", -8: "억원"}
+
+# 파싱 결과 디스크 캐시 사용 여부 (XBRL_PARSE_CACHE=0이면 매번 다시 파싱)
+PARSE_CACHE_ENABLED = os.getenv("XBRL_PARSE_CACHE", "1") != "0"
+# 캐시 파일 형식 버전 (저장 형식이 바뀌면 올려서 기존 캐시를 무효화)
+PARSE_CACHE_VERSION = 1
+# 원본 파일 옆에 저장하는 캐시 파일 확장자 (원본 확장자를 대체하므로 .xbrl/lab-ko.xml 파일 검색에 걸리지 않음)
+TAG_CACHE_SUFFIX = ".tags.json.gz"
+LABEL_CACHE_SUFFIX = ".labels.json.gz"
+# 추출 대상 태그 목록이 바뀌면 태그 캐시가 무효화되도록 캐시 키에 포함
+TAG_CACHE_FINGERPRINT = zlib.crc32("\n".join(ALLOWED_TAGS).encode())
+
+
+@lru_cache(maxsize=512)
+def _year_from_context(context_ref: str) -> Optional[str]:
+    """
+    contextRef에서 회계연도 문자열을 찾습니다. 한 공시 안에서 같은 contextRef가 반복되므로 결과를 캐시합니다.
+    
+    Args:
+        context_ref: contextRef 값
+        
+    Returns:
+        Optional[str]: 회계연도 (일치하는 패턴이 없으면 None)
+    """
+    match = YEAR_PATTERN.match(context_ref)
+    if match is None:
+        return None
+    return match.group(1) or match.group(2)
+
+
+@lru_cache(maxsize=64)
+def _parse_decimals(decimals: str) -> Optional[int]:
+    """
+    decimals 속성을 정수로 변환합니다. 공시 하나에 등장하는 값은 몇 가지뿐이므로 결과를 캐시합니다.
+    
+    Args:
+        decimals: 소수점 정보 (예: "-6", "INF")
+        
+    Returns:
+        Optional[int]: 소수점 정보 정수 값 (정수로 변환할 수 없으면 None)
+    """
+    try:
+        return int(decimals)
+    except ValueError:
+        print(f"[WARN] 소수점 정보를 처리할 수 없습니다: {decimals}")
+        return None
+
+
+@lru_cache(maxsize=64)
+def _unit_label(decimals: str, unit: str) -> str:
+    """
+    (decimals, unit) 조합에 대한 단위 라벨을 계산합니다. 조합 수가 적어 결과를 캐시합니다.
+    
+    Args:
+        decimals: 소수점 정보 (예: "-6")
+        unit: 원본 단위 (예: "KRW")
+        
+    Returns:
+        str: 변환된 단위 라벨 (예: "백만원 KRW")
+    """
+    if not decimals or not unit:
+        return f"원 {unit}" if unit else "원"
+    
+    try:
+        decimal_value = int(decimals)
+    except ValueError:
+        # 소수점 정보가 정수로 변환될 수 없는 경우
+        print(f"[WARN] 소수점 정보를 해석할 수 없습니다: {decimals}")
+        return f"원 {unit}"
+    
+    # 소수점 정보에 따른 단위 변환
+    return f"{UNIT_PREFIXES.get(decimal_value, '원')} {unit}"
+
+
+@lru_cache(maxsize=1)
+def _list_subdirs(directory: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    디렉토리 바로 아래의 하위 디렉토리 이름 목록을 반환합니다.
+    
+    os.scandir의 DirEntry.is_dir()은 디렉토리 항목 정보를 사용하므로 항목마다 stat을 호출하지 않으며,
+    결과는 (경로, mtime) 기준으로 캐시되어 디렉토리 내용이 바뀌면 다시 읽습니다.
+    
+    Args:
+        directory: 조회할 디렉토리 경로
+        mtime_ns: 디렉토리의 수정 시각 (캐시 키로만 사용)
+        
+    Returns:
+        Tuple[str, ...]: 하위 디렉토리 이름 목록 (디렉토리 항목 순서)
+    """
+    with os.scandir(directory) as entries:
+        return tuple(entry.name for entry in entries if entry.is_dir())
+
+
+def _load_parse_cache(source_path: Path, suffix: str, fingerprint: int = 0) -> Optional[Any]:
+    """
+    원본 파일 옆의 캐시 파일에서 파싱 결과를 읽습니다.
+    
+    원본 파일의 수정 시각/크기, 캐시 형식 버전, fingerprint가 모두 같을 때만 캐시를 사용합니다.
+    
+    Args:
+        source_path: 원본 파일 경로
+        suffix: 캐시 파일 접미사
+        fingerprint: 파싱 조건 식별값 (조건이 바뀌면 캐시 무효화)
+        
+    Returns:
+        Optional[Any]: 캐시된 파싱 결과 (캐시가 없거나 맞지 않으면 None)
+    """
+    if not PARSE_CACHE_ENABLED:
+        return None
+    
+    cache_path = source_path.with_suffix(suffix)
+    try:
+        stat = source_path.stat()
+        with gzip.open(cache_path, "rb") as f:
+            cached = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[WARN] 파싱 캐시를 읽을 수 없어 다시 파싱합니다: {cache_path} ({e})")
+        return None
+    
+    if (cached.get("version") != PARSE_CACHE_VERSION
+            or cached.get("mtime_ns") != stat.st_mtime_ns
+            or cached.get("size") != stat.st_size
+            or cached.get("fingerprint") != fingerprint):
+        return None
+    return cached.get("data")
+
+
+def _save_parse_cache(source_path: Path, suffix: str, data: Any, fingerprint: int = 0) -> None:
+    """
+    파싱 결과를 원본 파일 옆의 캐시 파일에 저장합니다.
+    
+    임시 파일에 쓴 뒤 교체하므로 동시에 읽는 쪽이 쓰다 만 파일을 보지 않으며,
+    저장에 실패해도 파싱 결과 반환에는 영향을 주지 않습니다.
+    
+    Args:
+        source_path: 원본 파일 경로
+        suffix: 캐시 파일 접미사
+        data: 저장할 파싱 결과 (orjson으로 직렬화 가능해야 함)
+        fingerprint: 파싱 조건 식별값
+    """
+    if not PARSE_CACHE_ENABLED:
+        return
+    
+    cache_path = source_path.with_suffix(suffix)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        stat = source_path.stat()
+        payload = orjson.dumps({
+            "version": PARSE_CACHE_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "fingerprint": fingerprint,
+            "data": data,
+        })
+        with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"[WARN] 파싱 캐시 저장 실패: {cache_path} ({e})")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _format_values(values: pd.Series, decimal_values: pd.Series) -> pd.Series:
+    """
+    값 열에 소수점 정보를 적용하여 천단위 쉼표가 포함된 문자열 열로 변환합니다.
+    
+    음수 decimals는 10의 거듭제곱으로 나눈 뒤 정수로 버림하고, 양수 decimals는 해당 자릿수로 표시합니다.
+    숫자로 변환할 수 없는 값은 "0"이 됩니다 (format_number_with_decimals와 같은 규칙).
+    
+    Args:
+        values: 원본 숫자 문자열 열
+        decimal_values: decimals 정수 값 열 (없거나 해석할 수 없으면 NaN)
+        
+    Returns:
+        pandas.Series: 변환된 숫자 문자열 열
+    """
+    numbers = pd.to_numeric(values, errors="coerce").astype(float)
+    
+    # 음수일 경우 (예: -6은 백만 단위)로만 나누고, 그 외는 원래 값 유지
+    scale_down = decimal_values < 0
+    scaled = numbers.where(~scale_down, numbers / 10.0 ** -decimal_values.where(scale_down, 0))
+    
+    valid = np.isfinite(scaled)
+    invalid_values = values[numbers.isna()]
+    for value in invalid_values.unique():
+        print(f"[WARN] 숫자 값으로 변환할 수 없습니다: {value}")
+    
+    formatted = pd.Series("0", index=values.index, dtype=object)
+    # 버림은 numpy에서 한 번에 처리하고, int64 범위 안이면 정수 변환까지 배열 단위로 수행
+    truncated = np.trunc(scaled[valid].to_numpy())
+    if truncated.size and np.abs(truncated).max() < INT64_LIMIT:
+        integers = truncated.astype(np.int64).tolist()
+    else:
+        integers = [int(number) for number in truncated.tolist()]
+    # 천단위 쉼표 포맷은 numpy에 대응 연산이 없으므로 바인딩된 format 메서드를 map으로 적용
+    formatted[valid] = list(map("{:,}".format, integers))
+    
+    # 양수일 경우 (소수점 자릿수만큼 표시)
+    fixed_point = valid & (decimal_values >= 0)
+    if fixed_point.any():
+        formatted[fixed_point] = [
+            f"{number:,.{int(places)}f}"
+            for number, places in zip(numbers[fixed_point].tolist(), decimal_values[fixed_point].tolist())
+        ]
+    
+    return formatted
+
 
 class XBRLParser:
     """
@@ -12,7 +305,7 @@ class XBRLParser:
     
     이 클래스는 다음과 같은 기능을 제공합니다:
     1. 파일 시스템에서 XBRL 파일을 찾고
-    2. BeautifulSoup를 사용하여 XBRL 파일을 파싱하고
+    2. lxml iterparse로 XBRL 인스턴스와 라벨 파일을 스트리밍 파싱하고
     3. 파싱된 데이터를 분석하여 DataFrame으로 변환
     """
 
@@ -28,50 +321,79 @@ class XBRLParser:
         os.makedirs(self.extracted_dir, exist_ok=True)
         print(f"[INFO] XBRL 파일 경로 기본 디렉토리: {self.extracted_dir}")
 
-    async def find_xbrl_files(self, corp_code: str) -> Tuple[Optional[Path], Optional[Path], Optional[BeautifulSoup], Optional[BeautifulSoup]]:
+    async def find_xbrl_files(self, corp_code: str, parse_label: bool = True,
+                              allow_fallback: bool = True) -> Tuple[Path, Optional[Path], Optional[Dict[str, str]]]:
         """
-        기업 고유번호로 디렉토리를 찾고, .xbrl 파일과 lab-ko.xml 파일을 함께 찾아 파싱합니다.
+        기업 고유번호로 디렉토리를 찾고, .xbrl 파일과 lab-ko.xml 파일을 함께 찾습니다.
+        
+        파일 검색은 I/O 스레드 풀에서, 라벨 파일 파싱은 프로세스 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+        .xbrl 파일은 get_xbrl_tags에서 스트리밍으로 파싱하도록 경로만 반환합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            parse_label: False이면 라벨 파일을 파싱하지 않고 경로만 반환 (label_mapping은 None)
+            allow_fallback: False이면 기업 고유번호에 맞는 디렉토리가 없을 때 다른 디렉토리를 쓰지 않고 예외 발생
+            
+        Returns:
+            tuple: (xbrl_path, label_path, label_mapping)
+            
+        Raises:
+            FileNotFoundError: 디렉토리나 XBRL 파일을 찾을 수 없는 경우
+        """
+        loop = asyncio.get_running_loop()
+        xbrl_path, label_path = await loop.run_in_executor(
+            get_io_executor(), self.locate_xbrl_files, corp_code, allow_fallback
+        )
+        
+        label_mapping = None
+        if parse_label and label_path is not None:
+            label_mapping = await loop.run_in_executor(get_process_pool(), self.get_label_ko_mapping, label_path)
+        
+        return xbrl_path, label_path, label_mapping
+
+    def locate_xbrl_files(self, corp_code: str, allow_fallback: bool = True) -> Tuple[Path, Optional[Path]]:
+        """
+        기업 고유번호로 디렉토리를 찾고, .xbrl 파일과 lab-ko.xml 파일 경로를 반환합니다.
+        
+        파일 시스템만 조회하는 블로킹 함수이므로 비동기 코드에서는 find_xbrl_files를 사용합니다.
+        기업 고유번호에 맞는 디렉토리가 없으면 allow_fallback일 때만 가장 최근 디렉토리를 사용하며,
+        결과를 요청한 기업 고유번호로 저장하는 경로에서는 다른 기업의 데이터가 섞이지 않도록 False로 호출합니다.
         
         Args:
             corp_code: 기업 고유번호
+            allow_fallback: False이면 맞는 디렉토리가 없을 때 가장 최근 디렉토리를 쓰지 않고 FileNotFoundError 발생
             
         Returns:
-            tuple: (xbrl_path, label_path, xbrl_soup, label_soup)
+            tuple: (xbrl_path, label_path) - 라벨 파일이 없으면 label_path는 None
             
         Raises:
             FileNotFoundError: 디렉토리나 XBRL 파일을 찾을 수 없는 경우
-            ValueError: XBRL 파일 파싱에 실패한 경우
         """
         # 기업 고유번호로 디렉토리 찾기
         corp_dir = None
         
         try:
-            available_dirs = [d for d in os.listdir(self.extracted_dir) 
-                            if os.path.isdir(self.extracted_dir / d)]
+            # 디렉토리 목록은 기본 디렉토리의 mtime이 바뀔 때(항목 추가/삭제)만 다시 읽음
+            available_dirs = _list_subdirs(str(self.extracted_dir), os.stat(self.extracted_dir).st_mtime_ns)
+            corp_dir = self._match_corp_dir(corp_code, available_dirs)
             
-            print(f"[INFO] 사용 가능한 디렉토리: {available_dirs}")
+            if corp_dir is None:
+                # mtime 해상도보다 짧은 간격으로 만들어진 디렉토리는 캐시된 목록에 없을 수 있으므로,
+                # 대체 디렉토리를 고르기 전에 캐시를 비우고 한 번 더 읽음
+                _list_subdirs.cache_clear()
+                available_dirs = _list_subdirs(str(self.extracted_dir), os.stat(self.extracted_dir).st_mtime_ns)
+                corp_dir = self._match_corp_dir(corp_code, available_dirs)
             
-            # 기업 고유번호로 시작하는 디렉토리 찾기
-            for dir_name in available_dirs:
-                if dir_name.startswith(corp_code):
-                    corp_dir = self.extracted_dir / dir_name
-                    print(f"[INFO] 기업 고유번호 {corp_code}로 시작하는 디렉토리를 찾았습니다: {dir_name}")
-                    break
+            print(f"[INFO] 사용 가능한 디렉토리: {len(available_dirs)}개")
             
-            # 정확한 디렉토리를 찾지 못한 경우
-            if corp_dir is None:
-                # 유사한 디렉토리 찾기 시도
-                for dir_name in available_dirs:
-                    if corp_code in dir_name:
-                        corp_dir = self.extracted_dir / dir_name
-                        print(f"[INFO] 기업 고유번호 {corp_code}가 포함된 디렉토리를 찾았습니다: {dir_name}")
-                        break
-                
-                # 그래도 찾지 못한 경우 가장 최근 디렉토리 사용
-                if corp_dir is None and available_dirs:
-                    dir_name = available_dirs[-1]
-                    corp_dir = self.extracted_dir / dir_name
-                    print(f"[INFO] 기업 고유번호에 맞는 디렉토리를 찾지 못해 가장 최근 디렉토리를 사용합니다: {dir_name}")
+            if corp_dir is None and not allow_fallback:
+                raise FileNotFoundError(f"기업 고유번호 {corp_code}에 해당하는 디렉토리를 찾을 수 없습니다: {self.extracted_dir}")
+            
+            # 그래도 찾지 못한 경우 가장 최근 디렉토리 사용
+            if corp_dir is None and available_dirs:
+                dir_name = available_dirs[-1]
+                corp_dir = self.extracted_dir / dir_name
+                print(f"[INFO] 기업 고유번호에 맞는 디렉토리를 찾지 못해 가장 최근 디렉토리를 사용합니다: {dir_name}")
             
             # 디렉토리를 찾지 못한 경우
             if corp_dir is None:
@@ -91,223 +413,248 @@ class XBRLParser:
             if not label_files:
                 print(f"[WARN] lab-ko.xml 파일을 찾을 수 없습니다: {corp_dir}")
                 label_path = None
-                label_soup = None
             else:
                 label_path = corp_dir / label_files[0]
                 print(f"[INFO] 라벨 파일을 찾았습니다: {label_path}")
-                try:
-                    with open(label_path, "r", encoding="utf-8") as file:
-                        label_content = file.read()
-                    label_soup = BeautifulSoup(label_content, 'xml')
-                    print(f"[INFO] 라벨 파일 파싱 성공")
-                except Exception as e:
-                    print(f"[ERROR] 라벨 파일 파싱 실패: {e}")
-                    label_soup = None
-                    label_path = None
-            
-            # .xbrl 파일 파싱
+            
+            # .xbrl 파일 경로 (파싱은 get_xbrl_tags에서 스트리밍으로 수행)
             xbrl_path = corp_dir / xbrl_files[0]
             print(f"[INFO] XBRL 파일을 찾았습니다: {xbrl_path}")
             
-            try:
-                with open(xbrl_path, "r", encoding="utf-8") as file:
-                    xbrl_content = file.read()
-                
-                # BeautifulSoup으로 XML 파싱
-                try:
-                    xbrl_soup = BeautifulSoup(xbrl_content, 'xml')
-                    parser = 'xml'
-                except:
-                    print("[WARN] XML 파서로 파싱 실패, lxml로 재시도합니다.")
-                    xbrl_soup = BeautifulSoup(xbrl_content, 'lxml')
-                    parser = 'lxml'
-                
-                print(f"[INFO] XBRL 파일을 {parser} 파서로 파싱했습니다.")
-            except Exception as e:
-                raise ValueError(f"XBRL 파일 파싱 실패: {e}")
-            
-            return xbrl_path, label_path, xbrl_soup, label_soup
+            return xbrl_path, label_path
             
         except Exception as e:
-            print(f"[ERROR] XBRL 파일 검색 및 파싱 실패: {e}")
+            print(f"[ERROR] XBRL 파일 검색 실패: {e}")
             raise
 
-    def get_label_ko_mapping(self, label_soup: Optional[BeautifulSoup]) -> Dict[str, str]:
+    def _match_corp_dir(self, corp_code: str, available_dirs: Sequence[str]) -> Optional[Path]:
+        """
+        디렉토리 이름 목록에서 기업 고유번호로 시작하거나, 없으면 기업 고유번호를 포함하는 디렉토리를 찾습니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            available_dirs: 기본 디렉토리의 하위 디렉토리 이름 목록
+            
+        Returns:
+            Optional[Path]: 찾은 디렉토리 경로 (없으면 None)
+        """
+        # 기업 고유번호로 시작하는 디렉토리 찾기
+        for dir_name in available_dirs:
+            if dir_name.startswith(corp_code):
+                print(f"[INFO] 기업 고유번호 {corp_code}로 시작하는 디렉토리를 찾았습니다: {dir_name}")
+                return self.extracted_dir / dir_name
+        
+        # 정확한 디렉토리를 찾지 못한 경우 유사한 디렉토리 찾기 시도
+        for dir_name in available_dirs:
+            if corp_code in dir_name:
+                print(f"[INFO] 기업 고유번호 {corp_code}가 포함된 디렉토리를 찾았습니다: {dir_name}")
+                return self.extracted_dir / dir_name
+        
+        return None
+
+    def get_label_ko_mapping(self, label_path: Optional[Path]) -> Dict[str, str]:
         """
         lab-ko.xml 파일에서 태그명과 한글 라벨 간의 매핑을 추출합니다.
         
+        lxml iterparse로 labelLink 단위로 스트리밍 파싱하며, 처리한 labelLink는 즉시 해제하여
+        라벨 파일 전체 트리를 메모리에 올리지 않습니다. 파일 경로만 받아 결과 딕셔너리를 반환하므로
+        프로세스 풀 워커에서 실행할 수 있습니다.
+        
         Args:
-            label_soup: 파싱된 라벨 파일의 BeautifulSoup 객체
+            label_path: 라벨 파일 경로 (None이면 빈 매핑)
             
         Returns:
             dict: 태그명을 키로, 한글 라벨을 값으로 하는 딕셔너리
         """
-        if label_soup is None:
+        if label_path is None:
             print("[WARN] 라벨 파일이 없어 한글 라벨 매핑을 생성할 수 없습니다.")
             return {}
         
+        # 같은 파일을 다시 파싱하지 않도록 디스크 캐시를 먼저 확인
+        cached_mapping = _load_parse_cache(label_path, LABEL_CACHE_SUFFIX)
+        if cached_mapping is not None:
+            print(f"[INFO] 캐시된 한글 라벨 매핑 {len(cached_mapping)}개를 사용합니다: {label_path.name}")
+            return cached_mapping
+        
         try:
             # 태그명 → 한글 라벨 매핑
             label_mapping = {}
-            
-            # labelLink 요소 찾기
-            label_links = label_soup.find_all('labelLink')
-            if not label_links:
-                print("[WARN] labelLink 요소를 찾을 수 없습니다.")
-                return {}
-            
-            # loc 요소와 label 요소 처리
-            for label_link in label_links:
-                # loc 요소에서 xlink:href와 xlink:label 추출
-                loc_elements = label_link.find_all('loc')
-                loc_dict = {}
-                
-                for loc in loc_elements:
-                    href = loc.get('xlink:href', '')
-                    label = loc.get('xlink:label', '')
-                    
-                    # href에서 태그 이름 추출 (예: #ifrs-full_CurrentAssets)
-                    if href.startswith('#'):
-                        tag_name = href[1:]  # '#' 제거
-                        loc_dict[label] = tag_name
+            link_count = 0
+            
+            # labelLink 요소가 끝날 때마다 처리 (하위 loc, label, labelArc가 모두 읽힌 상태)
+            context = etree.iterparse(
+                str(label_path),
+                events=("end",),
+                tag=f"{{{LINKBASE_NS}}}labelLink",
+                huge_tree=True,
+                recover=True,
+            )
+            for _, label_link in context:
+                link_count += 1
                 
-                # label 요소에서 xlink:label과 텍스트 추출
-                label_elements = label_link.find_all('label')
+                # loc 요소에서 xlink:href와 xlink:label 추출
+                loc_by_label: Dict[str, str] = {}
+                # labelArc 요소 (label 요소와 loc를 연결): xlink:to → xlink:from 목록
+                arcs_from_by_to: DefaultDict[str, List[str]] = defaultdict(list)
+                # 한국어 라벨의 (xlink:label, 텍스트) 목록 (문서 순서 유지)
+                ko_labels: List[Tuple[str, str]] = []
                 
-                for label_elem in label_elements:
-                    label_ref = label_elem.get('xlink:label', '')
-                    lang = label_elem.get('xml:lang', '')
-                    role = label_elem.get('xlink:role', '')
-                    
-                    # 한국어 라벨만 추출 (표준 라벨 역할 고려)
-                    if lang == 'ko' and ('label' in role or 'standard' in role.lower()):
-                        label_text = label_elem.text.strip()
+                # 자식 요소를 한 번만 순회하며 종류별 인덱스를 구성
+                for child in label_link.iterchildren():
+                    child_tag = child.tag
+                    if child_tag == LINK_LOC:
+                        href = child.get(XLINK_HREF, '')
                         
-                        # labelArc 요소를 통해 loc와 label 연결
-                        label_arcs = label_link.find_all('labelArc', {'xlink:to': label_ref})
+                        # href에서 태그 이름 추출 (예: #ifrs-full_CurrentAssets)
+                        if href.startswith('#'):
+                            # '#' 제거 후 네임스페이스 처리 (ifrs-full_CurrentAssets → CurrentAssets)
+                            prefix, sep, local_name = href[1:].partition('_')
+                            loc_by_label[child.get(XLINK_LABEL, '')] = local_name if sep else prefix
+                    elif child_tag == LINK_LABEL_ARC:
+                        arcs_from_by_to[child.get(XLINK_TO)].append(child.get(XLINK_FROM, ''))
+                    elif child_tag == LINK_LABEL:
+                        lang = child.get(XML_LANG, '')
+                        role = child.get(XLINK_ROLE, '')
                         
-                        for arc in label_arcs:
-                            from_ref = arc.get('xlink:from', '')
-                            if from_ref in loc_dict:
-                                tag_name = loc_dict[from_ref]
-                                
-                                # 네임스페이스 처리 (ifrs-full_CurrentAssets → CurrentAssets)
-                                if '_' in tag_name:
-                                    _, tag_name = tag_name.split('_', 1)
-                                
-                                label_mapping[tag_name] = label_text
+                        # 한국어 라벨만 추출 (표준 라벨 역할 고려)
+                        if lang == 'ko' and ('label' in role or 'standard' in role.lower()):
+                            ko_labels.append((child.get(XLINK_LABEL, ''), "".join(child.itertext()).strip()))
+                
+                # label → labelArc → loc 순으로 해시 조회하여 태그명과 한글 라벨을 연결
+                for label_ref, label_text in ko_labels:
+                    for from_ref in arcs_from_by_to.get(label_ref, ()):
+                        tag_name = loc_by_label.get(from_ref)
+                        if tag_name is not None:
+                            label_mapping[tag_name] = label_text
+                
+                # 처리한 labelLink와 이전 형제 요소를 해제
+                label_link.clear()
+                while label_link.getprevious() is not None:
+                    del label_link.getparent()[0]
+            
+            # recover=True이므로 형식 오류는 예외 대신 error_log에 기록됨
+            if context.error_log:
+                print(f"[WARN] 라벨 파일 XML 형식 오류 {len(context.error_log)}건을 복구하며 파싱했습니다: {context.error_log.last_error}")
+            
+            if not link_count:
+                print("[WARN] labelLink 요소를 찾을 수 없습니다.")
+                return {}
             
             print(f"[INFO] 한글 라벨 매핑 {len(label_mapping)}개 생성됨")
+            _save_parse_cache(label_path, LABEL_CACHE_SUFFIX, label_mapping)
             return label_mapping
             
         except Exception as e:
             print(f"[ERROR] 한글 라벨 매핑 추출 실패: {e}")
             return {}
 
-    def get_xbrl_tags(self, xbrl_soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def get_xbrl_tags(self, xbrl_path: Path) -> List[Dict[str, str]]:
         """
         XBRL 파일에서 관련 태그를 추출합니다.
         
+        lxml iterparse로 파일을 스트리밍하며, 처리한 fact 요소는 즉시 해제하여
+        문서 전체 트리를 메모리에 올리지 않습니다. 추출 대상 로컬명은 iterparse의
+        tag 필터로 한 번의 순회에서 골라냅니다.
+        
         Args:
-            xbrl_soup: 파싱된 XBRL 파일의 BeautifulSoup 객체
+            xbrl_path: XBRL 인스턴스 파일 경로
             
         Returns:
             list[dict]: 추출된 태그 정보 목록 (항목명, 값, contextRef, 단위, 소수점 포함)
         """
-        # 추출하려는 특정 태그 이름 목록 (네임스페이스 포함)
-        allowed_tags = [
-            "ifrs-full:CurrentAssets",
-            "ifrs-full:CashAndCashEquivalents",
-            "ifrs-full:ShorttermDepositsNotClassifiedAsCashEquivalents",
-            "ifrs-full:CurrentTradeReceivables",
-            "dart:ShortTermOtherReceivablesNet",
-            "ifrs-full:CurrentPrepaidExpenses",
-            "ifrs-full:Inventories",
-            "ifrs-full:OtherCurrentAssets",
-            "ifrs-full:NoncurrentAssets",
-            "ifrs-full:NoncurrentFinancialAssetsMeasuredAtFairValueThroughOtherComprehensiveIncome",
-            "ifrs-full:NoncurrentFinancialAssetsAtFairValueThroughProfitOrLoss",
-            "ifrs-full:InvestmentsInSubsidiariesJointVenturesAndAssociates",
-            "ifrs-full:NoncurrentRecognisedAssetsDefinedBenefitPlan",
-            "ifrs-full:DeferredTaxAssets",
-            "ifrs-full:OtherNoncurrentAssets",
-            "ifrs-full:Assets",
-            "ifrs-full:CurrentLiabilities",
-            "ifrs-full:TradeAndOtherCurrentPayablesToTradeSuppliers",
-            "ifrs-full:OtherCurrentPayables",
-            "ifrs-full:CurrentAdvances",
-            "dart:ShortTermWithholdings",
-            "ifrs-full:AccrualsClassifiedAsCurrent",
-            "ifrs-full:CurrentTaxLiabilities",
-            "ifrs-full:CurrentPortionOfLongtermBorrowings",
-            "ifrs-full:CurrentProvisions",
-            "ifrs-full:OtherCurrentLiabilities",
-            "ifrs-full:NoncurrentLiabilities",
-            "ifrs-full:NoncurrentPortionOfNoncurrentBondsIssued",
-            "ifrs-full:NoncurrentPortionOfNoncurrentLoansReceived",
-            "ifrs-full:OtherNoncurrentPayables",
-            "ifrs-full:NoncurrentProvisions",
-            "ifrs-full:OtherNoncurrentLiabilities",
-            "ifrs-full:Liabilities",
-            "ifrs-full:IssuedCapital",
-            "dart:IssuedCapitalOfPreferredStock",
-            "dart:IssuedCapitalOfCommonStock",
-            "ifrs-full:SharePremium",
-            "ifrs-full:RetainedEarnings",
-            "dart:ElementsOfOtherStockholdersEquity",
-            "ifrs-full:EquityAndLiabilities"
-        ]
+        # 같은 파일을 다시 파싱하지 않도록 디스크 캐시를 먼저 확인
+        cached_tags = _load_parse_cache(xbrl_path, TAG_CACHE_SUFFIX, TAG_CACHE_FINGERPRINT)
+        if cached_tags is not None:
+            print(f"[INFO] 캐시된 XBRL 태그 {len(cached_tags)}개를 사용합니다: {xbrl_path.name}")
+            return cached_tags
         
         try:
-            print(f"[INFO] 추출할 태그 목록: {len(allowed_tags)} 개")
-            
-            # 태그 이름을 정확히 매칭하여 추출
-            extracted_tags = []
+            print(f"[INFO] 추출할 태그 목록: {len(ALLOWED_TAGS)} 개")
+            
+            # 태그별로 모은 뒤 ALLOWED_TAGS 순서대로 이어 붙여 기존 출력 순서를 유지
+            tags_by_order: List[List[Dict[str, str]]] = [[] for _ in ALLOWED_TAGS]
+            # 네임스페이스 URI → 문서에서 선언된 접두사
+            prefixes: Dict[str, str] = {}
+            # 요소 태그('{URI}로컬명') → (ALLOWED_TAGS 내 순서, 로컬명) 또는 None
+            # 같은 태그의 fact가 반복되므로 QName 해석은 태그 종류마다 한 번만 수행
+            resolved: Dict[str, Optional[Tuple[int, str]]] = {}
             processed_count = 0
             filtered_count = 0
             
-            for tag_name in allowed_tags:
-                # 해당 태그 이름을 가진 모든 요소 찾기
-                matching_tags = xbrl_soup.find_all(tag_name)
+            context = etree.iterparse(
+                str(xbrl_path),
+                events=("start-ns", "end"),
+                tag=XBRL_TAG_FILTER,
+                huge_tree=True,
+                remove_blank_text=True,
+                recover=True,
+            )
+            for event, item in context:
+                if event == "start-ns":
+                    prefix, uri = item
+                    prefixes.setdefault(uri, prefix)
+                    continue
                 
-                if matching_tags:
-                    for tag in matching_tags:
-                        # 네임스페이스(콜론) 처리
-                        if ':' in tag.name:
-                            namespace, local_name = tag.name.split(':', 1)
-                        else:
-                            local_name = tag.name
-                        
+                tag = item
+                parent = tag.getparent()
+                
+                # 루트 바로 아래의 fact 요소만 처리 (하위 요소는 부모와 함께 해제됨)
+                # 필터에 걸리지 않은 context/unit 등 형제 요소는 다음 대상 fact에서 함께 해제됨
+                if parent is None or parent.getparent() is not None:
+                    continue
+                
+                element_tag = tag.tag
+                try:
+                    match = resolved[element_tag]
+                except KeyError:
+                    match = None
+                    # 로컬명은 필터에서 이미 일치하므로 접두사까지 포함한 이름으로 확인
+                    qname = etree.QName(element_tag)
+                    order = ALLOWED_TAG_ORDER.get(f"{prefixes.get(qname.namespace, '')}:{qname.localname}")
+                    if order is not None:
+                        match = (order, qname.localname)
+                    resolved[element_tag] = match
+                
+                if match is not None:
+                    # contextRef 속성
+                    context_ref = tag.get('contextRef')
+                    
+                    # 별도재무제표(SeparateMember)가 포함된 항목만 필터링
+                    # 대부분의 fact가 여기서 걸러지므로 값/단위/소수점은 통과한 항목에서만 읽음
+                    if context_ref and 'SeparateMember' in context_ref:
                         # 값 (텍스트 내용)
-                        value = tag.text.strip() if tag.text else ""
-                        
-                        # contextRef 속성
-                        context_ref = tag.get('contextRef', '')
-                        
-                        # 별도재무제표(SeparateMember)가 포함된 항목만 필터링
-                        if 'SeparateMember' not in context_ref:
-                            continue
-                        
-                        # 단위 (unitRef 속성)
-                        unit_ref = tag.get('unitRef', '')
-                        
-                        # 수치 정보에 포함된 소수점 정보 (decimals 속성)
-                        decimals = tag.get('decimals', '')
+                        text = tag.text
+                        value = text.strip() if text else ""
                         
                         # 데이터가 모두 있는 경우만 추가
-                        if value and context_ref:
-                            extracted_tags.append({
-                                "항목명": local_name,
+                        if value:
+                            order, localname = match
+                            tags_by_order[order].append({
+                                "항목명": localname,
                                 "값": value,
                                 "contextRef": context_ref,
-                                "단위": unit_ref,
-                                "소수점": decimals
+                                # 단위 (unitRef 속성)
+                                "단위": tag.get('unitRef', ''),
+                                # 수치 정보에 포함된 소수점 정보 (decimals 속성)
+                                "소수점": tag.get('decimals', '')
                             })
                             processed_count += 1
                             filtered_count += 1
+                
+                # 처리한 요소와 이전 형제 요소를 해제하여 메모리 사용량을 일정하게 유지
+                tag.clear()
+                while tag.getprevious() is not None:
+                    del parent[0]
+            
+            # recover=True이므로 형식 오류는 예외 대신 error_log에 기록됨
+            if context.error_log:
+                print(f"[WARN] XBRL 파일 XML 형식 오류 {len(context.error_log)}건을 복구하며 파싱했습니다: {context.error_log.last_error}")
+            
+            extracted_tags = [tag for tags in tags_by_order for tag in tags]
             
             print(f"[INFO] 추출된 총 항목 수: {processed_count}")
             print(f"[INFO] 별도재무제표(SeparateMember) 항목 수: {filtered_count}")
+            _save_parse_cache(xbrl_path, TAG_CACHE_SUFFIX, extracted_tags, TAG_CACHE_FINGERPRINT)
             return extracted_tags
             
         except Exception as e:
@@ -325,23 +672,12 @@ class XBRLParser:
             str: 추출된 회계연도 (예: "2023")
         """
         try:
-            # 회계연도 패턴 정규식
-            year_patterns = [
-                r'FY(\d{4})',         # FY2023
-                r'PFY(\d{4})',        # PFY2023
-                r'BPFY(\d{4})',       # BPFY2023
-                r'CFY(\d{4})',        # CFY2023
-                r'(\d{4})(?:Q[1-4])?'  # 2023 또는 2023Q1, 2023Q2 등
-            ]
-            
-            for pattern in year_patterns:
-                match = re.search(pattern, context_ref)
-                if match:
-                    return match.group(1)
-            
-            # 일치하는 패턴이 없는 경우
-            print(f"[WARN] contextRef에서 회계연도를 추출할 수 없습니다: {context_ref}")
-            return "N/A"
+            year = _year_from_context(context_ref)
+            if year is None:
+                # 일치하는 패턴이 없는 경우
+                print(f"[WARN] contextRef에서 회계연도를 추출할 수 없습니다: {context_ref}")
+                return "N/A"
+            return year
             
         except Exception as e:
             print(f"[ERROR] 회계연도 추출 실패: {e}")
@@ -358,28 +694,7 @@ class XBRLParser:
         Returns:
             str: 변환된 단위 라벨 (예: "백만원 KRW")
         """
-        try:
-            if not decimals or not unit:
-                return f"원 {unit}" if unit else "원"
-                
-            decimal_value = int(decimals)
-            
-            # 소수점 정보에 따른 단위 변환
-            if decimal_value == -3:
-                return f"천원 {unit}"
-            elif decimal_value == -4:
-                return f"만원 {unit}"
-            elif decimal_value == -6:
-                return f"백만원 {unit}"
-            elif decimal_value == -8:
-                return f"억원 {unit}"
-            else:
-                return f"원 {unit}"
-                
-        except ValueError:
-            # 소수점 정보가 정수로 변환될 수 없는 경우
-            print(f"[WARN] 소수점 정보를 해석할 수 없습니다: {decimals}")
-            return f"원 {unit}" if unit else "원"
+        return _unit_label(decimals, unit)
     
     def format_number_with_decimals(self, value: str, decimals: str) -> str:
         """
@@ -398,19 +713,16 @@ class XBRLParser:
             
             # decimals 값이 있는 경우 처리
             if decimals:
-                try:
-                    decimal_value = int(decimals)
-                    
+                decimal_value = _parse_decimals(decimals)
+                
+                if decimal_value is not None:
                     # 음수일 경우 (예: "-6"은 백만 단위)
                     if decimal_value < 0:
-                        divider = 10 ** abs(decimal_value)
-                        num_value = num_value / divider
+                        num_value = num_value / (10 ** -decimal_value)
                     # 양수일 경우 (소수점 자릿수)
                     else:
                         # 소수점 자릿수만큼 표시
                         return f"{num_value:,.{decimal_value}f}"
-                except ValueError:
-                    print(f"[WARN] 소수점 정보를 처리할 수 없습니다: {decimals}")
             
             # 천단위 쉼표가 포함된 문자열로 변환 (소수점 없음)
             return f"{int(num_value):,}"
@@ -418,81 +730,259 @@ class XBRLParser:
             print(f"[WARN] 숫자 값으로 변환할 수 없습니다: {value}")
             return "0"
         
-    async def extract_xbrl_to_dataframe(self, corp_code: str) -> pd.DataFrame:
+    def _refine_columns(self, extracted_tags: List[Dict[str, str]],
+                        label_mapping: Dict[str, str]) -> Tuple[List[str], List[str], List[str], List[str]]:
         """
-        기업 고유번호로 디렉토리를 찾아 XBRL 파일과 lab-ko.xml 파일을 파싱하고,
-        XBRL 데이터를 추출하여 정제된 DataFrame으로 변환합니다.
+        get_xbrl_tags 결과를 한글 라벨, 포맷된 값, 연도, 단위 열로 정제합니다.
+        
+        행마다 헬퍼 메서드를 호출하는 대신 열 단위 pandas 연산으로 처리하며,
+        결과는 행 단위 헬퍼(format_number_with_decimals 등)를 적용한 것과 같습니다.
+        
+        Args:
+            extracted_tags: get_xbrl_tags가 반환한 태그 정보 목록
+            label_mapping: 태그명 → 한글 라벨 매핑
+            
+        Returns:
+            tuple: (항목명, 값, 연도, 단위) 열 리스트
+        """
+        tags = pd.DataFrame.from_records(extracted_tags)
+        
+        # 태그명에 해당하는 한글 라벨 찾기 (매핑이 없으면 원본 사용)
+        item_names = tags["항목명"]
+        ko_labels = item_names.map(label_mapping).fillna(item_names)
+        
+        # 연도 추출 (공시 하나의 contextRef는 수십 가지뿐이므로 고유값별로 한 번만 계산한 조회표 사용)
+        context_refs = tags["contextRef"]
+        year_by_context = {context_ref: _year_from_context(context_ref) for context_ref in context_refs.unique()}
+        for context_ref, year in year_by_context.items():
+            if year is None:
+                print(f"[WARN] contextRef에서 회계연도를 추출할 수 없습니다: {context_ref}")
+        years = context_refs.map(year_by_context).fillna("N/A")
+        
+        # decimals 문자열 → 정수 (공시마다 몇 가지 값뿐이므로 고유값만 변환한 조회표 사용)
+        decimals = tags["소수점"]
+        decimal_values = decimals.map({d: _parse_decimals(d) for d in decimals.unique() if d}).astype(float)
+        
+        # 값 변환 (소수점 정보 적용, 천단위 쉼표 포함)
+        formatted_values = _format_values(tags["값"], decimal_values)
+        
+        # 단위 변환 (decimals 값에 따라, 단위가 없으면 "원")
+        unit_refs = tags["단위"]
+        unit_prefixes = decimal_values.map(UNIT_PREFIXES).fillna("원")
+        units = (unit_prefixes + " " + unit_refs).where(unit_refs != "", "원")
+        
+        return ko_labels.tolist(), formatted_values.tolist(), years.tolist(), units.tolist()
+    
+    def refine_xbrl_tags(self, corp_code: str, extracted_tags: List[Dict[str, str]],
+                         label_mapping: Dict[str, str]) -> pd.DataFrame:
+        """
+        get_xbrl_tags 결과를 한글 라벨, 연도, 단위, 포맷된 값으로 정제한 DataFrame으로 변환합니다.
+        
+        DataFrame이 필요한 호출자(extract_xbrl_to_dataframe)용이며,
+        레코드 리스트만 필요하면 refine_xbrl_records를 사용합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            extracted_tags: get_xbrl_tags가 반환한 태그 정보 목록
+            label_mapping: 태그명 → 한글 라벨 매핑
+            
+        Returns:
+            pandas.DataFrame: 기업코드, 항목명, 값, 연도, 단위 열을 가진 DataFrame
+        """
+        ko_labels, formatted_values, years, units = self._refine_columns(extracted_tags, label_mapping)
+        
+        # 정제된 데이터 (기업코드 추가 및 항목명(한글) -> 항목명으로 변경)
+        return pd.DataFrame({
+            "기업코드": corp_code,
+            "항목명": ko_labels,
+            "값": formatted_values,
+            "연도": years,
+            "단위": units,
+        })
+    
+    def refine_xbrl_records(self, corp_code: str, extracted_tags: List[Dict[str, str]],
+                            label_mapping: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        get_xbrl_tags 결과를 정제하여 DataFrame을 거치지 않고 레코드 리스트로 변환합니다.
+        
+        정제한 열 리스트를 바로 묶어 딕셔너리를 만들므로 결과 DataFrame 생성과
+        to_dict(orient="records") 변환을 생략합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            extracted_tags: get_xbrl_tags가 반환한 태그 정보 목록
+            label_mapping: 태그명 → 한글 라벨 매핑
+            
+        Returns:
+            list[dict]: 기업코드, 항목명, 값, 연도, 단위를 담은 레코드 리스트
+        """
+        ko_labels, formatted_values, years, units = self._refine_columns(extracted_tags, label_mapping)
+        return [
+            {"기업코드": corp_code, "항목명": label, "값": value, "연도": year, "단위": unit}
+            for label, value, year, unit in zip(ko_labels, formatted_values, years, units)
+        ]
+    
+    async def _parse_filing(self, corp_code: str,
+                            allow_fallback: bool = True) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+        """
+        기업 고유번호로 XBRL 파일과 lab-ko.xml 파일을 찾아 프로세스 풀에서 병렬로 파싱합니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            allow_fallback: False이면 기업 고유번호에 맞는 디렉토리가 없을 때 FileNotFoundError 발생
+            
+        Returns:
+            tuple: (get_xbrl_tags 결과, 태그명 → 한글 라벨 매핑)
+        """
+        # XBRL 파일과 라벨 파일 경로 찾기 (파싱은 아래에서 병렬로 수행)
+        xbrl_path, label_path, _ = await self.find_xbrl_files(
+            corp_code, parse_label=False, allow_fallback=allow_fallback
+        )
+        
+        # 인스턴스 파일과 라벨 파일은 서로 독립적이므로 프로세스 풀에서 동시에 파싱
+        # (이벤트 루프를 막지 않고, 두 CPU 바운드 파싱이 GIL을 나눠 쓰지 않음)
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        extracted_tags, label_mapping = await asyncio.gather(
+            loop.run_in_executor(pool, self.get_xbrl_tags, xbrl_path),
+            loop.run_in_executor(pool, self.get_label_ko_mapping, label_path),
+        )
+        return extracted_tags, label_mapping
+    
+    async def extract_xbrl_frame(self, corp_code: str) -> pd.DataFrame:
+        """
+        기업 고유번호로 XBRL 파일과 lab-ko.xml 파일을 병렬로 파싱하여 정제된 DataFrame을 만듭니다.
         
         Args:
             corp_code: 기업 고유번호 (예: 20250331002860_11011)
             
         Returns:
-            pandas.DataFrame: XBRL 데이터 기업코드, 항목명, 값, 연도, 단위 정보
+            pandas.DataFrame: 기업코드, 항목명, 값, 연도, 단위 열 (추출된 태그가 없으면 빈 DataFrame)
+        """
+        extracted_tags, label_mapping = await self._parse_filing(corp_code)
+        
+        if not extracted_tags:
+            print("[WARN] 추출된 태그가 없습니다.")
+            return pd.DataFrame()
+        
+        return self.refine_xbrl_tags(corp_code, extracted_tags, label_mapping)
+    
+    def extract_filing_records(self, corp_code: str, xbrl_path: Path,
+                               label_path: Optional[Path]) -> List[Dict[str, str]]:
+        """
+        공시 하나의 XBRL 파일과 라벨 파일을 파싱하고 정제한 레코드 리스트를 반환합니다.
+        
+        파싱부터 정제까지 한 번에 수행하는 동기 함수이므로, 여러 공시를 일괄 처리할 때
+        공시 단위로 프로세스 풀 워커에 넘겨 결과 레코드만 돌려받습니다.
+        
+        Args:
+            corp_code: 기업 고유번호
+            xbrl_path: XBRL 인스턴스 파일 경로
+            label_path: 라벨 파일 경로 (None이면 태그명을 그대로 사용)
             
-        Raises:
-            FileNotFoundError: 디렉토리나 XBRL 파일을 찾을 수 없는 경우
-            ValueError: XBRL 파일 파싱에 실패한 경우
+        Returns:
+            list[dict]: 기업코드, 항목명, 값, 연도, 단위를 담은 레코드 리스트
         """
-        try:
-            # XBRL 파일과 라벨 파일 찾아서 파싱
-            _, _, xbrl_soup, label_soup = await self.find_xbrl_files(corp_code)
+        extracted_tags = self.get_xbrl_tags(xbrl_path)
+        if not extracted_tags:
+            print(f"[WARN] {corp_code}: 추출된 태그가 없습니다.")
+            return []
+        
+        label_mapping = self.get_label_ko_mapping(label_path)
+        return self.refine_xbrl_records(corp_code, extracted_tags, label_mapping)
+    
+    async def extract_xbrl_records_bulk(self, corp_codes: Sequence[str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        여러 기업의 XBRL 레코드를 프로세스 풀에서 공시 단위로 병렬 추출합니다.
+        
+        공시마다 파싱과 정제를 하나의 워커 작업으로 실행하므로, 공시 수가 많을수록
+        CPU 코어 수만큼 동시에 처리됩니다. 실패한 기업은 빈 리스트로 반환합니다.
+        
+        Args:
+            corp_codes: 기업 고유번호 목록 (중복은 한 번만 처리)
+            
+        Returns:
+            dict: 기업 고유번호 → 레코드 리스트 (요청 순서 유지)
+        """
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        io_executor = get_io_executor()
+        
+        async def extract_one(corp_code: str) -> List[Dict[str, str]]:
+            try:
+                # 결과는 요청한 기업 고유번호로 저장되므로 다른 기업 디렉토리로 대체하지 않음
+                xbrl_path, label_path = await loop.run_in_executor(
+                    io_executor, self.locate_xbrl_files, corp_code, False
+                )
+                return await loop.run_in_executor(pool, self.extract_filing_records, corp_code, xbrl_path, label_path)
+            except Exception as e:
+                print(f"[ERROR] {corp_code} XBRL 레코드 추출 실패: {e}")
+                return []
+        
+        unique_codes = list(dict.fromkeys(corp_codes))
+        results = await asyncio.gather(*(extract_one(corp_code) for corp_code in unique_codes))
+        
+        print(f"[INFO] {len(unique_codes)}개 기업 XBRL 레코드 일괄 추출 완료")
+        return dict(zip(unique_codes, results))
+    
+    async def extract_xbrl_records(self, corp_code: str) -> List[Dict[str, str]]:
+        """
+        기업 고유번호로 디렉토리를 찾아 XBRL 파일과 lab-ko.xml 파일을 파싱하고,
+        XBRL 데이터를 추출하여 정제된 레코드 리스트로 변환합니다.
+        
+        Args:
+            corp_code: 기업 고유번호 (예: 20250331002860_11011)
             
-            # 태그 정보 추출
-            extracted_tags = self.get_xbrl_tags(xbrl_soup)
+        Returns:
+            list[dict]: 기업코드, 항목명, 값, 연도, 단위를 담은 레코드 리스트 (실패 시 빈 리스트)
+        """
+        try:
+            # 레코드는 요청한 기업 고유번호로 DB에 저장되므로 다른 기업 디렉토리로 대체하지 않음
+            extracted_tags, label_mapping = await self._parse_filing(corp_code, allow_fallback=False)
             
             if not extracted_tags:
                 print("[WARN] 추출된 태그가 없습니다.")
-                return pd.DataFrame()
+                return []
             
-            # 태그명 → 한글 라벨 매핑 가져오기
-            label_mapping = self.get_label_ko_mapping(label_soup)
+            # DataFrame을 거치지 않고 정제한 열을 바로 레코드로 묶음
+            refined_data = self.refine_xbrl_records(corp_code, extracted_tags, label_mapping)
             
-            # 정제된 데이터 준비
-            refined_data = []
+            if refined_data:
+                print(f"[INFO] 정제된 XBRL 레코드 {len(refined_data)}개 생성됨")
+            return refined_data
             
-            for tag in extracted_tags:
-                # 태그명에 해당하는 한글 라벨 찾기
-                item_name = tag["항목명"]
-                ko_label = label_mapping.get(item_name, item_name)  # 매핑이 없으면 원본 사용
-                
-                # 값 변환 (소수점 정보 적용, 천단위 쉼표 포함)
-                raw_value = tag["값"]
-                decimals = tag["소수점"]
-                formatted_value = self.format_number_with_decimals(raw_value, decimals)
-                
-                # 연도 추출
-                context_ref = tag["contextRef"]
-                year = self.extract_year_from_context(context_ref)
-                
-                # 단위 변환 (decimals 값에 따라)
-                unit_ref = tag["단위"]
-                formatted_unit = self.decimals_to_unit_label(decimals, unit_ref)
-                
-                # 정제된 데이터 추가 (기업코드 추가 및 항목명(한글) -> 항목명으로 변경)
-                refined_data.append({
-                    "기업코드": corp_code,
-                    "항목명": ko_label,
-                    "값": formatted_value,
-                    "연도": year,
-                    "단위": formatted_unit
-                })
-            
-            # 정제된 정보로 DataFrame 생성
-            df = pd.DataFrame(refined_data)
-            
-            # 결과 정보 출력
-            print(f"[INFO] 정제된 DataFrame 열: {df.columns.tolist()}")
-            print("\n===== 추출된 XBRL 데이터 =====")
-            # 최대 10개 항목만 출력
-            max_rows = min(10, len(df))
-            if not df.empty:
-                print(df.head(max_rows))
-            else:
-                print("추출된 데이터가 없습니다.")
-            print("==================================\n")
-            
-            return df
+        except Exception as e:
+            print(f"[ERROR] XBRL 레코드 추출 실패: {e}")
+            return []
+        
+    async def extract_xbrl_to_dataframe(self, corp_code: str) -> pd.DataFrame:
+        """
+        기업 고유번호로 디렉토리를 찾아 XBRL 파일과 lab-ko.xml 파일을 파싱하고,
+        XBRL 데이터를 추출하여 정제된 DataFrame으로 변환합니다.
+        
+        레코드 리스트만 필요하면 extract_xbrl_records를 사용합니다.
+        
+        Args:
+            corp_code: 기업 고유번호 (예: 20250331002860_11011)
             
+        Returns:
+            pandas.DataFrame: XBRL 데이터 기업코드, 항목명, 값, 연도, 단위 정보
+        """
+        try:
+            df = await self.extract_xbrl_frame(corp_code)
         except Exception as e:
-            print(f"[ERROR] XBRL 데이터프레임 추출 실패: {e}")
-            return pd.DataFrame() 
\ No newline at end of file
+            print(f"[ERROR] XBRL 레코드 추출 실패: {e}")
+            df = pd.DataFrame()
+        
+        # 결과 정보 출력
+        print(f"[INFO] 정제된 DataFrame 열: {df.columns.tolist()}")
+        print("\n===== 추출된 XBRL 데이터 =====")
+        # 최대 10개 항목만 출력
+        max_rows = min(10, len(df))
+        if not df.empty:
+            print(df.head(max_rows))
+        else:
+            print("추출된 데이터가 없습니다.")
+        print("==================================\n")
+        
+        return df
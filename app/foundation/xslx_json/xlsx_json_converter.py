@@ -1,9 +1,83 @@
 import os
+import numpy as np
+import orjson
 import pandas as pd
 import re
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Dict, List, Any, Optional, Union, Tuple
 from pathlib import Path
+from pandas.io.parsers import TextParser
+
+try:
+    import python_calamine  # noqa: F401
+    # Rust 기반 calamine 엔진으로 xlsx/xls 모두 처리
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:  # python-calamine이 없으면 pandas가 확장자에 맞는 엔진(openpyxl/xlrd)을 선택
+    EXCEL_ENGINE = None
+
+# 날짜 패턴 정규식 (예: 2023-12-31, 2023.12, 2023년 12월 31일)
+DATE_PATTERN = re.compile(r'(\d{4})[-./년]?\s*(\d{1,2})[-./월]?\s*(\d{1,2}일?)?')
+
+# 변환 결과 JSON 직렬화 옵션 (숫자/날짜 열 이름과 numpy 값 허용)
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_default(value: Any) -> Any:
+    """
+    orjson이 직접 직렬화하지 못하는 pandas 값을 JSON 호환 값으로 변환
+    
+    Args:
+        value: 직렬화할 값
+        
+    Returns:
+        Any: JSON 호환 값
+        
+    Raises:
+        TypeError: 변환할 수 없는 타입인 경우
+    """
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, pd.Timedelta):
+        return value.total_seconds()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_key(key: Any) -> Any:
+    """
+    orjson이 키로 쓸 수 없는 열 이름(Timestamp 등)을 문자열로 변환
+    
+    Args:
+        key: 딕셔너리 키
+        
+    Returns:
+        Any: JSON 키로 사용할 수 있는 값
+    """
+    if isinstance(key, (date, time)):
+        return key.isoformat()
+    if key is None or isinstance(key, (str, int, float, bool)):
+        return key
+    return str(key)
+
+
+def _stringify_keys(value: Any) -> Any:
+    """
+    중첩된 딕셔너리/리스트의 모든 키를 JSON 키로 사용할 수 있는 값으로 변환
+    
+    Args:
+        value: 변환할 값
+        
+    Returns:
+        Any: 키가 변환된 값
+    """
+    if isinstance(value, dict):
+        return {_json_key(key): _stringify_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_stringify_keys(item) for item in value]
+    return value
 
 
 class XlsxJsonConverter:
@@ -31,9 +105,9 @@ class XlsxJsonConverter:
             if not (file_path.endswith('.xlsx') or file_path.endswith('.xls')):
                 return {"error": "Unsupported file format. Only .xlsx and .xls files are supported."}
             
-            # 엑셀 파일 로드
+            # 엑셀 파일 로드 (가능하면 calamine 엔진 사용)
             excel_data = {}
-            xls = pd.ExcelFile(file_path)
+            xls = pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
             
             # 변환할 시트 결정
             sheets_to_convert = specific_sheets if specific_sheets else xls.sheet_names
@@ -56,6 +130,38 @@ class XlsxJsonConverter:
         except Exception as e:
             return {"error": f"Error converting Excel to JSON: {str(e)}"}
     
+    @staticmethod
+    def convert_file_to_json(file_path: str, specific_sheets: Optional[List[str]] = None) -> bytes:
+        """
+        엑셀 파일을 변환한 결과를 JSON 바이트로 직렬화하여 반환
+        프로세스 풀 워커에서 직렬화까지 마치면 결과 딕셔너리 대신 바이트만 주고받으면 됨
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            specific_sheets: 특정 시트만 변환하고 싶을 경우 시트명 리스트 (None이면 모든 시트 변환)
+            
+        Returns:
+            bytes: convert_file 결과의 JSON 바이트
+        """
+        return XlsxJsonConverter.to_json_bytes(XlsxJsonConverter.convert_file(file_path, specific_sheets))
+    
+    @staticmethod
+    def to_json_bytes(result: Dict[str, Any]) -> bytes:
+        """
+        변환 결과를 orjson으로 직렬화 (NaN은 null, 날짜는 ISO 8601 문자열)
+        
+        Args:
+            result: convert_file 변환 결과
+            
+        Returns:
+            bytes: JSON 바이트
+        """
+        try:
+            return orjson.dumps(result, default=_json_default, option=ORJSON_OPTIONS)
+        except TypeError:
+            # 열 이름에 Timestamp처럼 orjson이 키로 쓸 수 없는 값이 있으면 키를 변환한 뒤 다시 직렬화
+            return orjson.dumps(_stringify_keys(result), default=_json_default, option=ORJSON_OPTIONS)
+    
     @staticmethod
     def _process_sheet_with_date_columns(xls: pd.ExcelFile, sheet_name: str) -> List[Dict[str, Any]]:
         """
@@ -69,14 +175,20 @@ class XlsxJsonConverter:
         Returns:
             List[Dict]: 시트 데이터를 JSON 형식으로 변환한 결과
         """
-        # 첫 몇 줄 건너뛰는 경우를 대비해 여러 옵션 시도
+        # 시트는 한 번만 파싱하고, 엑셀 리더가 넘겨준 셀 값(빈 셀은 빈 문자열) 그대로의 행 목록을 사용
+        # (na_filter=False로 NaN 변환과 fillna 복사본 없이 읽고, 결측값 처리는 헤더를 정한 뒤 한 번만 수행)
+        raw = pd.read_excel(xls, sheet_name=sheet_name, header=None, dtype=object, na_filter=False)
+        rows = raw.to_numpy().tolist()
+        del raw
+        
+        # 첫 몇 줄 건너뛰는 경우를 대비해 여러 옵션 시도 (재파싱 없이 메모리에서 헤더 행만 바꿔 구성)
         df = None
         skiprows_options = [0, 1, 2, 3, 4, 5]
         
         # 각 skiprows 옵션을 시도하여 가장 의미 있는 데이터가 있는 형태로 로드
         for skiprows in skiprows_options:
             try:
-                temp_df = pd.read_excel(xls, sheet_name=sheet_name, skiprows=skiprows)
+                temp_df = XlsxJsonConverter._frame_from_rows(rows, skiprows)
                 
                 # 빈 데이터프레임이면 다음 옵션으로
                 if temp_df.empty:
@@ -90,12 +202,12 @@ class XlsxJsonConverter:
                 if not temp_df.iloc[:, 0].dropna().empty:
                     df = temp_df
                     break
-            except:
+            except Exception:
                 continue
         
         # 모든 옵션이 실패하면 기본 옵션으로 로드
         if df is None:
-            df = pd.read_excel(xls, sheet_name=sheet_name)
+            df = XlsxJsonConverter._frame_from_rows(rows, 0)
         
         # NaN 값을 빈 문자열로 대체
         df = df.fillna("")
@@ -125,6 +237,25 @@ class XlsxJsonConverter:
         # 데이터프레임을 레코드 형식의 JSON으로 변환
         return df.to_dict(orient="records")
     
+    @staticmethod
+    def _frame_from_rows(rows: List[List[Any]], skiprows: int) -> pd.DataFrame:
+        """
+        파싱된 시트 행 목록에서 skiprows 다음 행을 헤더로 하는 DataFrame을 구성
+        pd.read_excel(skiprows=skiprows)와 같은 TextParser 규칙(Unnamed/중복 열 이름, 타입 추론)을 따름
+        
+        Args:
+            rows: 시트의 전체 행 목록 (빈 셀은 빈 문자열)
+            skiprows: 헤더 앞에서 건너뛸 행 수
+            
+        Returns:
+            pd.DataFrame: 구성된 DataFrame (행이 없으면 빈 DataFrame)
+        """
+        if not rows:
+            return pd.DataFrame()
+        
+        parser = TextParser(rows, header=0, skiprows=skiprows, skip_blank_lines=False)
+        return parser.read()
+    
     @staticmethod
     def clean_sheet_data(df: pd.DataFrame, sheet_name: str) -> pd.DataFrame:
         """
@@ -166,55 +297,76 @@ class XlsxJsonConverter:
         """
         date_row_index = None
         
-        # 날짜 패턴 정규식
-        date_pattern = re.compile(r'(\d{4})[-./년]?\s*(\d{1,2})[-./월]?\s*(\d{1,2}일?)?')
-        
-        # 각 행을 탐색하여 날짜가 있는 행 찾기
-        for idx, row in df.iterrows():
-            # 첫 번째 열(계정과목)은 제외하고 날짜 검사
-            date_values = []
-            has_dates = False
-            
-            for i, value in enumerate(row[1:], 1):
-                if isinstance(value, str) and date_pattern.search(value):
-                    date_values.append((i, value))
-                    has_dates = True
-                elif isinstance(value, datetime):
-                    date_values.append((i, value.strftime('%Y-%m-%d')))
-                    has_dates = True
-            
-            if has_dates and len(date_values) >= 1:
-                date_row_index = idx
-                # 새 컬럼명 생성
-                new_columns = df.columns.tolist()
+        # 첫 번째 열(계정과목)은 제외하고, 열 단위로 날짜 셀 여부를 한 번에 계산
+        region = df.iloc[:, 1:]
+        if df.empty or region.shape[1] == 0:
+            return df, date_row_index
+        
+        date_cells = np.column_stack([
+            XlsxJsonConverter._date_cell_mask(region.iloc[:, i]) for i in range(region.shape[1])
+        ])
+        date_rows = date_cells.any(axis=1)
+        
+        # 날짜가 있는 첫 번째 행 찾기
+        if date_rows.any():
+            row_pos = int(date_rows.argmax())
+            date_row_index = df.index[row_pos]
+            row = region.iloc[row_pos]
+            
+            # 새 컬럼명 생성
+            new_columns = df.columns.tolist()
+            
+            # 날짜 컬럼명 변경
+            for i in np.flatnonzero(date_cells[row_pos]):
+                value = row.iloc[i]
+                date_str = value.strftime('%Y-%m-%d') if isinstance(value, datetime) else value
                 
-                # 날짜 컬럼명 변경
-                for col_idx, date_str in date_values:
-                    # 날짜 값에서 날짜 추출
-                    match = date_pattern.search(date_str)
-                    if match:
-                        year = match.group(1)
-                        month = match.group(2).zfill(2)  # 월을 두 자리로 맞춤
-                        day = match.group(3)
-                        
-                        if day:
-                            # '일' 문자 제거하고 두 자리로 맞춤
-                            day = day.replace('일', '').zfill(2)
-                            date_column = f"{year}-{month}-{day}"
-                        else:
-                            # 일자가 없는 경우 월말로 설정
-                            date_column = f"{year}-{month}-31"
-                    else:
-                        # 날짜 형식이 인식되지 않으면 원래 값 사용
-                        date_column = date_str
+                # 날짜 값에서 날짜 추출
+                match = DATE_PATTERN.search(date_str)
+                if match:
+                    year = match.group(1)
+                    month = match.group(2).zfill(2)  # 월을 두 자리로 맞춤
+                    day = match.group(3)
                     
-                    new_columns[col_idx] = date_column
+                    if day:
+                        # '일' 문자 제거하고 두 자리로 맞춤
+                        day = day.replace('일', '').zfill(2)
+                        date_column = f"{year}-{month}-{day}"
+                    else:
+                        # 일자가 없는 경우 월말로 설정
+                        date_column = f"{year}-{month}-31"
+                else:
+                    # 날짜 형식이 인식되지 않으면 원래 값 사용
+                    date_column = date_str
                 
-                df.columns = new_columns
-                break
+                new_columns[i + 1] = date_column
+            
+            df.columns = new_columns
         
         return df, date_row_index
     
+    @staticmethod
+    def _date_cell_mask(column: pd.Series) -> np.ndarray:
+        """
+        열의 각 셀이 날짜(날짜 패턴을 포함한 문자열 또는 datetime 값)인지 여부를 반환
+        
+        Args:
+            column: 검사할 열
+            
+        Returns:
+            np.ndarray: 셀별 날짜 여부 (bool 배열)
+        """
+        if pd.api.types.is_datetime64_any_dtype(column):
+            return column.notna().to_numpy()
+        if not (pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)):
+            return np.zeros(len(column), dtype=bool)
+        
+        # 문자열 셀만 남겨 정규식 한 번으로 검사 (문자열이 아닌 셀은 None → False)
+        text_cells = column.map(lambda value: value if isinstance(value, str) else None)
+        text_dates = text_cells.str.extract(DATE_PATTERN, expand=True)[0].notna().to_numpy()
+        datetime_cells = column.map(lambda value: isinstance(value, datetime)).to_numpy(dtype=bool)
+        return text_dates | datetime_cells
+    
     @staticmethod
     def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -226,16 +378,19 @@ class XlsxJsonConverter:
         Returns:
             pd.DataFrame: 정리된 DataFrame
         """
-        # 모든 값이 빈 문자열이거나 NaN인 행 제거
-        df = df.dropna(how='all')
+        # 모든 값이 NaN인 행/열을 한 번의 마스크 계산으로 찾음
+        # (행을 먼저 지워도 열 판정은 바뀌지 않으므로 dropna 두 번과 결과가 같음)
+        notna = df.notna()
+        row_mask = notna.any(axis=1).to_numpy()
+        col_mask = notna.any(axis=0).to_numpy()
         
-        # 모든 값이 빈 문자열이거나 NaN인 열 제거
-        df = df.dropna(axis=1, how='all')
+        # 지울 행/열이 있을 때만 한 번에 잘라내고, 없으면 복사하지 않음
+        if not (row_mask.all() and col_mask.all()):
+            df = df.iloc[row_mask, col_mask]
         
-        # 열 이름이 NaN인 경우 col_0, col_1 형식으로 변경
-        df.columns = [f"col_{i}" if pd.isna(col) else col for i, col in enumerate(df.columns)]
-        
-        return df
+        # 열 이름이 NaN인 경우 col_0, col_1 형식으로 변경 (입력 DataFrame은 수정하지 않음)
+        columns = [f"col_{i}" if pd.isna(col) else col for i, col in enumerate(df.columns)]
+        return df.set_axis(columns, axis=1)
     
     @staticmethod
     def extract_tables_from_sheet(df: pd.DataFrame) -> List[Dict[str, Any]]:
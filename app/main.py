@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -6,9 +7,21 @@ from .api.opendart_router import router as opendart_router
 from .api.dsdgen_router import router as dsdgen_router
 from .api.dsd_auto_fetch_router import router as dsd_auto_fetch_router
 from .api.xsldsd_router import router as xsldsd_router
+from .foundation.executor import shutdown_executors
+from .domain.repository.opendart_repository import close_http_client
 
 load_dotenv()
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 종료 시 공용 HTTP 클라이언트와 실행기 정리
+    await close_http_client()
+    shutdown_executors()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS 설정###
 app.add_middleware(